@@ -13,9 +13,13 @@ CREATE TABLE IF NOT EXISTS news_items (
     category TEXT,
     collected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     processed BOOLEAN DEFAULT FALSE,
+    title_lsh_bands BIGINT[],
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- 기존 데이터베이스 업그레이드용 (제목 MinHash LSH 밴드 키, 과거 발송 뉴스와의 중복 검사에 사용)
+ALTER TABLE news_items ADD COLUMN IF NOT EXISTS title_lsh_bands BIGINT[];
+
 -- Create newsletters table
 CREATE TABLE IF NOT EXISTS newsletters (
     id SERIAL PRIMARY KEY,
@@ -53,10 +57,17 @@ CREATE INDEX IF NOT EXISTS idx_news_items_published_at ON news_items(published_a
 CREATE INDEX IF NOT EXISTS idx_news_items_category ON news_items(category);
 CREATE INDEX IF NOT EXISTS idx_news_items_processed ON news_items(processed);
 CREATE INDEX IF NOT EXISTS idx_news_items_collected_at ON news_items(collected_at DESC);
+CREATE INDEX IF NOT EXISTS idx_news_items_title_lsh_bands ON news_items USING GIN (title_lsh_bands);
+-- title_lsh_bands 백필 대상만 담는 부분 인덱스 (백필이 끝나면 거의 비어 있음)
+CREATE INDEX IF NOT EXISTS idx_news_items_missing_title_lsh ON news_items(id) WHERE title_lsh_bands IS NULL;
 CREATE INDEX IF NOT EXISTS idx_newsletters_created_at ON newsletters(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_newsletters_sent_at ON newsletters(sent_at DESC);
+-- 발송 날짜 범위 검사용 부분 인덱스 (아직 발송하지 않은 초안은 담지 않음)
+CREATE INDEX IF NOT EXISTS idx_newsletters_sent ON newsletters(sent_at) WHERE sent_at IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_newsletter_items_newsletter_id ON newsletter_items(newsletter_id);
 CREATE INDEX IF NOT EXISTS idx_newsletter_items_news_item_id ON newsletter_items(news_item_id);
+-- get_today_news의 NOT EXISTS 검사를 테이블 접근 없이 인덱스만으로 처리
+CREATE INDEX IF NOT EXISTS idx_newsletter_items_news_item_newsletter ON newsletter_items(news_item_id, newsletter_id);
 CREATE INDEX IF NOT EXISTS idx_error_logs_created_at ON error_logs(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_error_logs_component ON error_logs(component);
 
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Batch Planner for AI News Digest
+
+배치 요약 요청을 고정 개수 대신 토큰 예산 기준으로 나누는 도구.
+항목별 입력 토큰을 로컬 토크나이저로 세어 입력/출력 예산을 넘지 않는 범위에서
+한 요청에 최대한 많은 기사를 담고, 배치마다 필요한 max_tokens를 계산한다.
+
+tiktoken이 설치되어 있으면 cl100k_base 인코딩(Llama 3 토크나이저와 비슷한 크기)으로 세고,
+없으면 문자 수 기반 추정치(rate_limiter.estimate_tokens)를 사용한다.
+"""
+
+from typing import Dict, List, Optional
+
+from rate_limiter import estimate_tokens
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:   # 미설치 또는 인코딩 파일을 받을 수 없는 환경
+    _encoding = None
+
+
+MAX_ITEM_INPUT_TOKENS = 300      # 기사 하나의 본문 상한 (기존 1000자 절단과 비슷한 분량)
+OUTPUT_TOKENS_PER_ITEM = 600     # 기사 하나의 한국어 요약(4-5문장)에 필요한 출력 토큰 (max_tokens 상한)
+EXPECTED_OUTPUT_TOKENS_PER_ITEM = 300   # 실제로 생성되는 요약의 평균적인 출력 토큰 (제한기 예약용)
+OUTPUT_OVERHEAD_TOKENS = 50      # JSON 응답 구조(summaries, id 키 등)에 쓰이는 토큰
+ITEM_OVERHEAD_TOKENS = 20        # 기사별 JSON 키(id, title, content)와 줄바꿈
+DEFAULT_INPUT_TOKEN_BUDGET = 4000
+DEFAULT_OUTPUT_TOKEN_BUDGET = 4096
+DEFAULT_MAX_BATCH_ITEMS = 10     # 응답 파싱 안정성을 위한 배치당 최대 기사 수
+
+
+def count_tokens(text: str) -> int:
+    """로컬 토크나이저로 토큰 수 계산 (없으면 추정)"""
+    if not text:
+        return 0
+    if _encoding is None:
+        return estimate_tokens(text)
+    return len(_encoding.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int = MAX_ITEM_INPUT_TOKENS) -> str:
+    """최대 토큰 수를 넘는 앞부분만 남기기"""
+    text = text or ''
+    if count_tokens(text) <= max_tokens:
+        return text
+    if _encoding is None:
+        return text[:max_tokens * 4]
+    return _encoding.decode(_encoding.encode(text, disallowed_special=())[:max_tokens])
+
+
+def item_input_tokens(item: Dict, max_item_tokens: int = MAX_ITEM_INPUT_TOKENS) -> int:
+    """배치 프롬프트에서 기사 하나가 차지하는 입력 토큰 수"""
+    title = item.get('title', 'Untitled')
+    content = truncate_to_tokens(item.get('content', ''), max_item_tokens)
+    return count_tokens(title) + count_tokens(content) + ITEM_OVERHEAD_TOKENS
+
+
+def batch_output_tokens(item_count: int) -> int:
+    """배치 응답에 필요한 max_tokens"""
+    return OUTPUT_TOKENS_PER_ITEM * item_count + OUTPUT_OVERHEAD_TOKENS
+
+
+def expected_output_tokens(item_count: int) -> int:
+    """배치 응답의 예상 출력 토큰 (제한기에는 max_tokens 대신 이 값을 예약하고 응답 후 정산)"""
+    return EXPECTED_OUTPUT_TOKENS_PER_ITEM * item_count + OUTPUT_OVERHEAD_TOKENS
+
+
+def plan_batches(items: List[Dict],
+                 input_budget: int = DEFAULT_INPUT_TOKEN_BUDGET,
+                 output_budget: int = DEFAULT_OUTPUT_TOKEN_BUDGET,
+                 max_items: Optional[int] = DEFAULT_MAX_BATCH_ITEMS,
+                 prompt_tokens: int = 0) -> List[List[Dict]]:
+    """입력 순서를 유지하며 토큰 예산 안에 들어가도록 항목을 배치로 묶기
+
+    Args:
+        items: 뉴스 항목 리스트
+        input_budget: 배치 하나의 입력 토큰 상한 (시스템/안내 프롬프트 포함)
+        output_budget: 배치 하나의 출력 토큰 상한 (max_tokens)
+        max_items: 배치당 최대 기사 수 (None이면 예산으로만 제한)
+        prompt_tokens: 기사와 무관하게 매 요청에 들어가는 프롬프트 토큰 수
+
+    Returns:
+        배치 리스트 (예산보다 큰 기사 하나도 단독 배치로 포함)
+    """
+    per_batch_by_output = max(1, (output_budget - OUTPUT_OVERHEAD_TOKENS) // OUTPUT_TOKENS_PER_ITEM)
+    if max_items:
+        per_batch_by_output = min(per_batch_by_output, max_items)
+
+    batches = []
+    current: List[Dict] = []
+    current_tokens = prompt_tokens
+
+    for item in items:
+        tokens = item_input_tokens(item)
+        if current and (current_tokens + tokens > input_budget or len(current) >= per_batch_by_output):
+            batches.append(current)
+            current, current_tokens = [], prompt_tokens
+
+        current.append(item)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+
+    return batches
@@ -29,8 +29,8 @@ def main():
         else:
             raise ValueError("Invalid input format")
 
-        # 배치 처리 (use_batch=True로 배치 모드 사용)
-        result = process_news_items(items, use_batch=True, batch_size=5)
+        # 배치 처리 (use_batch=True로 배치 모드 사용, 배치 크기는 토큰 예산으로 결정)
+        result = process_news_items(items, use_batch=True)
 
         # 결과 출력
         print(json.dumps(result, indent=2, ensure_ascii=False))
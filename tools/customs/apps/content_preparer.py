@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Content Preparer for AI News Digest
+
+수집한 RSS 본문을 요약 요청 전에 정리하고 줄이는 도구.
+HTML 태그, 피드 상투 문구("The post ... appeared first on ...", "Read more" 등),
+arXiv 메타데이터("arXiv:2401.01234v1 Announce Type: new Abstract:")를 제거한 뒤,
+토큰 예산을 넘는 긴 본문은 정보량이 많은 문장만 골라 원래 순서대로 남긴다(추출 압축).
+
+문장 점수는 본문 안 단어 빈도(불용어 제외), 제목 단어와의 겹침, 앞쪽 문장 가산점으로 계산하고
+이미 고른 문장과 거의 같은 문장은 건너뛴다. 결정적이므로 같은 본문은 항상 같은 결과가 나온다.
+"""
+
+import re
+import sys
+import html
+import json
+import math
+from collections import Counter
+from typing import Dict, List
+
+from batch_planner import count_tokens, truncate_to_tokens, MAX_ITEM_INPUT_TOKENS
+
+
+PREPARER_VERSION = "2"                           # 정리/압축 결과가 달라지면 올려서 요약 캐시를 분리
+DEFAULT_CONTENT_TOKENS = MAX_ITEM_INPUT_TOKENS   # 요약 요청에 보낼 기사 본문 상한
+MIN_SENTENCE_WORDS = 4                           # 이보다 짧은 문장은 압축 시 후보에서 제외
+REDUNDANCY_THRESHOLD = 0.6                       # 이미 고른 문장과 단어가 이만큼 겹치면 제외 (Jaccard)
+
+_SCRIPT_STYLE = re.compile(r'<(script|style|noscript)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_BLOCK_TAG = re.compile(r'<\s*(?:br|/p|/div|/li|/h[1-6]|/tr|/blockquote)\b[^>]*>', re.IGNORECASE)
+_TAG = re.compile(r'<[^>]+>')
+_SPACES = re.compile(r'[ \t\r\f\v\u00a0]+')
+
+_ARXIV_HEADER = re.compile(
+    r'^\s*arXiv:\d{4}\.\d{4,5}(?:v\d+)?\s+Announce Type:\s*[\w-]+\s*(?:Abstract:\s*)?', re.IGNORECASE
+)
+_BOILERPLATE = [
+    re.compile(r'The post .{1,300}? appeared first on .{1,200}?(?:\.|$)', re.IGNORECASE),
+    re.compile(r'\[(?:…|\.\.\.|&hellip;)\]'),
+]
+# 줄 전체가 상투 문구(짧은 안내 문구 + 선택적 링크)일 때만 버린다
+_BOILERPLATE_LINE = re.compile(
+    r'^(?:(?:continue reading|read more|read the full (?:story|article|post)|click here|subscribe|sign up|'
+    r'share this(?: article| post| story)?|share on \w+|follow us(?: on \w+)?|comments?|'
+    r'related(?: posts| articles)?|advertisement)\W*(?:https?://\S+)?\W*'
+    r'|originally published (?:at|on|in) (?:https?://)?\S+\W*)$',
+    re.IGNORECASE
+)
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"\'(\[])')
+_WORD = re.compile(r'[a-z0-9]+(?:[-\'][a-z0-9]+)*')
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below
+between both but by can could did do does doing down during each few for from further had has have having
+he her here hers him his how i if in into is it its itself just me more most my no nor not now of off on
+once only or other our ours out over own same she should so some such than that the their theirs them then
+there these they this those through to too under until up very was we were what when where which while who
+whom why will with would you your yours new we're it's
+""".split())
+
+
+def clean_content(content: str) -> str:
+    """HTML, 피드 상투 문구, arXiv 메타데이터를 제거한 본문"""
+    text = _SCRIPT_STYLE.sub(' ', content or '')
+    text = _BLOCK_TAG.sub('\n', text)
+    text = html.unescape(_TAG.sub(' ', text))
+    text = _ARXIV_HEADER.sub('', text)
+
+    lines = []
+    for line in text.split('\n'):
+        line = _SPACES.sub(' ', line).strip()
+        for pattern in _BOILERPLATE:
+            line = pattern.sub('', line).strip()
+        if line and not _BOILERPLATE_LINE.match(line):
+            lines.append(line)
+
+    return '\n'.join(lines)
+
+
+def split_sentences(text: str) -> List[str]:
+    """문장 단위 분리 (줄바꿈도 문장 경계로 취급)"""
+    sentences = []
+    for line in text.split('\n'):
+        sentences.extend(part.strip() for part in _SENTENCE_END.split(line) if part.strip())
+    return sentences
+
+
+def _content_words(text: str) -> List[str]:
+    """불용어를 제외한 소문자 단어 목록"""
+    return [word for word in _WORD.findall(text.lower()) if word not in STOPWORDS]
+
+
+def _jaccard(a: set, b: set) -> float:
+    """두 단어 집합의 Jaccard 유사도"""
+    if not a or not b:
+        return 1.0 if a == b else 0.0
+    return len(a & b) / len(a | b)
+
+
+def compress_content(text: str, max_tokens: int = DEFAULT_CONTENT_TOKENS, title: str = '') -> str:
+    """토큰 예산을 넘는 본문에서 정보량이 많은 문장만 원래 순서대로 남기기"""
+    if count_tokens(text) <= max_tokens:
+        return text
+
+    sentences = split_sentences(text)
+    words = [_content_words(sentence) for sentence in sentences]
+    frequencies = Counter(word for sentence_words in words for word in sentence_words)
+    if not frequencies:
+        return truncate_to_tokens(text, max_tokens)
+
+    top_frequency = max(frequencies.values())
+    title_words = set(_content_words(title))
+
+    scored = []
+    for index, sentence_words in enumerate(words):
+        if len(sentence_words) < MIN_SENTENCE_WORDS and index > 0:
+            continue
+        density = sum(frequencies[word] for word in sentence_words) / top_frequency / math.sqrt(len(sentence_words) or 1)
+        title_overlap = len(title_words.intersection(sentence_words)) / len(title_words) if title_words else 0.0
+        position = 1.0 / (1 + index)
+        scored.append((density + title_overlap + position, index))
+
+    selected = []
+    selected_words = []
+    used_tokens = 0
+    for _, index in sorted(scored, key=lambda entry: (-entry[0], entry[1])):
+        tokens = count_tokens(sentences[index]) + 1
+        if used_tokens + tokens > max_tokens:
+            continue
+        candidate_words = set(words[index])
+        if any(_jaccard(candidate_words, chosen) >= REDUNDANCY_THRESHOLD for chosen in selected_words):
+            continue
+        selected.append(index)
+        selected_words.append(candidate_words)
+        used_tokens += tokens
+
+    if not selected:
+        # 가장 높은 점수의 문장 하나도 예산보다 길면 앞부분만 사용
+        best = min(scored, key=lambda entry: (-entry[0], entry[1])) if scored else None
+        return truncate_to_tokens(sentences[best[1]] if best else text, max_tokens)
+
+    return ' '.join(sentences[index] for index in sorted(selected))
+
+
+def prepare_content(title: str, content: str, max_tokens: int = DEFAULT_CONTENT_TOKENS) -> str:
+    """요약 요청용 본문 (정리 후 예산을 넘으면 추출 압축)"""
+    return compress_content(clean_content(content), max_tokens, title)
+
+
+def prepare_news_items(items: List[Dict], max_tokens: int = DEFAULT_CONTENT_TOKENS) -> Dict[str, any]:
+    """뉴스 항목 본문을 요약 요청용으로 준비 (원본 항목은 바꾸지 않음)
+
+    Returns:
+        items(본문이 준비된 항목 사본)와 준비 전후 토큰 수 통계
+    """
+    prepared_items = []
+    original_tokens = prepared_tokens = changed_count = 0
+
+    for item in items:
+        content = item.get('content', '') or ''
+        prepared = prepare_content(item.get('title', ''), content, max_tokens)
+        before, after = count_tokens(content), count_tokens(prepared)
+        original_tokens += before
+        prepared_tokens += after
+        if prepared != content:
+            changed_count += 1
+
+        prepared_item = item.copy()
+        prepared_item['content'] = prepared
+        prepared_items.append(prepared_item)
+
+    return {
+        "success": True,
+        "items": prepared_items,
+        "preparation_stats": {
+            "changed_items": changed_count,
+            "original_tokens": original_tokens,
+            "prepared_tokens": prepared_tokens,
+            "tokens_saved": original_tokens - prepared_tokens
+        }
+    }
+
+
+def main():
+    """CLI 진입점"""
+    if len(sys.argv) < 2:
+        print("Usage: content_preparer.py <json_file> [max_tokens]")
+        print("  max_tokens - 기사 하나의 본문 토큰 상한 (default: %d)" % DEFAULT_CONTENT_TOKENS)
+        sys.exit(1)
+
+    try:
+        with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        items = data['items'] if isinstance(data, dict) and 'items' in data else data
+        if not isinstance(items, list):
+            raise ValueError("Invalid input format. Expected list or dict with 'items' key.")
+
+        max_tokens = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CONTENT_TOKENS
+        result = prepare_news_items(items, max_tokens)
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+
+    except FileNotFoundError:
+        print(f"Error: File not found: {sys.argv[1]}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,25 +3,245 @@
 Database Client for AI News Digest
 
 PostgreSQL 데이터베이스에 뉴스 항목, 뉴스레터, 에러 로그를 저장하고 조회하는 도구.
+연결은 프로세스 전체에서 공유하는 커넥션 풀(ThreadedConnectionPool)에서 빌려 쓰므로,
+서비스처럼 오래 실행되는 프로세스에서 DatabaseClient를 여러 번 만들어도 매번 새로 접속하지 않는다.
 """
 
 import sys
 import json
 import os
+import time
+import atexit
+import threading
 import yaml
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from contextlib import contextmanager
+from psycopg2.extras import RealDictCursor, execute_batch, execute_values
+from psycopg2.pool import ThreadedConnectionPool, PoolError
 from datetime import datetime, date
-from typing import List, Dict, Optional, Union
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+from dedup_index import title_band_keys, unique_by_url
+
+
+BULK_PAGE_SIZE = 500   # execute_values 한 문장에 담는 최대 행 수
+
+DEFAULT_POOL_MIN_CONNECTIONS = 1
+DEFAULT_POOL_MAX_CONNECTIONS = 10
+DEFAULT_POOL_MAX_LIFETIME = 1800          # 이보다 오래된 연결은 반납 시 닫고 새로 연결 (초)
+DEFAULT_POOL_HEALTH_CHECK_INTERVAL = 30   # 이보다 오래 쉬었던 연결은 빌려줄 때 SELECT 1로 확인 (초)
+DEFAULT_POOL_TIMEOUT = 30                 # 빈 연결이 없을 때 기다리는 최대 시간 (초)
+
+
+class _TimedConnectionPool(ThreadedConnectionPool):
+    """새 연결을 만든 시각을 기록하는 ThreadedConnectionPool"""
+
+    def __init__(self, *args, **kwargs):
+        self.created_at: Dict[int, float] = {}
+        super().__init__(*args, **kwargs)
+
+    def _connect(self, key=None):
+        connection = super()._connect(key)
+        self.created_at[id(connection)] = time.monotonic()
+        return connection
+
+
+class ConnectionPool:
+    """상태 확인과 최대 수명 재연결을 더한 ThreadedConnectionPool
+
+    ThreadedConnectionPool은 연결이 모두 사용 중이면 바로 PoolError를 내므로,
+    세마포어로 최대 timeout초까지 반납을 기다린 뒤 빌려준다.
+    """
+
+    def __init__(self, config: Dict, min_connections: int = DEFAULT_POOL_MIN_CONNECTIONS,
+                 max_connections: int = DEFAULT_POOL_MAX_CONNECTIONS,
+                 max_lifetime: float = DEFAULT_POOL_MAX_LIFETIME,
+                 health_check_interval: float = DEFAULT_POOL_HEALTH_CHECK_INTERVAL,
+                 timeout: float = DEFAULT_POOL_TIMEOUT):
+        """
+        Args:
+            config: db.yaml 설정 (host, port, database, user, password)
+            min_connections: 미리 열어 둘 연결 수
+            max_connections: 최대 연결 수
+            max_lifetime: 연결 최대 수명 (초, 0이면 제한 없음)
+            health_check_interval: 이 시간 이상 쉬었던 연결은 빌려줄 때 상태 확인 (초)
+            timeout: 빈 연결을 기다리는 최대 시간 (초)
+        """
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._returned_at: Dict[int, float] = {}
+        self._pool = _TimedConnectionPool(
+            min_connections, max_connections,
+            host=config['host'],
+            port=config['port'],
+            database=config['database'],
+            user=config['user'],
+            password=config.get('password', ''),
+            cursor_factory=RealDictCursor
+        )
+
+    def _is_expired(self, connection) -> bool:
+        """최대 수명을 넘긴 연결인지 확인"""
+        created_at = self._pool.created_at.get(id(connection))
+        if not self.max_lifetime or created_at is None:
+            return False
+        return time.monotonic() - created_at > self.max_lifetime
+
+    def _is_healthy(self, connection) -> bool:
+        """닫혔거나 서버와 끊긴 연결이 아닌지 확인 (오래 쉬었던 연결만 SELECT 1 실행)"""
+        if connection.closed:
+            return False
+
+        with self._lock:
+            returned_at = self._returned_at.get(id(connection))
+        if returned_at is None or time.monotonic() - returned_at < self.health_check_interval:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def _discard(self, connection):
+        """연결을 닫고 풀에서 제거"""
+        with self._lock:
+            self._returned_at.pop(id(connection), None)
+        self._pool.putconn(connection, close=True)
+        self._pool.created_at.pop(id(connection), None)
+
+    def getconn(self):
+        """사용 가능한 연결 빌리기 (만료/끊긴 연결은 새 연결로 교체)"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise PoolError(f"connection pool exhausted (waited {self.timeout}s)")
+
+        try:
+            while True:
+                connection = self._pool.getconn()
+                if not self._is_expired(connection) and self._is_healthy(connection):
+                    return connection
+                self._discard(connection)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, connection):
+        """연결 반납 (진행 중인 트랜잭션은 풀이 롤백, 만료/끊긴 연결은 닫음)"""
+        try:
+            if connection.closed or self._is_expired(connection):
+                self._discard(connection)
+            else:
+                with self._lock:
+                    self._returned_at[id(connection)] = time.monotonic()
+                self._pool.putconn(connection)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """with 블록 동안 연결을 빌리고 끝나면 반납"""
+        connection = self.getconn()
+        try:
+            yield connection
+        finally:
+            self.putconn(connection)
+
+    def closeall(self):
+        """풀의 모든 연결 닫기"""
+        if not self._pool.closed:
+            self._pool.closeall()
+
+
+_pools: Dict[Tuple, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_connection_pool(config: Dict) -> ConnectionPool:
+    """접속 대상별로 프로세스 전체에서 공유하는 커넥션 풀 반환"""
+    key = (config['host'], config['port'], config['database'], config['user'])
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = ConnectionPool(
+                config,
+                min_connections=config.get('pool_min_connections', DEFAULT_POOL_MIN_CONNECTIONS),
+                max_connections=config.get('pool_max_connections', DEFAULT_POOL_MAX_CONNECTIONS),
+                max_lifetime=config.get('pool_max_lifetime', DEFAULT_POOL_MAX_LIFETIME),
+                health_check_interval=config.get('pool_health_check_interval', DEFAULT_POOL_HEALTH_CHECK_INTERVAL),
+                timeout=config.get('pool_timeout', DEFAULT_POOL_TIMEOUT)
+            )
+        return _pools[key]
+
+
+@atexit.register
+def close_connection_pools():
+    """모든 커넥션 풀 닫기 (프로세스 종료 시 자동 호출)"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
+
+# 읽기 쿼리 (explain_read_queries에서 실행 계획을 점검하므로 모듈 상수로 둔다)
+# 날짜 비교는 DATE(컬럼) 대신 범위 조건으로 써서 collected_at/sent_at 인덱스를 사용한다.
+TODAY_NEWS_QUERY = """
+SELECT n.id, n.title, n.category, n.source, n.url,
+       n.published_at, n.summary, n.summary_ko
+FROM news_items n
+WHERE n.collected_at >= CURRENT_DATE
+  AND n.collected_at < CURRENT_DATE + INTERVAL '1 day'
+  AND NOT EXISTS (
+      SELECT 1 FROM newsletter_items ni
+      JOIN newsletters nl ON ni.newsletter_id = nl.id
+      WHERE ni.news_item_id = n.id
+        AND nl.sent_at >= CURRENT_DATE
+        AND nl.sent_at < CURRENT_DATE + INTERVAL '1 day'
+  )
+ORDER BY n.published_at DESC;
+"""
+
+RECENT_NEWSLETTERS_QUERY = """
+SELECT id, issue_date, sent_at, recipient_count
+FROM newsletters
+ORDER BY sent_at DESC
+LIMIT %s;
+"""
+
+SENT_SIMILAR_TITLES_QUERY = """
+SELECT n.id, n.title, n.url, n.title_lsh_bands, MAX(nl.sent_at) AS sent_at
+FROM news_items n
+JOIN newsletter_items ni ON ni.news_item_id = n.id
+JOIN newsletters nl ON nl.id = ni.newsletter_id
+WHERE n.title_lsh_bands && %s::BIGINT[]
+  AND nl.sent_at >= NOW() - %s * INTERVAL '1 day'
+GROUP BY n.id, n.title, n.url, n.title_lsh_bands;
+"""
+
+MISSING_TITLE_SIGNATURES_QUERY = """
+SELECT id, title FROM news_items
+WHERE title_lsh_bands IS NULL
+ORDER BY id
+LIMIT %s;
+"""
 
 
 class DatabaseClient:
     """PostgreSQL 데이터베이스 클라이언트"""
 
-    def __init__(self, config_path: str = ".dmap/config/db.yaml"):
-        """데이터베이스 클라이언트 초기화"""
+    def __init__(self, config_path: str = ".dmap/config/db.yaml", pooled: Optional[bool] = None):
+        """데이터베이스 클라이언트 초기화
+
+        Args:
+            config_path: db.yaml 경로
+            pooled: 공유 커넥션 풀 사용 여부 (None이면 db.yaml의 pool 값, 기본 True)
+        """
         self.config = self.load_db_config(config_path)
+        self.pooled = self.config.get('pool', True) if pooled is None else pooled
         self.connection = None
+        self._pool: Optional[ConnectionPool] = None
 
     def load_db_config(self, config_path: str) -> Dict[str, str]:
         """데이터베이스 설정을 YAML 파일에서 로드"""
@@ -43,8 +263,16 @@ class DatabaseClient:
             sys.exit(1)
 
     def connect(self) -> bool:
-        """데이터베이스 연결"""
+        """데이터베이스 연결 (풀 사용 시 공유 풀에서 연결을 빌림)"""
+        if self.connection:
+            return True
+
         try:
+            if self.pooled:
+                self._pool = get_connection_pool(self.config)
+                self.connection = self._pool.getconn()
+                return True
+
             self.connection = psycopg2.connect(
                 host=self.config['host'],
                 port=self.config['port'],
@@ -54,16 +282,37 @@ class DatabaseClient:
                 cursor_factory=RealDictCursor
             )
             return True
-        except psycopg2.Error as e:
+        except (psycopg2.Error, PoolError) as e:
             print(f"Database connection failed: {e}", file=sys.stderr)
             return False
 
     def disconnect(self):
-        """데이터베이스 연결 해제"""
+        """데이터베이스 연결 해제 (풀에서 빌린 연결은 닫지 않고 반납)"""
         if self.connection:
-            self.connection.close()
+            if self._pool is not None:
+                self._pool.putconn(self.connection)
+                self._pool = None
+            else:
+                self.connection.close()
             self.connection = None
 
+    @contextmanager
+    def checkout(self) -> Iterator['DatabaseClient']:
+        """with 블록 동안 연결을 빌려 이 클라이언트의 메서드가 사용하게 하고 끝나면 반납
+
+        이미 연결되어 있으면 그 연결을 그대로 사용하고 반납하지 않는다.
+        """
+        if self.connection:
+            yield self
+            return
+
+        if not self.connect():
+            raise PoolError("Database connection failed")
+        try:
+            yield self
+        finally:
+            self.disconnect()
+
     def execute_query(self, query: str, params: Optional[tuple] = None, fetch: str = "none") -> Dict[str, any]:
         """쿼리 실행"""
         if not self.connection:
@@ -83,8 +332,8 @@ class DatabaseClient:
                 else:
                     result = None
 
-                # INSERT/UPDATE/DELETE는 자동 커밋
-                if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE')):
+                # INSERT/UPDATE/DELETE(데이터 변경 CTE 포함)는 자동 커밋
+                if query.strip().upper().startswith(('INSERT', 'UPDATE', 'DELETE', 'WITH')):
                     self.connection.commit()
 
                 return {
@@ -94,7 +343,41 @@ class DatabaseClient:
                 }
 
         except psycopg2.Error as e:
-            if self.connection:
+            if self.connection and not self.connection.closed:
+                self.connection.rollback()
+            return {
+                "success": False,
+                "error": str(e),
+                "error_code": e.pgcode if hasattr(e, 'pgcode') else None
+            }
+
+    def execute_values_query(self, query: str, rows: List[tuple], page_size: int = BULK_PAGE_SIZE,
+                             fetch: bool = True) -> Dict[str, any]:
+        """여러 행을 VALUES %s 다중 행 문장으로 실행하고 한 트랜잭션으로 커밋
+
+        page_size 행마다 한 문장을 보내므로 행 수만큼 왕복/커밋하지 않는다.
+        fetch가 True이면 모든 문장의 RETURNING 결과를 합쳐 반환한다.
+        """
+        if not rows:
+            return {"success": True, "result": [] if fetch else None, "rowcount": 0}
+
+        if not self.connection:
+            if not self.connect():
+                return {"success": False, "error": "Database connection failed"}
+
+        try:
+            with self.connection.cursor() as cursor:
+                result = execute_values(cursor, query, rows, page_size=page_size, fetch=fetch)
+            self.connection.commit()
+
+            return {
+                "success": True,
+                "result": result if fetch else None,
+                "rowcount": len(rows)
+            }
+
+        except psycopg2.Error as e:
+            if self.connection and not self.connection.closed:
                 self.connection.rollback()
             return {
                 "success": False,
@@ -103,93 +386,89 @@ class DatabaseClient:
             }
 
     def insert_news_items(self, items: List[Dict]) -> Dict[str, any]:
-        """뉴스 항목들을 news_items 테이블에 저장"""
+        """뉴스 항목들을 news_items 테이블에 저장
+
+        항목별 INSERT 대신 execute_values 다중 행 upsert 한 트랜잭션으로 저장한다.
+        """
         if not items:
             return {"success": True, "inserted": 0, "skipped_duplicates": 0, "inserted_ids": []}
 
         insert_query = """
-        INSERT INTO news_items (title, category, source, url, published_at, summary, summary_ko)
-        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        INSERT INTO news_items (title, category, source, url, published_at, summary, summary_ko, title_lsh_bands)
+        VALUES %s
         ON CONFLICT (url) DO UPDATE SET
             summary_ko = EXCLUDED.summary_ko,
+            title_lsh_bands = EXCLUDED.title_lsh_bands,
             updated_at = CURRENT_TIMESTAMP
-        WHERE news_items.summary_ko LIKE '[요약 불가%'
+        WHERE news_items.summary_ko LIKE '[요약 불가%%'
         RETURNING id;
         """
 
-        inserted_ids = []
-        inserted_count = 0
-        duplicate_count = 0
-
-        try:
-            if not self.connection:
-                if not self.connect():
-                    return {"success": False, "error": "Database connection failed"}
-
-            with self.connection.cursor() as cursor:
-                for item in items:
-                    try:
-                        # 날짜 파싱 (ISO 형식 문자열을 datetime으로 변환)
-                        if isinstance(item['published_at'], str):
-                            published_at = datetime.fromisoformat(item['published_at'].replace('Z', '+00:00'))
-                        else:
-                            published_at = item['published_at']
-
-                        cursor.execute(insert_query, (
-                            item['title'],
-                            item['category'],
-                            item['source'],
-                            item['url'],
-                            published_at,
-                            item.get('content', ''),
-                            item.get('summary_ko', '')
-                        ))
-
-                        if cursor.rowcount > 0:
-                            result = cursor.fetchone()
-                            if result:
-                                inserted_ids.append(result['id'])
-                                inserted_count += 1
-                        else:
-                            duplicate_count += 1
-
-                    except Exception as item_error:
-                        print(f"Error inserting item {item.get('title', 'Unknown')}: {item_error}", file=sys.stderr)
-                        duplicate_count += 1
-                        continue
-
-                self.connection.commit()
-
-                return {
-                    "success": True,
-                    "operation": "insert_news_items",
-                    "total_items": len(items),
-                    "inserted": inserted_count,
-                    "skipped_duplicates": duplicate_count,
-                    "inserted_ids": inserted_ids
-                }
-
-        except Exception as e:
-            if self.connection:
-                self.connection.rollback()
+        rows = []
+        # 추적 파라미터만 다른 같은 기사는 처음 항목만 저장
+        unique_items, skipped_count = unique_by_url(items)
+        for item in unique_items:
+            try:
+                # 날짜 파싱 (ISO 형식 문자열을 datetime으로 변환)
+                if isinstance(item['published_at'], str):
+                    published_at = datetime.fromisoformat(item['published_at'].replace('Z', '+00:00'))
+                else:
+                    published_at = item['published_at']
+
+                rows.append((
+                    item['title'],
+                    item['category'],
+                    item['source'],
+                    item['url'],
+                    published_at,
+                    item.get('content', ''),
+                    item.get('summary_ko', ''),
+                    title_band_keys(item['title'])
+                ))
+
+            except Exception as item_error:
+                print(f"Error inserting item {item.get('title', 'Unknown')}: {item_error}", file=sys.stderr)
+                skipped_count += 1
+
+        result = self.execute_values_query(insert_query, rows)
+        if not result["success"]:
             return {
                 "success": False,
                 "operation": "insert_news_items",
-                "error": str(e)
+                "error": result.get("error", "Unknown error")
             }
 
+        inserted_ids = [row['id'] for row in result["result"]]
+        return {
+            "success": True,
+            "operation": "insert_news_items",
+            "total_items": len(items),
+            "inserted": len(inserted_ids),
+            "skipped_duplicates": skipped_count + len(rows) - len(inserted_ids),
+            "inserted_ids": inserted_ids
+        }
+
     def insert_newsletter(self, content: str, recipient_count: int, news_item_ids: List[int] = None) -> Dict[str, any]:
-        """뉴스레터 발행 기록을 newsletters 테이블에 저장하고 뉴스 항목 연결"""
-        insert_query = """
-        INSERT INTO newsletters (subject, html_content, sent_at, recipient_count, status)
-        VALUES (%s, %s, %s, %s, %s)
-        RETURNING id;
-        """
+        """뉴스레터 발행 기록을 newsletters 테이블에 저장하고 뉴스 항목 연결
 
-        link_query = """
-        INSERT INTO newsletter_items (newsletter_id, news_item_id)
-        VALUES (%s, %s)
-        ON CONFLICT (newsletter_id, news_item_id) DO NOTHING;
+        발행 기록과 뉴스 항목 연결을 데이터 변경 CTE 한 문장으로 실행하므로
+        한 번의 왕복, 한 트랜잭션으로 함께 저장되거나 함께 실패한다.
+        news_items에 없는 id는 연결하지 않는다.
+        """
+        insert_query = """
+        WITH newsletter AS (
+            INSERT INTO newsletters (subject, html_content, sent_at, recipient_count, status)
+            VALUES (%s, %s, %s, %s, %s)
+            RETURNING id
+        ), linked AS (
+            INSERT INTO newsletter_items (newsletter_id, news_item_id)
+            SELECT newsletter.id, n.id
+            FROM newsletter, news_items n
+            WHERE n.id = ANY(%s::INT[])
+            ON CONFLICT (newsletter_id, news_item_id) DO NOTHING
+            RETURNING news_item_id
+        )
+        SELECT (SELECT id FROM newsletter) AS id, (SELECT COUNT(*) FROM linked) AS linked_count;
         """
 
         try:
@@ -198,27 +477,18 @@ class DatabaseClient:
                 content,
                 datetime.now(),
                 recipient_count,
-                'sent'
+                'sent',
+                list(set(news_item_ids or []))
             ), fetch="one")
 
             if result["success"] and result["result"]:
-                newsletter_id = result["result"]["id"]
-
-                # 뉴스 항목 연결
-                linked_count = 0
-                if news_item_ids:
-                    for item_id in news_item_ids:
-                        link_result = self.execute_query(link_query, (newsletter_id, item_id))
-                        if link_result["success"]:
-                            linked_count += 1
-
                 return {
                     "success": True,
                     "operation": "insert_newsletter",
-                    "newsletter_id": newsletter_id,
+                    "newsletter_id": result["result"]["id"],
                     "issue_date": str(date.today()),
                     "recipient_count": recipient_count,
-                    "linked_news_items": linked_count
+                    "linked_news_items": result["result"]["linked_count"]
                 }
             else:
                 return {
@@ -276,23 +546,8 @@ class DatabaseClient:
 
     def get_today_news(self) -> Dict[str, any]:
         """오늘 수집된 뉴스 중 아직 발송되지 않은 목록 조회"""
-        query = """
-        SELECT DISTINCT n.id, n.title, n.category, n.source, n.url,
-               n.published_at, n.summary, n.summary_ko
-        FROM news_items n
-        WHERE DATE(n.collected_at) = CURRENT_DATE
-          AND NOT EXISTS (
-              SELECT 1 FROM newsletter_items ni
-              JOIN newsletters nl ON ni.newsletter_id = nl.id
-              WHERE ni.news_item_id = n.id
-                AND nl.sent_at IS NOT NULL
-                AND DATE(nl.sent_at) = CURRENT_DATE
-          )
-        ORDER BY n.published_at DESC;
-        """
-
         try:
-            result = self.execute_query(query, fetch="all")
+            result = self.execute_query(TODAY_NEWS_QUERY, fetch="all")
 
             if result["success"]:
                 return {
@@ -317,15 +572,8 @@ class DatabaseClient:
 
     def get_recent_newsletters(self, limit: int = 5) -> Dict[str, any]:
         """최근 뉴스레터 발행 기록 조회"""
-        query = """
-        SELECT id, issue_date, sent_at, recipient_count
-        FROM newsletters
-        ORDER BY sent_at DESC
-        LIMIT %s;
-        """
-
         try:
-            result = self.execute_query(query, (limit,), fetch="all")
+            result = self.execute_query(RECENT_NEWSLETTERS_QUERY, (limit,), fetch="all")
 
             if result["success"]:
                 return {
@@ -348,6 +596,128 @@ class DatabaseClient:
                 "error": str(e)
             }
 
+    def find_sent_similar_titles(self, band_keys: List[int], days: int = 7) -> Dict[str, any]:
+        """최근 N일 동안 발송된 뉴스 중 제목 밴드 키가 하나라도 겹치는 항목 조회
+
+        현재 배치 전체의 밴드 키를 한 번에 전달하면 GIN 인덱스(&& 연산자)로
+        후보를 찾으므로, 항목 수와 무관하게 쿼리 한 번으로 끝난다.
+        """
+        if not band_keys:
+            return {"success": True, "operation": "find_sent_similar_titles", "count": 0, "news_items": []}
+
+        try:
+            result = self.execute_query(SENT_SIMILAR_TITLES_QUERY, (list(set(band_keys)), days), fetch="all")
+
+            if result["success"]:
+                return {
+                    "success": True,
+                    "operation": "find_sent_similar_titles",
+                    "count": len(result["result"]) if result["result"] else 0,
+                    "news_items": result["result"] or []
+                }
+            else:
+                return {
+                    "success": False,
+                    "operation": "find_sent_similar_titles",
+                    "error": result.get("error", "Query failed")
+                }
+
+        except Exception as e:
+            return {
+                "success": False,
+                "operation": "find_sent_similar_titles",
+                "error": str(e)
+            }
+
+    def backfill_title_signatures(self, batch_size: int = 500) -> Dict[str, any]:
+        """title_lsh_bands가 비어 있는 기존 뉴스 항목의 제목 서명 계산"""
+        update_query = "UPDATE news_items SET title_lsh_bands = %s WHERE id = %s"
+
+        updated = 0
+        try:
+            while True:
+                result = self.execute_query(MISSING_TITLE_SIGNATURES_QUERY, (batch_size,), fetch="all")
+                if not result["success"]:
+                    return {
+                        "success": False,
+                        "operation": "backfill_title_signatures",
+                        "updated": updated,
+                        "error": result.get("error", "Query failed")
+                    }
+
+                rows = result["result"] or []
+                if not rows:
+                    break
+
+                # 빈 제목도 다시 조회되지 않도록 빈 배열로 기록
+                with self.connection.cursor() as cursor:
+                    execute_batch(cursor, update_query, [
+                        (title_band_keys(row['title']), row['id']) for row in rows
+                    ])
+                self.connection.commit()
+                updated += len(rows)
+
+            return {
+                "success": True,
+                "operation": "backfill_title_signatures",
+                "updated": updated
+            }
+
+        except Exception as e:
+            if self.connection and not self.connection.closed:
+                self.connection.rollback()
+            return {
+                "success": False,
+                "operation": "backfill_title_signatures",
+                "updated": updated,
+                "error": str(e)
+            }
+
+    def explain_read_queries(self) -> Dict[str, any]:
+        """읽기 쿼리가 기대한 인덱스로 실행되는지 실행 계획으로 점검
+
+        enable_seqscan을 끄면 DATE(collected_at) = ... 같은 조건도 아무 인덱스 전체 스캔 + Filter로
+        바뀔 뿐 Seq Scan이 사라지므로, 쿼리마다 날짜 컬럼이 Index Cond(비트맵이면 Recheck Cond 포함)로
+        처리되는지, 기대한 인덱스를 쓰는지 확인하고 해당 컬럼이 Filter에 남으면 실패로 본다.
+        """
+        # 쿼리 이름 -> (쿼리, 파라미터, Index Cond로 처리돼야 하는 컬럼, 사용해야 하는 인덱스)
+        checks = {
+            "get_today_news": (TODAY_NEWS_QUERY, None, ("collected_at", "sent_at"), ()),
+            "get_recent_newsletters": (RECENT_NEWSLETTERS_QUERY, (5,), (), ("idx_newsletters_sent_at",)),
+            "find_sent_similar_titles": (SENT_SIMILAR_TITLES_QUERY, ([0], 7), ("title_lsh_bands",), ()),
+            "backfill_title_signatures": (MISSING_TITLE_SIGNATURES_QUERY, (500,), (),
+                                          ("idx_news_items_missing_title_lsh",))
+        }
+
+        if not self.connection:
+            if not self.connect():
+                return {"success": False, "operation": "explain_read_queries", "error": "Database connection failed"}
+
+        queries = {}
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                for name, (query, params, index_columns, indexes) in checks.items():
+                    cursor.execute("EXPLAIN (FORMAT JSON) " + query, params)
+                    plan = cursor.fetchone()["QUERY PLAN"][0]["Plan"]
+                    queries[name] = check_query_plan(plan, index_columns, indexes)
+            self.connection.rollback()
+
+            return {
+                "success": all(plan["success"] for plan in queries.values()),
+                "operation": "explain_read_queries",
+                "queries": queries
+            }
+
+        except psycopg2.Error as e:
+            if self.connection and not self.connection.closed:
+                self.connection.rollback()
+            return {
+                "success": False,
+                "operation": "explain_read_queries",
+                "error": str(e)
+            }
+
     def __enter__(self):
         """컨텍스트 매니저 진입"""
         self.connect()
@@ -358,6 +728,39 @@ class DatabaseClient:
         self.disconnect()
 
 
+def _plan_nodes(plan: Dict) -> Iterator[Dict]:
+    """EXPLAIN (FORMAT JSON) 실행 계획의 모든 노드"""
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def check_query_plan(plan: Dict, index_columns: Tuple[str, ...] = (),
+                     indexes: Tuple[str, ...] = ()) -> Dict[str, any]:
+    """EXPLAIN (FORMAT JSON) 실행 계획이 인덱스 조건을 제대로 쓰는지 점검
+
+    Args:
+        plan: 실행 계획의 최상위 Plan 노드
+        index_columns: Index Cond(또는 비트맵 Recheck Cond)에 나와야 하고 Filter에는 없어야 하는 컬럼
+        indexes: 계획에 나와야 하는 인덱스 이름
+    """
+    nodes = list(_plan_nodes(plan))
+    conditions = " ".join(node.get(key, "") for node in nodes for key in ("Index Cond", "Recheck Cond"))
+    filters = " ".join(node.get("Filter", "") for node in nodes)
+    used_indexes = sorted({node["Index Name"] for node in nodes if "Index Name" in node})
+
+    result = {
+        "seq_scans": sorted({node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"}),
+        "indexes": used_indexes,
+        "missing_index_conds": [column for column in index_columns if column not in conditions],
+        "missing_indexes": [index for index in indexes if index not in used_indexes],
+        "filtered_columns": [column for column in index_columns if column in filters]
+    }
+    result["success"] = not any(result[key] for key in
+                                ("seq_scans", "missing_index_conds", "missing_indexes", "filtered_columns"))
+    return result
+
+
 def create_database_schema() -> Dict[str, any]:
     """데이터베이스 스키마 생성 (setup용)"""
     schema_queries = [
@@ -372,16 +775,29 @@ def create_database_schema() -> Dict[str, any]:
             original_content TEXT,
             summary_ko TEXT,
             collected_at TIMESTAMP DEFAULT NOW(),
-            is_duplicate BOOLEAN DEFAULT FALSE
+            is_duplicate BOOLEAN DEFAULT FALSE,
+            title_lsh_bands BIGINT[]
         );
         """,
         """
+        ALTER TABLE news_items ADD COLUMN IF NOT EXISTS title_lsh_bands BIGINT[];
+        """,
+        """
         CREATE INDEX IF NOT EXISTS idx_news_items_url ON news_items (url);
         """,
         """
+        CREATE INDEX IF NOT EXISTS idx_news_items_title_lsh_bands ON news_items USING GIN (title_lsh_bands);
+        """,
+        """
         CREATE INDEX IF NOT EXISTS idx_news_items_published_at ON news_items (published_at);
         """,
         """
+        CREATE INDEX IF NOT EXISTS idx_news_items_collected_at ON news_items (collected_at DESC);
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_news_items_missing_title_lsh ON news_items (id) WHERE title_lsh_bands IS NULL;
+        """,
+        """
         CREATE TABLE IF NOT EXISTS newsletters (
             id SERIAL PRIMARY KEY,
             issue_date DATE NOT NULL,
@@ -391,6 +807,24 @@ def create_database_schema() -> Dict[str, any]:
         );
         """,
         """
+        CREATE INDEX IF NOT EXISTS idx_newsletters_sent_at ON newsletters (sent_at DESC);
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_newsletters_sent ON newsletters (sent_at) WHERE sent_at IS NOT NULL;
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS newsletter_items (
+            id SERIAL PRIMARY KEY,
+            newsletter_id INTEGER NOT NULL REFERENCES newsletters(id) ON DELETE CASCADE,
+            news_item_id INTEGER NOT NULL REFERENCES news_items(id) ON DELETE CASCADE,
+            created_at TIMESTAMP DEFAULT NOW(),
+            UNIQUE(newsletter_id, news_item_id)
+        );
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS idx_newsletter_items_news_item_newsletter ON newsletter_items (news_item_id, newsletter_id);
+        """,
+        """
         CREATE TABLE IF NOT EXISTS error_logs (
             id SERIAL PRIMARY KEY,
             error_type VARCHAR(50) NOT NULL,
@@ -447,6 +881,8 @@ def main():
         print("  db_client.py insert-error <type> <message>    - Insert error log")
         print("  db_client.py get-today-news                   - Get today's news")
         print("  db_client.py get-recent-newsletters [limit]   - Get recent newsletters")
+        print("  db_client.py backfill-title-signatures        - Compute title signatures for old items")
+        print("  db_client.py explain-read-queries             - Check that read queries use indexes")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -514,6 +950,16 @@ def main():
                 result = client.get_recent_newsletters(limit)
                 print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
 
+        elif command == "backfill-title-signatures":
+            with DatabaseClient() as client:
+                result = client.backfill_title_signatures()
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+
+        elif command == "explain-read-queries":
+            with DatabaseClient() as client:
+                result = client.explain_read_queries()
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+
         else:
             print(f"Unknown command: {command}")
             sys.exit(1)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Dedup Candidate Index for AI News Digest
+
+정규화된 제목 목록에서 유사도 임계값을 넘을 가능성이 있는 후보 쌍만 골라내는 도구.
+모든 쌍을 비교하는 대신 문자 3-gram MinHash 서명을 밴드로 나눈 LSH 버킷으로 후보를 만들고,
+정확한 유사도 계산(fuzz.ratio)은 후보 쌍에 대해서만 수행하도록 한다.
+
+기본 설정(16 밴드 x 2 행)에서 3-gram Jaccard가 J인 쌍이 후보에 포함될 확률은 1-(1-J^2)^16으로,
+J=0.4에서 약 94%, J=0.5에서 약 99%, J=0.6에서 약 99.9%이다. 뉴스 제목에 단어 추가/삭제/순서 변경/오타를
+한두 번 준 변형 중 fuzz.ratio 85 이상인 쌍은 J가 0.6 이상이었으므로 중복 후보 누락은 드물지만,
+J가 0.4 안팎인 쌍이라면 6% 정도 놓칠 수 있다. 서명은 crc32와 고정 시드를 사용하므로
+실행 간에 결과가 같다. 밴드 키(band_keys)는 news_items.title_lsh_bands에 저장되어
+과거에 발송된 뉴스와의 중복 검사(배열 겹침 검색)에도 사용된다.
+
+정확히 같은 기사를 유사도 계산 전에 걸러내기 위한 URL 정규화(canonicalize_url)와
+본문 지문(content_fingerprint)도 제공한다.
+"""
+
+import re
+import html
+import random
+import zlib
+import hashlib
+import urllib.parse
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+
+SHINGLE_SIZE = 3
+NUM_BANDS = 16
+ROWS_PER_BAND = 2
+HASH_SEED = 20240115
+_HASH_MASK = (1 << 32) - 1
+
+# URL 정규화 시 제거할 추적용 쿼리 파라미터 (utm_*는 접두사로 제거)
+# ref, source처럼 실제 콘텐츠를 가리키기도 하는 일반적인 이름은 넣지 않는다.
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', '_hsenc', '_hsmi', 'ref_src'
+}
+MIN_FINGERPRINT_LENGTH = 80   # 이보다 짧은 본문은 지문을 만들지 않음 (요약 없는 피드의 오탐 방지)
+
+
+def normalize_title(title: str) -> str:
+    """제목 정규화 (비교용)"""
+    # 소문자 변환
+    title = title.lower()
+
+    # 특수 문자 제거 (알파벳, 숫자, 공백만 유지)
+    title = re.sub(r'[^a-zA-Z0-9가-힣\s]', ' ', title)
+
+    # 연속된 공백을 하나로 축약
+    title = re.sub(r'\s+', ' ', title)
+
+    # 앞뒤 공백 제거
+    title = title.strip()
+
+    return title
+
+
+def canonicalize_url(url: str) -> str:
+    """비교용 URL 정규화 (http/https, www, 추적 파라미터, 프래그먼트, 끝 슬래시 무시)
+
+    포트가 잘못된 URL 등 해석할 수 없는 URL은 앞뒤 공백만 제거하여 그대로 반환한다.
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+
+    try:
+        parts = urllib.parse.urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    host = (parts.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host = f"{host}:{port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+
+    return urllib.parse.urlunsplit((
+        'https', host, parts.path.rstrip('/'), urllib.parse.urlencode(query), ''
+    ))
+
+
+def unique_by_url(items: List[Dict]) -> Tuple[List[Dict], int]:
+    """정규화 URL이 같은 항목은 처음 것만 남긴 목록과 건너뛴 항목 수
+
+    한 upsert 문장 안에서 같은 행을 두 번 갱신할 수 없으므로 DB 저장 전에 사용한다.
+    url이 없는 항목은 호출 측 오류 처리에 맡기도록 그대로 둔다.
+    """
+    unique_items = []
+    seen_urls = set()
+    for item in items:
+        url = item.get('url')
+        if url is not None:
+            canonical_url = canonicalize_url(url)
+            if canonical_url in seen_urls:
+                continue
+            seen_urls.add(canonical_url)
+        unique_items.append(item)
+    return unique_items, len(items) - len(unique_items)
+
+
+def content_fingerprint(content: str) -> Optional[str]:
+    """HTML 태그와 공백 차이를 무시한 본문 해시 (본문이 짧으면 None)"""
+    text = html.unescape(re.sub(r'<[^>]+>', ' ', content or ''))
+    text = re.sub(r'\s+', ' ', text).strip().lower()
+    if len(text) < MIN_FINGERPRINT_LENGTH:
+        return None
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> Set[str]:
+    """앞뒤 공백을 붙인 문자 n-gram 집합 (짧은 단어 경계도 반영)"""
+    padded = f" {text} "
+    return {padded[i:i + size] for i in range(max(1, len(padded) - size + 1))}
+
+
+class MinHashLSH:
+    """MinHash 서명 + 밴드 LSH로 유사 문자열 후보 쌍을 찾는 인덱스"""
+
+    def __init__(self, num_bands: int = NUM_BANDS, rows_per_band: int = ROWS_PER_BAND,
+                 shingle_size: int = SHINGLE_SIZE, seed: int = HASH_SEED):
+        self.num_bands = num_bands
+        self.rows_per_band = rows_per_band
+        self.shingle_size = shingle_size
+
+        # h(x) = (a*x + b) mod 2^32 (a는 홀수) 형태의 해시 함수 묶음
+        rng = random.Random(seed)
+        self._hash_params = [
+            (rng.getrandbits(32) | 1, rng.getrandbits(32))
+            for _ in range(num_bands * rows_per_band)
+        ]
+
+    def signature(self, text: str) -> List[int]:
+        """문자열의 MinHash 서명"""
+        hashes = [zlib.crc32(s.encode('utf-8')) for s in shingles(text, self.shingle_size)]
+        return [min((a * h + b) & _HASH_MASK for h in hashes) for a, b in self._hash_params]
+
+    def band_keys(self, text: str) -> List[int]:
+        """밴드별 서명을 64비트 부호 있는 정수 키로 변환 (PostgreSQL BIGINT[] 저장용)"""
+        if not text:
+            return []
+
+        sig = self.signature(text)
+        rows = self.rows_per_band
+        keys = []
+        for band in range(self.num_bands):
+            payload = ','.join(str(v) for v in (band, *sig[band * rows:(band + 1) * rows]))
+            digest = hashlib.blake2b(payload.encode('ascii'), digest_size=8).digest()
+            keys.append(int.from_bytes(digest, 'big', signed=True))
+        return keys
+
+    def candidate_pairs(self, texts: List[str]) -> Set[Tuple[int, int]]:
+        """같은 밴드 버킷에 한 번 이상 들어간 (i, j) 쌍 (i < j) 반환 (빈 문자열 제외)"""
+        buckets: Dict[Tuple, List[int]] = defaultdict(list)
+        rows = self.rows_per_band
+
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+
+            sig = self.signature(text)
+            for band in range(self.num_bands):
+                buckets[(band, *sig[band * rows:(band + 1) * rows])].append(i)
+
+        pairs = set()
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    pairs.add((members[x], members[y]))
+
+        return pairs
+
+
+_default_index = MinHashLSH()
+
+
+def title_band_keys(title: str) -> List[int]:
+    """제목을 정규화한 뒤 기본 설정의 밴드 키 반환 (news_items.title_lsh_bands 저장 값)"""
+    return _default_index.band_keys(normalize_title(title or ''))
@@ -4,31 +4,39 @@ Duplicate Checker for AI News Digest
 
 뉴스 제목 유사도를 계산하여 중복 항목을 제거하는 도구.
 fuzzywuzzy를 사용한 문자열 유사도 계산.
+항목이 많으면 MinHash LSH(dedup_index)로 후보 쌍을 좁힌 뒤 후보만 정확히 비교한다.
+--history-days를 지정하면 최근 N일 동안 발송된 뉴스와 유사한 항목도 제거한다.
+rapidfuzz와 python-Levenshtein이 설치되어 있으면 유사도 행렬을 블록 단위로 한 번에 계산한다 (--backend).
+유사도 계산 전에 정규화 URL 또는 본문 해시가 같은 항목을 먼저 하나로 합친다.
 """
 
 import sys
 import json
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from fuzzywuzzy import fuzz
-import re
+from dedup_index import MinHashLSH, normalize_title, title_band_keys, canonicalize_url, content_fingerprint
 
+try:
+    import numpy as np
+    from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+except ImportError:
+    rapid_process = None
 
-def normalize_title(title: str) -> str:
-    """제목 정규화 (비교용)"""
-    # 소문자 변환
-    title = title.lower()
 
-    # 특수 문자 제거 (알파벳, 숫자, 공백만 유지)
-    title = re.sub(r'[^a-zA-Z0-9가-힣\s]', ' ', title)
+# 중복 검사 엔진: pairwise(전체 쌍 비교), lsh(후보 쌍만 비교), auto(항목 수로 선택)
+DEDUP_ENGINES = ("auto", "pairwise", "lsh")
+LSH_MIN_ITEMS = 200   # auto 모드에서 LSH를 사용하기 시작하는 항목 수
 
-    # 연속된 공백을 하나로 축약
-    title = re.sub(r'\s+', ' ', title)
+# 유사도 계산 백엔드: fuzzywuzzy(쌍별 계산), rapidfuzz(행렬 일괄 계산), auto(설치 여부로 선택)
+SIMILARITY_BACKENDS = ("auto", "fuzzywuzzy", "rapidfuzz")
+MATRIX_BLOCK_ROWS = 1024   # rapidfuzz 행렬을 나눠 계산할 행 수 (메모리 사용량 제한)
 
-    # 앞뒤 공백 제거
-    title = title.strip()
+# fuzzywuzzy는 python-Levenshtein이 있으면 그 구현을, 없으면 difflib.SequenceMatcher를 사용
+FUZZYWUZZY_USES_LEVENSHTEIN = fuzz.SequenceMatcher.__module__ != 'difflib'
 
-    return title
+# 그룹화 방식: greedy(앞 항목과 유사한 항목만 묶음), union-find(유사 관계를 전이적으로 묶음)
+CLUSTERING_MODES = ("greedy", "union-find")
 
 
 def calculate_similarity(title1: str, title2: str) -> float:
@@ -42,46 +50,307 @@ def calculate_similarity(title1: str, title2: str) -> float:
     return similarity
 
 
-def find_duplicate_groups(items: List[Dict], threshold: float = 85.0) -> List[List[int]]:
-    """중복 그룹 찾기"""
-    duplicate_groups = []
+def _candidate_neighbors(normalized_titles: List[str], engine: str) -> List[List[int]]:
+    """항목별로 비교할 뒤쪽 인덱스 목록 (오름차순)"""
+    count = len(normalized_titles)
+
+    if engine == "pairwise":
+        return [list(range(i + 1, count)) for i in range(count)]
+
+    neighbors = [[] for _ in range(count)]
+    for i, j in MinHashLSH().candidate_pairs(normalized_titles):
+        neighbors[i].append(j)
+    for candidates in neighbors:
+        candidates.sort()
+    return neighbors
+
+
+def _matrix_matches(normalized_titles: List[str], threshold: float) -> List[List[Tuple[int, float]]]:
+    """rapidfuzz cdist로 전체 유사도 행렬을 블록 단위로 계산하여 임계값 이상인 뒤쪽 항목 반환
+
+    fuzzywuzzy의 ratio는 점수를 정수로 반올림하므로 같은 방식(round half to even)으로
+    반올림한 뒤 비교한다. 점수는 fuzzywuzzy가 python-Levenshtein을 사용할 때와 같고,
+    python-Levenshtein 없이 difflib.SequenceMatcher로 계산할 때는 일부 쌍의 점수가 달라진다.
+    정규화 후 빈 제목은 어떤 항목과도 중복으로 보지 않는다 (두 빈 문자열의 ratio는 100).
+    """
+    count = len(normalized_titles)
+    matches = [[] for _ in range(count)]
+    empty = np.array([not title for title in normalized_titles], dtype=bool)
+    # 반올림 후 임계값 이상이 될 수 있는 점수만 계산 (나머지는 0으로 채워짐)
+    score_cutoff = max(0.0, threshold - 0.5)
+
+    for start in range(0, count, MATRIX_BLOCK_ROWS):
+        block = rapid_process.cdist(
+            normalized_titles[start:start + MATRIX_BLOCK_ROWS],
+            normalized_titles,
+            scorer=rapid_fuzz.ratio,
+            score_cutoff=score_cutoff,
+            workers=-1
+        )
+        scores = np.rint(block)
+        scores[:, empty] = 0
+        scores[empty[start:start + MATRIX_BLOCK_ROWS], :] = 0
+        rows, cols = np.nonzero(scores >= threshold)
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            i = start + row
+            if col > i:
+                matches[i].append((col, float(scores[row, col])))
+
+    return matches
+
+
+def _pairwise_matches(normalized_titles: List[str], threshold: float, engine: str) -> List[List[Tuple[int, float]]]:
+    """후보 쌍마다 fuzzywuzzy ratio를 계산하여 임계값 이상인 뒤쪽 항목 반환 (빈 제목 제외)"""
+    matches = []
+    for i, candidates in enumerate(_candidate_neighbors(normalized_titles, engine)):
+        row = []
+        if not normalized_titles[i]:
+            matches.append(row)
+            continue
+        for j in candidates:
+            if not normalized_titles[j]:
+                continue
+            # fuzzywuzzy의 ratio 사용 (Levenshtein 거리 기반)
+            similarity = fuzz.ratio(normalized_titles[i], normalized_titles[j])
+            if similarity >= threshold:
+                row.append((j, similarity))
+        matches.append(row)
+    return matches
+
+
+def resolve_engine(engine: str, item_count: int) -> str:
+    """auto 엔진을 항목 수에 따라 실제 엔진으로 변환"""
+    if engine not in DEDUP_ENGINES:
+        raise ValueError(f"Unknown dedup engine: {engine} (choose from {', '.join(DEDUP_ENGINES)})")
+    if engine == "auto":
+        return "lsh" if item_count >= LSH_MIN_ITEMS else "pairwise"
+    return engine
+
+
+def resolve_backend(backend: str) -> str:
+    """auto 백엔드를 설치된 라이브러리에 따라 실제 백엔드로 변환
+
+    auto는 두 백엔드의 점수가 같은 경우(rapidfuzz와 python-Levenshtein이 모두 설치됨)에만
+    rapidfuzz를 선택한다. difflib로 계산하는 fuzzywuzzy와는 판정이 달라질 수 있기 때문이다.
+    """
+    if backend not in SIMILARITY_BACKENDS:
+        raise ValueError(f"Unknown similarity backend: {backend} (choose from {', '.join(SIMILARITY_BACKENDS)})")
+    if backend == "auto":
+        return "rapidfuzz" if rapid_process is not None and FUZZYWUZZY_USES_LEVENSHTEIN else "fuzzywuzzy"
+    if backend == "rapidfuzz" and rapid_process is None:
+        raise ValueError("rapidfuzz backend requires rapidfuzz and numpy (pip install rapidfuzz numpy)")
+    return backend
+
+
+def _greedy_clusters(matches: List[List[Tuple[int, float]]]) -> List[Dict]:
+    """앞 항목 기준 탐욕적 그룹화 (기존 방식, 입력 순서에 따라 결과가 달라질 수 있음)"""
+    clusters = []
     processed_indices = set()
 
-    for i, item1 in enumerate(items):
+    for i in range(len(matches)):
         if i in processed_indices:
             continue
 
         current_group = [i]
+        scores = []
 
-        for j, item2 in enumerate(items[i+1:], start=i+1):
+        for j, similarity in matches[i]:
             if j in processed_indices:
                 continue
 
-            similarity = calculate_similarity(item1['title'], item2['title'])
-
-            if similarity >= threshold:
-                current_group.append(j)
-                processed_indices.add(j)
+            current_group.append(j)
+            scores.append((i, j, similarity))
+            processed_indices.add(j)
 
         if len(current_group) > 1:
-            duplicate_groups.append(current_group)
+            clusters.append({"indices": current_group, "scores": scores})
             processed_indices.update(current_group)
 
-    return duplicate_groups
+    return clusters
+
+
+def _union_find_clusters(matches: List[List[Tuple[int, float]]]) -> List[Dict]:
+    """임계값 이상인 모든 쌍을 union-find로 묶은 연결 요소 (입력 순서와 무관)
+
+    그룹 내 항목과 그룹 목록은 인덱스 오름차순으로 정렬하여 실행 간에 결과가 같다.
+    """
+    parent = list(range(len(matches)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            # 경로 압축 (한 단계 건너뛰기)
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, row in enumerate(matches):
+        for j, _ in row:
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # 작은 인덱스를 루트로 유지
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    members = {}
+    for i in range(len(matches)):
+        members.setdefault(find(i), []).append(i)
+
+    scores = {}
+    for i, row in enumerate(matches):
+        for j, similarity in row:
+            scores.setdefault(find(i), []).append((i, j, similarity))
+
+    return [
+        {"indices": indices, "scores": sorted(scores[root])}
+        for root, indices in sorted(members.items())
+        if len(indices) > 1
+    ]
+
+
+def find_duplicate_clusters(items: List[Dict], threshold: float = 85.0, engine: str = "auto",
+                            backend: str = "auto", clustering: str = "greedy") -> List[Dict]:
+    """중복 그룹과 그룹 내 유사도 점수 찾기
+
+    제목 정규화는 항목별로 한 번만 수행한다. fuzzywuzzy 백엔드는 후보 쌍(lsh 엔진은 LSH 후보만)을
+    하나씩 비교하고, rapidfuzz 백엔드는 엔진과 무관하게 전체 유사도 행렬을 일괄 계산한다.
+
+    Returns:
+        [{"indices": [항목 인덱스, ...], "scores": [(i, j, 유사도), ...]}]
+    """
+    if clustering not in CLUSTERING_MODES:
+        raise ValueError(f"Unknown clustering mode: {clustering} (choose from {', '.join(CLUSTERING_MODES)})")
+
+    engine = resolve_engine(engine, len(items))
+    backend = resolve_backend(backend)
+    normalized_titles = [normalize_title(item['title']) for item in items]
+
+    if backend == "rapidfuzz":
+        matches = _matrix_matches(normalized_titles, threshold)
+    else:
+        matches = _pairwise_matches(normalized_titles, threshold, engine)
+
+    if clustering == "union-find":
+        return _union_find_clusters(matches)
+    return _greedy_clusters(matches)
+
+
+def find_duplicate_groups(items: List[Dict], threshold: float = 85.0, engine: str = "auto",
+                          backend: str = "auto", clustering: str = "greedy") -> List[List[int]]:
+    """중복 그룹 찾기 (그룹별 항목 인덱스 목록)"""
+    clusters = find_duplicate_clusters(items, threshold, engine, backend, clustering)
+    return [cluster["indices"] for cluster in clusters]
 
 
 def select_representative_from_group(items: List[Dict], group_indices: List[int]) -> int:
-    """중복 그룹에서 대표 항목 선택 (가장 이른 발행 시간)"""
-    group_items = [(idx, items[idx]) for idx in group_indices]
+    """중복 그룹에서 대표 항목 선택 (가장 이른 발행 시간, 같으면 앞 항목)"""
+    return min(group_indices, key=lambda idx: (items[idx]['published_at'], idx))
+
+
+def find_exact_duplicates(items: List[Dict]) -> List[Dict]:
+    """정규화 URL 또는 본문 해시가 같은 항목 그룹 찾기 (O(n))
+
+    Returns:
+        [{"indices": [항목 인덱스, ...], "matched_by": ["url" 또는 "content", ...]}]
+        matched_by는 indices[1:]의 각 항목이 그룹에 합쳐진 기준
+    """
+    groups = []
+    group_by_key = {}
+
+    for i, item in enumerate(items):
+        keys = [('url', canonicalize_url(item.get('url', ''))),
+                ('content', content_fingerprint(item.get('content', '')))]
+        keys = [(kind, value) for kind, value in keys if value]
+
+        matched = next(((kind, group_by_key[(kind, value)]) for kind, value in keys
+                        if (kind, value) in group_by_key), None)
+        if matched:
+            kind, group_index = matched
+            groups[group_index]["indices"].append(i)
+            groups[group_index]["matched_by"].append(kind)
+        else:
+            group_index = len(groups)
+            groups.append({"indices": [i], "matched_by": []})
+
+        for key in keys:
+            group_by_key.setdefault(key, group_index)
+
+    return [group for group in groups if len(group["indices"]) > 1]
+
 
-    # published_at 기준으로 정렬 (가장 이른 것이 먼저)
-    group_items.sort(key=lambda x: x[1]['published_at'])
+def find_sent_duplicates(items: List[Dict], sent_items: List[Dict], threshold: float = 85.0) -> List[Dict]:
+    """이미 발송된 뉴스와 유사한 항목 찾기
 
-    return group_items[0][0]  # 인덱스 반환
+    Args:
+        items: 현재 배치의 뉴스 항목
+        sent_items: 발송된 뉴스 (title, title_lsh_bands 포함, DatabaseClient.find_sent_similar_titles 결과)
+        threshold: 유사도 임계값 (배치 내 중복 검사와 같은 기준)
 
+    Returns:
+        [{"index", "title", "matched_news_item_id", "matched_title", "similarity"}]
+    """
+    # 밴드 키 -> 발송된 뉴스 (같은 밴드 키를 공유하는 항목만 정확히 비교)
+    sent_by_key = {}
+    normalized_sent_titles = {}
+    for sent in sent_items:
+        normalized_sent_titles[sent['id']] = normalize_title(sent['title'])
+        for key in sent.get('title_lsh_bands') or []:
+            sent_by_key.setdefault(key, []).append(sent)
 
-def remove_duplicates(items: List[Dict], threshold: float = 85.0) -> Dict[str, any]:
-    """중복 제거 메인 함수"""
+    matches = []
+    for i, item in enumerate(items):
+        normalized = normalize_title(item['title'])
+        candidates = {}
+        for key in title_band_keys(item['title']):
+            for sent in sent_by_key.get(key, []):
+                candidates[sent['id']] = sent
+
+        best = None
+        for sent in candidates.values():
+            similarity = fuzz.ratio(normalized, normalized_sent_titles[sent['id']])
+            if similarity >= threshold and (best is None or similarity > best[0]):
+                best = (similarity, sent)
+
+        if best:
+            matches.append({
+                "index": i,
+                "title": item['title'],
+                "matched_news_item_id": best[1]['id'],
+                "matched_title": best[1]['title'],
+                "similarity": best[0]
+            })
+
+    return matches
+
+
+def load_sent_items(items: List[Dict], history_days: int, db_client=None) -> List[Dict]:
+    """현재 배치와 밴드 키가 겹치는 최근 N일 발송 뉴스를 한 번의 쿼리로 조회"""
+    # DB 없이도 배치 내 중복 검사는 동작하도록 필요할 때만 로드
+    from db_client import DatabaseClient
+
+    band_keys = {key for item in items for key in title_band_keys(item['title'])}
+
+    owns_client = db_client is None
+    client = db_client or DatabaseClient()
+    try:
+        result = client.find_sent_similar_titles(list(band_keys), history_days)
+    finally:
+        if owns_client:
+            client.disconnect()
+
+    if not result["success"]:
+        raise RuntimeError(f"발송 이력 조회 실패: {result.get('error')}")
+
+    return result["news_items"]
+
+
+def remove_duplicates(items: List[Dict], threshold: float = 85.0, engine: str = "auto",
+                      history_days: Optional[int] = None, db_client=None,
+                      backend: str = "auto", clustering: str = "greedy",
+                      exact: bool = True) -> Dict[str, any]:
+    """중복 제거 메인 함수
+
+    exact가 True이면 URL/본문이 같은 항목을 먼저 합치고, history_days가 있으면
+    최근 N일 동안 발송된 뉴스와 유사한 항목을 제거한 뒤 제목 유사도 검사를 수행한다.
+    """
     if not items:
         return {
             "success": True,
@@ -94,18 +363,54 @@ def remove_duplicates(items: List[Dict], threshold: float = 85.0) -> Dict[str, a
         }
 
     original_count = len(items)
-    print(f"중복 검사 시작: {original_count}개 항목", file=sys.stderr)
+
+    # URL/본문이 같은 항목 합치기 (대표는 유사도 중복과 같은 기준으로 선택)
+    exact_group_info = []
+    if exact:
+        exact_indices_to_remove = set()
+        for group in find_exact_duplicates(items):
+            representative_idx = select_representative_from_group(items, group["indices"])
+            # 첫 항목은 대표와 같은 기준으로 일치한 것으로 기록
+            matched_by = dict(zip(group["indices"][1:], group["matched_by"]))
+            matched_by[group["indices"][0]] = matched_by.get(representative_idx)
+            exact_group_info.append({
+                "representative_title": items[representative_idx]['title'],
+                "representative_url": items[representative_idx].get('url'),
+                "duplicates": [
+                    {"title": items[idx]['title'], "url": items[idx].get('url'), "matched_by": matched_by[idx]}
+                    for idx in group["indices"]
+                    if idx != representative_idx
+                ]
+            })
+            exact_indices_to_remove.update(idx for idx in group["indices"] if idx != representative_idx)
+
+        items = [item for i, item in enumerate(items) if i not in exact_indices_to_remove]
+        print(f"URL/본문 일치 중복 {len(exact_indices_to_remove)}개 제거", file=sys.stderr)
+
+    # 발송 이력과 중복되는 항목 제거
+    sent_duplicates = []
+    if history_days:
+        sent_items = load_sent_items(items, history_days, db_client)
+        sent_duplicates = find_sent_duplicates(items, sent_items, threshold)
+        sent_indices = {match['index'] for match in sent_duplicates}
+        items = [item for i, item in enumerate(items) if i not in sent_indices]
+        print(f"최근 {history_days}일 발송 뉴스와 중복 {len(sent_duplicates)}개 제거", file=sys.stderr)
+
+    engine = resolve_engine(engine, len(items))
+    backend = resolve_backend(backend)
+    print(f"중복 검사 시작: {len(items)}개 항목 (엔진: {engine}, 백엔드: {backend})", file=sys.stderr)
 
     # 중복 그룹 찾기
-    duplicate_groups = find_duplicate_groups(items, threshold)
-    print(f"중복 그룹 {len(duplicate_groups)}개 발견", file=sys.stderr)
+    duplicate_clusters = find_duplicate_clusters(items, threshold, engine, backend, clustering)
+    print(f"중복 그룹 {len(duplicate_clusters)}개 발견 (그룹화: {clustering})", file=sys.stderr)
 
     # 제거할 인덱스 집합
     indices_to_remove = set()
 
     # 그룹별 대표 선택 및 나머지 제거 마킹
     group_info = []
-    for group_indices in duplicate_groups:
+    for cluster in duplicate_clusters:
+        group_indices = cluster["indices"]
         representative_idx = select_representative_from_group(items, group_indices)
 
         # 그룹 정보 저장 (디버깅용)
@@ -114,7 +419,10 @@ def remove_duplicates(items: List[Dict], threshold: float = 85.0) -> Dict[str, a
             "representative_index": representative_idx,
             "representative_title": items[representative_idx]['title'],
             "duplicate_titles": [items[idx]['title'] for idx in group_indices if idx != representative_idx],
-            "similarity_scores": []
+            "similarity_scores": [
+                {"index_a": i, "index_b": j, "score": similarity}
+                for i, j, similarity in cluster["scores"]
+            ]
         })
 
         # 대표가 아닌 항목들을 제거 대상으로 마킹
@@ -141,9 +449,24 @@ def remove_duplicates(items: List[Dict], threshold: float = 85.0) -> Dict[str, a
         "duplicates_removed": duplicates_removed,
         "items": deduplicated_items,
         "duplicate_groups_info": group_info,
-        "threshold_used": threshold
+        "threshold_used": threshold,
+        "engine_used": engine,
+        "backend_used": backend,
+        "clustering_used": clustering
     }
 
+    if exact:
+        result["exact_duplicates_removed"] = sum(len(group["duplicates"]) for group in exact_group_info)
+        result["exact_duplicate_groups_info"] = exact_group_info
+
+    if history_days:
+        result["history_days"] = history_days
+        result["sent_duplicates_removed"] = len(sent_duplicates)
+        result["sent_duplicates_info"] = [
+            {key: value for key, value in match.items() if key != "index"}
+            for match in sent_duplicates
+        ]
+
     print(f"중복 제거 완료: {duplicates_removed}개 제거, {len(deduplicated_items)}개 유지", file=sys.stderr)
 
     return result
@@ -151,27 +474,66 @@ def remove_duplicates(items: List[Dict], threshold: float = 85.0) -> Dict[str, a
 
 def main():
     """CLI 진입점"""
-    if len(sys.argv) < 2:
+    # --engine, --backend, --no-exact, --clustering, --history-days 옵션 분리
+    args = sys.argv[1:]
+    engine = "auto"
+    if "--engine" in args:
+        position = args.index("--engine")
+        engine = args[position + 1] if position + 1 < len(args) else ""
+        del args[position:position + 2]
+
+    backend = "auto"
+    if "--backend" in args:
+        position = args.index("--backend")
+        backend = args[position + 1] if position + 1 < len(args) else ""
+        del args[position:position + 2]
+
+    exact = "--no-exact" not in args
+    if not exact:
+        args.remove("--no-exact")
+
+    clustering = "greedy"
+    if "--clustering" in args:
+        position = args.index("--clustering")
+        clustering = args[position + 1] if position + 1 < len(args) else ""
+        del args[position:position + 2]
+
+    history_days = None
+    if "--history-days" in args:
+        position = args.index("--history-days")
+        value = args[position + 1] if position + 1 < len(args) else ""
+        history_days = int(value) if value.isdigit() else 0
+        del args[position:position + 2]
+
+    if len(args) < 1 or engine not in DEDUP_ENGINES or backend not in SIMILARITY_BACKENDS \
+            or clustering not in CLUSTERING_MODES or history_days == 0:
         print("Usage:")
-        print("  duplicate_checker.py <json_file> [threshold]")
+        print("  duplicate_checker.py <json_file> [threshold] [--engine auto|pairwise|lsh]")
+        print("                       [--backend auto|fuzzywuzzy|rapidfuzz] [--clustering greedy|union-find]")
+        print("                       [--history-days N] [--no-exact]")
         print("  duplicate_checker.py - (read from stdin)")
         print("")
         print("Arguments:")
         print("  json_file  - JSON file containing news items")
         print("  threshold  - Similarity threshold (0-100, default: 85)")
+        print(f"  --engine   - Candidate generation (default: auto, lsh from {LSH_MIN_ITEMS} items)")
+        print("  --backend  - Similarity backend (default: auto, rapidfuzz matrix if rapidfuzz and python-Levenshtein are installed)")
+        print("  --clustering - Grouping (default: greedy, union-find groups similar items transitively)")
+        print("  --history-days - Also remove items similar to news sent in the last N days (needs DB)")
+        print("  --no-exact - Skip merging items with the same canonical URL or content")
         sys.exit(1)
 
     try:
         # 임계값 설정
-        threshold = float(sys.argv[2]) if len(sys.argv) > 2 else 85.0
+        threshold = float(args[1]) if len(args) > 1 else 85.0
 
         # 입력 데이터 읽기
-        if sys.argv[1] == "-":
+        if args[0] == "-":
             # stdin에서 읽기
             input_data = sys.stdin.read()
         else:
             # 파일에서 읽기
-            with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            with open(args[0], 'r', encoding='utf-8') as f:
                 input_data = f.read()
 
         data = json.loads(input_data)
@@ -186,13 +548,13 @@ def main():
             raise ValueError("Invalid input format. Expected list or dict with 'items' key.")
 
         # 중복 제거 수행
-        result = remove_duplicates(items, threshold)
+        result = remove_duplicates(items, threshold, engine, history_days, backend=backend, clustering=clustering, exact=exact)
 
         # 결과 출력
         print(json.dumps(result, indent=2, ensure_ascii=False))
 
     except FileNotFoundError:
-        print(f"Error: File not found: {sys.argv[1]}", file=sys.stderr)
+        print(f"Error: File not found: {args[0]}", file=sys.stderr)
         sys.exit(1)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON: {e}", file=sys.stderr)
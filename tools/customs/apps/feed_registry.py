@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Feed Registry for AI News Digest
+
+RSS 피드 목록을 설정 파일(.dmap/config/rss-feeds.yaml, YAML 또는 JSON)에서 로드하고,
+피드별 수집 주기와 우선순위에 따라 이번 실행에서 수집할 피드를 선택하는 도구.
+
+설정 파일 형식:
+    defaults:
+      poll_interval: 60   # 수집 주기(분), 0이면 매 실행마다 수집
+      priority: 5         # 숫자가 작을수록 먼저 수집
+      timeout: 30         # 요청 타임아웃(초), 없으면 수집기 기본값
+      max_items: 50       # 한 번에 내보낼 최대 항목 수
+    feeds:
+      - name: arxiv cs.AI
+        url: https://arxiv.org/rss/cs.AI
+        source: arxiv cs.AI
+        category: 연구 트렌드
+        poll_interval: 30
+        priority: 1
+
+feeds 대신 카테고리별 목록(categories: {카테고리: [피드, ...]})도 사용할 수 있다.
+"""
+
+import os
+import sys
+import yaml
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from feed_state import JsonStateFile, DEFAULT_CACHE_DIR
+
+
+DEFAULT_REGISTRY_PATH = ".dmap/config/rss-feeds.yaml"
+
+# cron 실행 시각이 조금 앞당겨져도 주기가 된 것으로 보는 허용 오차
+POLL_TOLERANCE = timedelta(minutes=5)
+
+# 설정에 값이 없을 때 사용하는 피드 기본값 (기존 동작과 동일하게 매 실행 수집)
+FEED_DEFAULTS = {
+    "poll_interval": 0,
+    "priority": 5,
+    "timeout": None,
+    "max_items": None
+}
+
+
+def _normalize_feed(feed: Dict, category: Optional[str], defaults: Dict) -> Dict:
+    """피드 항목에 기본값을 채워 정규화"""
+    if not feed.get('url'):
+        raise ValueError(f"피드에 url이 없습니다: {feed}")
+
+    name = feed.get('name') or feed['url']
+    normalized = {
+        "name": name,
+        "url": feed['url'],
+        "source": feed.get('source', name),
+        "category": feed.get('category', category) or "기타"
+    }
+    for key, default in defaults.items():
+        normalized[key] = feed.get(key, default)
+
+    return normalized
+
+
+def feeds_from_categories(categories: Dict[str, List[Dict]], defaults: Optional[Dict] = None) -> List[Dict]:
+    """카테고리별 피드 목록(RSS_FEEDS 형식)을 정규화된 피드 목록으로 변환"""
+    defaults = {**FEED_DEFAULTS, **(defaults or {})}
+    return [
+        _normalize_feed(feed, category, defaults)
+        for category, feeds in categories.items()
+        for feed in feeds
+    ]
+
+
+def load_feed_registry(config_path: str = DEFAULT_REGISTRY_PATH,
+                       fallback: Optional[Dict[str, List[Dict]]] = None) -> List[Dict]:
+    """피드 레지스트리 로드
+
+    Args:
+        config_path: YAML/JSON 설정 파일 경로
+        fallback: 설정 파일이 없을 때 사용할 카테고리별 피드 목록
+
+    Returns:
+        정규화된 피드 목록 (name, url, source, category, poll_interval, priority, timeout, max_items)
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            # JSON은 YAML의 부분집합이므로 같은 로더로 처리
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        if fallback is None:
+            print(f"Error: 피드 설정 파일을 찾을 수 없습니다: {config_path}", file=sys.stderr)
+            sys.exit(1)
+        return feeds_from_categories(fallback)
+    except yaml.YAMLError as e:
+        print(f"Error: 피드 설정 파일 형식이 잘못되었습니다 ({config_path}): {e}", file=sys.stderr)
+        sys.exit(1)
+
+    defaults = {**FEED_DEFAULTS, **config.get('defaults', {})}
+
+    if 'feeds' in config:
+        feeds = [_normalize_feed(feed, None, defaults) for feed in config['feeds']]
+    elif 'categories' in config:
+        feeds = feeds_from_categories(config['categories'], defaults)
+    else:
+        print(f"Error: 피드 설정에 'feeds' 또는 'categories' 키가 없습니다: {config_path}", file=sys.stderr)
+        sys.exit(1)
+
+    # 같은 URL이 여러 번 등록된 경우 첫 항목만 사용
+    unique_feeds = []
+    seen_urls = set()
+    for feed in feeds:
+        if feed['url'] not in seen_urls:
+            seen_urls.add(feed['url'])
+            unique_feeds.append(feed)
+
+    return unique_feeds
+
+
+class FeedScheduler(JsonStateFile):
+    """피드별 마지막 수집 시각을 저장하고 수집 주기가 된 피드를 선택하는 스케줄러"""
+
+    def __init__(self, path: str = os.path.join(DEFAULT_CACHE_DIR, "feed-schedule.json")):
+        super().__init__(path)
+
+    def next_poll_at(self, feed: Dict) -> Optional[datetime]:
+        """다음 수집 예정 시각 (수집 기록이 없으면 None)"""
+        last_polled = self.get(feed['url']).get('last_polled_at')
+        if not last_polled:
+            return None
+
+        try:
+            return datetime.fromisoformat(last_polled) + timedelta(minutes=feed['poll_interval'] or 0)
+        except ValueError:
+            return None
+
+    def due_feeds(self, feeds: List[Dict], now: Optional[datetime] = None) -> List[Dict]:
+        """수집 주기가 된 피드를 우선순위 순으로 반환"""
+        now = now or datetime.now()
+        due = []
+
+        for feed in feeds:
+            next_poll = self.next_poll_at(feed)
+            if next_poll is None or next_poll <= now + POLL_TOLERANCE:
+                # 같은 우선순위에서는 오래 밀린 피드부터
+                overdue = (now - next_poll).total_seconds() if next_poll else float('inf')
+                due.append((feed['priority'], -overdue, feed))
+
+        due.sort(key=lambda x: (x[0], x[1]))
+        return [feed for _, _, feed in due]
+
+    def mark_polled(self, feed: Dict, when: Optional[datetime] = None):
+        """수집 시각 기록"""
+        self.set(feed['url'], {
+            'last_polled_at': (when or datetime.now()).isoformat()
+        })
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Feed State Store for AI News Digest
+
+RSS 수집기가 실행 간에 유지해야 하는 피드별 상태를 JSON 파일로 저장하는 도구.
+- FeedValidatorCache: 조건부 GET용 검증자(ETag, Last-Modified, 본문 해시)
+- FeedWatermarkStore: 증분 수집용 최신 발행 시각과 이미 내보낸 엔트리 ID
+- FeedHealthTracker: 실패 백오프, 서킷 브레이커, 응답 시간 히스토그램
+"""
+
+import os
+import sys
+import json
+import copy
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+
+DEFAULT_CACHE_DIR = ".dmap/cache"
+WATERMARK_GRACE = timedelta(hours=6)   # 늦게 게시/수정되는 엔트리를 위한 여유 구간
+MAX_SEEN_IDS = 2000                     # 피드별로 기억할 엔트리 ID 수
+
+# 피드 상태 추적 설정
+BACKOFF_BASE = timedelta(minutes=30)    # 첫 실패 후 재시도 대기 시간 (실패마다 2배)
+BACKOFF_MAX = timedelta(hours=24)       # 최대 재시도 대기 시간
+CIRCUIT_THRESHOLD = 3                   # 연속 실패가 이 횟수 이상이면 서킷 오픈
+PROBE_TIMEOUT = 10                      # 서킷 오픈 피드의 재시도(프로브) 타임아웃(초)
+LATENCY_BUCKETS_MS = [100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+
+
+class JsonStateFile:
+    """키(피드 URL)별 상태를 JSON 파일 하나에 저장하는 스레드 안전 저장소"""
+
+    def __init__(self, path: str):
+        """상태 파일 로드 (없거나 손상된 경우 빈 상태로 시작)"""
+        self.path = path
+        self._lock = threading.Lock()
+        self._data = self._load()
+        self._dirty = False
+
+    def _load(self) -> Dict[str, Dict]:
+        """상태 파일 읽기"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: 상태 파일을 읽을 수 없어 초기화합니다 ({self.path}): {e}", file=sys.stderr)
+            return {}
+
+    def get(self, key: str) -> Dict:
+        """키의 상태 사본 반환 (없으면 빈 딕셔너리)"""
+        with self._lock:
+            return copy.deepcopy(self._data.get(key, {}))
+
+    def set(self, key: str, value: Dict):
+        """키의 상태 교체"""
+        with self._lock:
+            self._data[key] = value
+            self._dirty = True
+
+    def save(self) -> bool:
+        """변경 사항이 있으면 임시 파일에 쓴 뒤 교체하여 원자적으로 저장"""
+        with self._lock:
+            if not self._dirty:
+                return True
+
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+
+                tmp_path = f"{self.path}.tmp"
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+
+                self._dirty = False
+                return True
+            except OSError as e:
+                print(f"Warning: 상태 파일 저장 실패 ({self.path}): {e}", file=sys.stderr)
+                return False
+
+
+class FeedValidatorCache(JsonStateFile):
+    """피드 URL별 HTTP 검증자 캐시 (ETag, Last-Modified, 본문 해시)"""
+
+    def __init__(self, path: str = os.path.join(DEFAULT_CACHE_DIR, "feed-validators.json")):
+        super().__init__(path)
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """응답 본문 해시"""
+        return hashlib.sha256(content).hexdigest()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """저장된 검증자로 조건부 요청 헤더 생성"""
+        entry = self.get(url)
+        headers = {}
+
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+        return headers
+
+    def is_unchanged(self, url: str, content_hash: str) -> bool:
+        """서버가 검증자를 무시한 경우에도 본문이 같으면 변경 없음으로 판단"""
+        stored_hash = self.get(url).get('content_hash')
+        return stored_hash is not None and stored_hash == content_hash
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str], content_hash: Optional[str]):
+        """성공적으로 파싱한 응답의 검증자 저장"""
+        self.set(url, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_hash': content_hash,
+            'updated_at': datetime.now().isoformat()
+        })
+
+
+class FeedWatermarkStore(JsonStateFile):
+    """피드 URL별 증분 수집 상태 (최신 발행 시각 + 이미 내보낸 엔트리 ID)
+
+    워터마크에서 WATERMARK_GRACE를 뺀 시각보다 오래된 엔트리는 바로 제외하고,
+    여유 구간 안의 엔트리는 저장된 ID(GUID 또는 URL)로 중복 여부를 판단한다.
+    """
+
+    def __init__(self, path: str = os.path.join(DEFAULT_CACHE_DIR, "feed-watermarks.json")):
+        super().__init__(path)
+
+    def cutoff(self, url: str, default_cutoff: datetime) -> datetime:
+        """기본 기준 시각과 워터마크 중 더 최근 시각을 수집 기준으로 반환"""
+        last_published = self.get(url).get('last_published')
+        if not last_published:
+            return default_cutoff
+
+        try:
+            watermark = datetime.fromisoformat(last_published) - WATERMARK_GRACE
+        except ValueError:
+            return default_cutoff
+
+        return max(default_cutoff, watermark)
+
+    def seen_ids(self, url: str) -> Set[str]:
+        """이미 내보낸 엔트리 ID 집합"""
+        return set(self.get(url).get('seen_ids', []))
+
+    def advance(self, url: str, new_entries: Iterable[Tuple[str, datetime]]):
+        """새로 내보낸 엔트리로 워터마크와 ID 목록 갱신"""
+        new_entries = list(new_entries)
+        if not new_entries:
+            return
+
+        state = self.get(url)
+        newest = max(published_at for _, published_at in new_entries)
+        last_published = state.get('last_published')
+        try:
+            if last_published and datetime.fromisoformat(last_published) > newest:
+                newest = datetime.fromisoformat(last_published)
+        except ValueError:
+            pass
+
+        # 최근 ID가 앞에 오도록 유지하고 개수 제한
+        seen_ids = [entry_id for entry_id, _ in new_entries]
+        known = set(seen_ids)
+        seen_ids.extend(entry_id for entry_id in state.get('seen_ids', []) if entry_id not in known)
+
+        self.set(url, {
+            'last_published': newest.isoformat(),
+            'seen_ids': seen_ids[:MAX_SEEN_IDS],
+            'updated_at': datetime.now().isoformat()
+        })
+
+
+class FeedHealthTracker(JsonStateFile):
+    """피드 URL별 상태 추적 (지수 백오프 + 서킷 브레이커 + 응답 시간 히스토그램)
+
+    실패할 때마다 BACKOFF_BASE * 2^(연속 실패-1) 동안 수집을 건너뛰고,
+    연속 실패가 CIRCUIT_THRESHOLD 이상이면 서킷을 열어 대기 시간이 지난 뒤
+    짧은 타임아웃의 프로브 요청 한 번으로만 복구 여부를 확인한다.
+    """
+
+    def __init__(self, path: str = os.path.join(DEFAULT_CACHE_DIR, "feed-health.json")):
+        super().__init__(path)
+
+    @staticmethod
+    def _bucket_label(latency_ms: float) -> str:
+        """응답 시간이 속하는 히스토그램 구간 이름"""
+        for bound in LATENCY_BUCKETS_MS:
+            if latency_ms <= bound:
+                return f"<={bound}ms"
+        return f">{LATENCY_BUCKETS_MS[-1]}ms"
+
+    def should_attempt(self, url: str, now: Optional[datetime] = None) -> bool:
+        """백오프 대기 중이 아니면 수집 시도"""
+        next_attempt_at = self.get(url).get('next_attempt_at')
+        if not next_attempt_at:
+            return True
+
+        try:
+            return datetime.fromisoformat(next_attempt_at) <= (now or datetime.now())
+        except ValueError:
+            return True
+
+    def is_circuit_open(self, url: str) -> bool:
+        """서킷이 열린 피드인지 (다음 요청은 프로브로 처리)"""
+        return self.get(url).get('consecutive_failures', 0) >= CIRCUIT_THRESHOLD
+
+    def _record(self, url: str, latency: float, success: Optional[bool]):
+        """요청 결과와 응답 시간 기록 (success가 None이면 응답 시간만 기록)"""
+        now = datetime.now()
+        state = self.get(url)
+        latency_ms = latency * 1000
+
+        histogram = state.get('latency_histogram', {})
+        label = self._bucket_label(latency_ms)
+        histogram[label] = histogram.get(label, 0) + 1
+
+        state['latency_histogram'] = histogram
+        state['last_latency_ms'] = round(latency_ms, 1)
+        state['total_requests'] = state.get('total_requests', 0) + 1
+
+        if success is None:
+            pass
+        elif success:
+            state['consecutive_failures'] = 0
+            state['next_attempt_at'] = None
+            state['last_success_at'] = now.isoformat()
+        else:
+            failures = state.get('consecutive_failures', 0) + 1
+            backoff = min(BACKOFF_BASE * (2 ** (failures - 1)), BACKOFF_MAX)
+            state['consecutive_failures'] = failures
+            state['total_failures'] = state.get('total_failures', 0) + 1
+            state['next_attempt_at'] = (now + backoff).isoformat()
+            state['last_failure_at'] = now.isoformat()
+
+        state['circuit'] = "open" if state.get('consecutive_failures', 0) >= CIRCUIT_THRESHOLD else "closed"
+        self.set(url, state)
+
+    def record_success(self, url: str, latency: float):
+        """성공 기록 (연속 실패 초기화, 서킷 닫힘)"""
+        self._record(url, latency, True)
+
+    def record_failure(self, url: str, latency: float):
+        """실패 기록 (백오프 대기 시간 증가, 임계값 이상이면 서킷 오픈)"""
+        self._record(url, latency, False)
+
+    def record_latency(self, url: str, latency: float):
+        """성공/실패와 무관하게 응답 시간만 기록 (전체 마감으로 끊긴 요청, 백오프와 서킷은 그대로)"""
+        self._record(url, latency, None)
+
+    def summary(self, url: str) -> Dict:
+        """수집 통계에 포함할 피드 상태 요약"""
+        state = self.get(url)
+        return {
+            "circuit": state.get('circuit', "closed"),
+            "consecutive_failures": state.get('consecutive_failures', 0),
+            "next_attempt_at": state.get('next_attempt_at'),
+            "last_latency_ms": state.get('last_latency_ms'),
+            "latency_histogram": state.get('latency_histogram', {})
+        }
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Streaming Feed Parser for AI News Digest
+
+RSS 2.0 / RSS 1.0(RDF) / Atom 피드를 바이트 청크 단위로 증분 파싱하여
+엔트리를 하나씩 반환하는 도구. 문서 전체를 메모리에 올리지 않으므로
+호출 측에서 필요한 엔트리만 읽고 나머지 다운로드를 중단할 수 있다.
+형식이 잘못된 피드는 FeedStreamError를 발생시키며, 호출 측은 feedparser로 폴백한다.
+"""
+
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Iterator, Optional
+
+
+FEED_ROOTS = {'rss', 'feed', 'RDF'}
+ENTRY_TAGS = {'item', 'entry'}
+RDF_ABOUT = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about'
+
+
+class FeedStreamError(Exception):
+    """스트리밍 파싱 불가 (XML 오류 또는 피드가 아닌 문서)"""
+
+
+def _local_name(tag: str) -> str:
+    """네임스페이스를 제거한 태그 이름"""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def parse_date(value: Optional[str]) -> Optional[datetime]:
+    """RFC 822(RSS) 또는 ISO 8601(Atom, dc:date) 날짜를 UTC 기준 naive datetime으로 변환
+
+    feedparser의 *_parsed(UTC struct_time)와 같은 기준으로 맞춘다.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    parsed = None
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+
+    if parsed is None:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    # feedparser와 같이 초 단위까지만 사용
+    return parsed.replace(microsecond=0)
+
+
+def _entry_from_element(element: ET.Element) -> Dict:
+    """item/entry 요소를 정규화된 엔트리 딕셔너리로 변환"""
+    fields = {}
+    link = ''
+
+    for child in element:
+        name = _local_name(child.tag)
+        text = (child.text or '').strip()
+
+        if name == 'link':
+            # Atom: <link rel="alternate" href="..."/>, RSS: <link>...</link>
+            href = child.get('href')
+            if href and child.get('rel', 'alternate') == 'alternate' and not link:
+                link = href
+            elif text and not link:
+                link = text
+        elif name == 'encoded':
+            fields.setdefault('content', text)
+        elif name == 'date':
+            fields.setdefault('published', text)
+        else:
+            fields.setdefault(name, text)
+
+    summary = fields.get('description') or fields.get('summary') or fields.get('content', '')
+    published = fields.get('pubDate') or fields.get('published') or fields.get('updated')
+
+    return {
+        'id': fields.get('guid') or fields.get('id') or element.get(RDF_ABOUT),
+        'title': fields.get('title', ''),
+        'link': link,
+        'published_at': parse_date(published),
+        'content': summary
+    }
+
+
+def iter_feed_entries(chunks: Iterable[bytes]) -> Iterator[Dict]:
+    """바이트 청크에서 엔트리를 하나씩 파싱하여 반환
+
+    Yields:
+        {'id', 'title', 'link', 'published_at'(datetime 또는 None), 'content'}
+
+    Raises:
+        FeedStreamError: XML 오류 또는 RSS/Atom 문서가 아닌 경우
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    root_checked = False
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+
+            for event, element in parser.read_events():
+                if event == 'start':
+                    if not root_checked:
+                        if _local_name(element.tag) not in FEED_ROOTS:
+                            raise FeedStreamError(f"Not a feed document: <{_local_name(element.tag)}>")
+                        root_checked = True
+                    continue
+
+                if _local_name(element.tag) in ENTRY_TAGS:
+                    yield _entry_from_element(element)
+                    # 처리한 엔트리의 자식 요소를 해제하여 메모리 사용량 유지
+                    element.clear()
+
+        parser.close()
+    except ET.ParseError as e:
+        raise FeedStreamError(str(e)) from e
+
+    if not root_checked:
+        raise FeedStreamError("Empty feed document")
@@ -4,6 +4,12 @@ Groq Summarizer for AI News Digest
 
 Groq API를 사용하여 영문 뉴스를 요약하고 한국어로 번역하는 도구.
 llama-3.1-8b-instant 모델 사용.
+여러 배치를 동시에 요청하며, 분당 요청/토큰 한도는 공유 제한기(rate_limiter)로 지킨다.
+같은 결과 형식의 asyncio API(*_async)도 제공한다.
+이미 요약한 내용은 요약 캐시(summary_cache)에서 가져와 API를 호출하지 않는다.
+배치는 토큰 예산 기준으로 나눈다(batch_planner).
+스트리밍 API(stream_news_items)는 기사 요약이 완성되는 대로 하나씩 반환한다.
+요약 API는 summarizer_backends의 백엔드(groq, OpenAI 호환, 로컬)로 바꿀 수 있다.
 """
 
 import sys
@@ -11,21 +17,67 @@ import json
 import os
 import yaml
 import time
+import queue
+import asyncio
+import threading
+import warnings
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional
-from groq import Groq
-import groq
-
-
-def load_groq_config(config_path: str = ".dmap/secrets/groq.yaml") -> Dict[str, str]:
-    """Groq API 설정을 YAML 파일에서 로드"""
+from typing import AsyncIterator, Iterator, List, Dict, Optional, Tuple, Union
+from rate_limiter import RateLimiter, parse_duration, DEFAULT_REQUESTS_PER_MINUTE, DEFAULT_TOKENS_PER_MINUTE
+from summary_cache import SummaryCache, summary_cache_key
+from batch_planner import (
+    count_tokens, truncate_to_tokens, batch_output_tokens, expected_output_tokens, plan_batches,
+    DEFAULT_INPUT_TOKEN_BUDGET, DEFAULT_OUTPUT_TOKEN_BUDGET, DEFAULT_MAX_BATCH_ITEMS
+)
+from summary_text import extract_korean_summary, clean_summary_text
+from content_preparer import prepare_news_items, DEFAULT_CONTENT_TOKENS, PREPARER_VERSION
+from summarizer_backends import (
+    SummarizerBackend, SUMMARIZER_BACKENDS, create_backend, error_headers,
+    is_rate_limit_error, is_authentication_error, is_connection_error, DEFAULT_LOCAL_LATENCY
+)
+
+try:
+    from groq import Groq, AsyncGroq
+except ImportError:   # local 백엔드만 쓰면 groq 패키지 없이도 동작
+    Groq = AsyncGroq = None
+
+
+DEFAULT_MAX_CONCURRENCY = 4   # 동시에 요청할 배치 수
+
+
+def load_groq_config(config_path: str = ".dmap/secrets/groq.yaml", backend: Optional[str] = None) -> Dict[str, str]:
+    """요약 API 설정을 YAML 파일에서 로드
+
+    backend를 지정하면 설정 파일의 backend 값보다 우선한다.
+    local 백엔드는 API 키가 필요 없으므로 설정 파일이 없어도 기본값으로 동작한다.
+    """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-
+        try:
+            with open(config_path, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            if backend != "local":
+                raise
+            config = {}
+
+        backend = backend or config.get('backend', 'groq')
         return {
-            'api_key': config['api_key'],
-            'model': config.get('model', 'llama-3.1-8b-instant')
+            'backend': backend,
+            'api_key': config.get('api_key', '') if backend == "local" else config['api_key'],
+            'base_url': config.get('base_url'),
+            'model': config.get('model', 'llama-3.1-8b-instant'),
+            'max_concurrency': config.get('max_concurrency', DEFAULT_MAX_CONCURRENCY),
+            'requests_per_minute': config.get('requests_per_minute', DEFAULT_REQUESTS_PER_MINUTE),
+            'tokens_per_minute': config.get('tokens_per_minute', DEFAULT_TOKENS_PER_MINUTE),
+            'batch_input_tokens': config.get('batch_input_tokens', DEFAULT_INPUT_TOKEN_BUDGET),
+            'batch_output_tokens': config.get('batch_output_tokens', DEFAULT_OUTPUT_TOKEN_BUDGET),
+            'content_tokens': config.get('content_tokens', DEFAULT_CONTENT_TOKENS),
+            'local_latency': config.get('local_latency', DEFAULT_LOCAL_LATENCY),
+            'local_token_latency': config.get('local_token_latency', 0.0),
+            'local_requests_per_minute': config.get('local_requests_per_minute'),
+            'local_tokens_per_minute': config.get('local_tokens_per_minute')
         }
     except FileNotFoundError:
         print(f"Error: Groq API 설정 파일을 찾을 수 없습니다: {config_path}", file=sys.stderr)
@@ -35,21 +87,145 @@ def load_groq_config(config_path: str = ".dmap/secrets/groq.yaml") -> Dict[str,
         sys.exit(1)
 
 
-def summarize_and_translate(content: str, api_key: str, model: str = "llama-3.1-8b-instant", max_retries: int = 3) -> Dict[str, any]:
-    """
-    Groq API로 원문 요약 및 한국어 번역
+_backends: Dict[Tuple, SummarizerBackend] = {}
 
-    Args:
-        content: 원문 내용
-        api_key: Groq API 키
-        model: 사용할 모델명
-        max_retries: 최대 재시도 횟수
 
-    Returns:
-        결과 딕셔너리
+def get_backend(config: Dict, backend: Optional[SummarizerBackend] = None) -> SummarizerBackend:
+    """설정에 맞는 요약 백엔드 (같은 설정이면 프로세스 안에서 공유, 인스턴스를 넘기면 그대로 사용)"""
+    if backend is not None:
+        return backend
+
+    key = tuple(config.get(name) for name in (
+        'backend', 'api_key', 'base_url',
+        'local_latency', 'local_token_latency', 'local_requests_per_minute', 'local_tokens_per_minute'
+    ))
+    if key not in _backends:
+        _backends[key] = create_backend(config)
+    return _backends[key]
+
+
+def _load_backend(backend: Optional[Union[str, SummarizerBackend]] = None,
+                  config: Optional[Dict] = None) -> Tuple[Dict, SummarizerBackend]:
+    """설정과 요약 백엔드 준비 (backend는 이름 또는 SummarizerBackend 인스턴스, 없으면 설정 파일 값)"""
+    if isinstance(backend, SummarizerBackend):
+        config = dict(config or load_groq_config(backend=backend.name), backend=backend.name)
+        return config, backend
+
+    if config is None:
+        config = load_groq_config(backend=backend)
+    elif backend:
+        config = dict(config, backend=backend)
+    return config, get_backend(config)
+
+
+def _cache_model(config: Dict, prepare: bool = True) -> str:
+    """요약 캐시 키에 쓸 모델 이름 (groq 외 백엔드, 본문 정리 버전별 요약은 따로 저장)"""
+    model = config['model'] if config['backend'] == "groq" else f"{config['backend']}:{config['model']}"
+    if prepare:
+        model = f"{model}+prep{PREPARER_VERSION}"
+    return model
+
+
+def create_groq_client(api_key: str) -> Groq:
+    """스레드 간에 공유할 Groq 클라이언트 (재시도는 제한기와 함께 직접 처리)"""
+    return Groq(api_key=api_key, max_retries=0)
+
+
+_async_clients = weakref.WeakKeyDictionary()   # 이벤트 루프 -> {API 키: AsyncGroq}
+
+
+def get_async_groq_client(api_key: str) -> AsyncGroq:
+    """현재 이벤트 루프에서 공유하는 비동기 Groq 클라이언트 (루프와 API 키별 하나)
+
+    내부 httpx 클라이언트가 처음 사용한 루프에 묶이므로, asyncio.run마다 새 클라이언트를 쓴다.
     """
-    client = Groq(api_key=api_key)
+    clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    if api_key not in clients:
+        clients[api_key] = AsyncGroq(api_key=api_key, max_retries=0)
+    return clients[api_key]
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """429 응답의 retry-after 헤더(초)"""
+    headers = error_headers(error)
+    if headers is None:
+        return None
+    return parse_duration(headers.get('retry-after'))
+
+
+def _retry_wait(error: Exception, attempt: int) -> float:
+    """재시도 전 대기 시간 (429면 retry-after 우선)"""
+    if is_rate_limit_error(error):
+        return _retry_after(error) or 2 ** attempt  # Exponential backoff
+    return 2 ** attempt
+
+
+def _settle(limiter: Optional[RateLimiter], reserve_tokens: int, used_tokens: int, headers=None):
+    """예약한 토큰을 실제 사용량으로 정산하고 응답 헤더로 제한기 보정"""
+    if limiter is not None:
+        limiter.reconcile(reserve_tokens, used_tokens)
+        limiter.update_from_headers(headers)
+
+
+def _create_completion(client: Groq, limiter: Optional[RateLimiter], reserve_tokens: int, **kwargs):
+    """제한기에서 요청/토큰을 예약한 뒤 completion 생성 (응답 헤더로 제한기 보정)"""
+    if limiter is None:
+        return client.chat.completions.create(**kwargs)
 
+    limiter.acquire(reserve_tokens)
+    try:
+        raw_response = client.chat.completions.with_raw_response.create(**kwargs)
+    except Exception as e:
+        _settle(limiter, reserve_tokens, 0, error_headers(e))
+        raise
+
+    chat_completion = raw_response.parse()
+    _settle(limiter, reserve_tokens, chat_completion.usage.total_tokens, raw_response.headers)
+    return chat_completion
+
+
+async def _create_completion_async(client: AsyncGroq, limiter: Optional[RateLimiter], reserve_tokens: int, **kwargs):
+    """_create_completion의 asyncio 버전"""
+    if limiter is None:
+        return await client.chat.completions.create(**kwargs)
+
+    await limiter.acquire_async(reserve_tokens)
+    try:
+        raw_response = await client.chat.completions.with_raw_response.create(**kwargs)
+    except Exception as e:
+        _settle(limiter, reserve_tokens, 0, error_headers(e))
+        raise
+
+    chat_completion = await raw_response.parse()
+    _settle(limiter, reserve_tokens, chat_completion.usage.total_tokens, raw_response.headers)
+    return chat_completion
+
+
+def _wait_before_retry(error: Exception, attempt: int, limiter: Optional[RateLimiter]):
+    """재시도 전 대기 (제한기가 있으면 429 대기는 제한기가 맡음)"""
+    wait_time = _retry_wait(error, attempt)
+    if limiter is not None and is_rate_limit_error(error):
+        limiter.penalize(wait_time)
+    else:
+        time.sleep(wait_time)
+
+
+async def _wait_before_retry_async(error: Exception, attempt: int, limiter: Optional[RateLimiter]):
+    """_wait_before_retry의 asyncio 버전"""
+    wait_time = _retry_wait(error, attempt)
+    if limiter is not None and is_rate_limit_error(error):
+        limiter.penalize(wait_time)
+    else:
+        await asyncio.sleep(wait_time)
+
+
+def _preview(content: str) -> str:
+    """결과에 포함할 원문 앞부분"""
+    return content[:200] + "..." if len(content) > 200 else content
+
+
+def _single_request(content: str, model: str) -> Tuple[Dict, int]:
+    """단건 요약 요청 인자와 예약할 토큰 수"""
     # 프롬프트 작성
     system_prompt = """You are a professional AI news summarizer and translator. Your task is to:
 1. Summarize the given English news article into 4-6 detailed sentences (80-120 words)
@@ -66,385 +242,1271 @@ Response format:
 - First provide a 4-6 sentence English summary (80-120 words)
 - Then provide a detailed Korean translation (at least 4-5 sentences covering all key points)"""
 
+    max_tokens = 800   # 4-6문장 상세 요약을 위한 충분한 토큰
+    expected_tokens = 450   # 영문 요약 + 한국어 번역의 평균적인 출력 토큰 (제한기 예약용)
+    request = {
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "model": model,
+        "temperature": 0.3,  # 일관된 요약을 위해 낮은 temperature
+        "max_tokens": max_tokens,
+        "top_p": 1,
+        "stop": None,
+        "stream": False
+    }
+    return request, count_tokens(system_prompt + user_prompt) + expected_tokens
+
+
+def _single_success(content: str, chat_completion, model: str, attempt: int) -> Dict[str, any]:
+    """단건 요약 성공 결과"""
+    response_content = chat_completion.choices[0].message.content
+
+    # 응답에서 한국어 부분 추출
+    korean_summary = extract_korean_summary(response_content)
+
+    return {
+        "success": True,
+        "original_content": _preview(content),
+        "full_response": response_content,
+        "summary_ko": korean_summary,
+        "model_used": model,
+        "tokens_used": chat_completion.usage.total_tokens,
+        "attempt": attempt + 1
+    }
+
+
+def _single_failure(error: Exception, attempt: int, max_retries: int, content: str) -> Optional[Dict[str, any]]:
+    """단건 요약 예외 처리 (재시도하면 None, 더 이상 재시도하지 않으면 실패 결과)"""
+    wait_time = _retry_wait(error, attempt)
+    can_retry = attempt < max_retries - 1
+
+    if is_authentication_error(error):
+        return {
+            "success": False,
+            "error": "Invalid API key",
+            "error_type": "authentication",
+            "original_content": _preview(content)
+        }
+
+    if is_rate_limit_error(error):
+        print(f"Rate limit exceeded, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
+        return None if can_retry else {
+            "success": False,
+            "error": f"Rate limit exceeded after {max_retries} attempts",
+            "error_type": "rate_limit",
+            "original_content": _preview(content)
+        }
+
+    if is_connection_error(error):
+        print(f"API connection error, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
+        return None if can_retry else {
+            "success": False,
+            "error": f"Connection failed after {max_retries} attempts: {str(error)}",
+            "error_type": "connection",
+            "original_content": _preview(content)
+        }
+
+    print(f"Unexpected error, waiting {wait_time}s (attempt {attempt + 1}/{max_retries}): {error}", file=sys.stderr)
+    return None if can_retry else {
+        "success": False,
+        "error": str(error),
+        "error_type": "unknown",
+        "original_content": _preview(content)
+    }
+
+
+def _single_exhausted(content: str, max_retries: int) -> Dict[str, any]:
+    """모든 재시도 실패 결과"""
+    return {
+        "success": False,
+        "error": f"All {max_retries} attempts failed",
+        "error_type": "max_retries_exceeded",
+        "original_content": _preview(content)
+    }
+
+
+def summarize_and_translate(content: str, api_key: str, model: str = "llama-3.1-8b-instant", max_retries: int = 3,
+                            client: Optional[Groq] = None, limiter: Optional[RateLimiter] = None) -> Dict[str, any]:
+    """
+    Groq API로 원문 요약 및 한국어 번역
+
+    Args:
+        content: 원문 내용
+        api_key: Groq API 키
+        model: 사용할 모델명
+        max_retries: 최대 재시도 횟수
+        client: 공유 Groq 클라이언트 (없으면 새로 생성)
+        limiter: 공유 rate limit 제한기 (없으면 제한 없이 요청)
+
+    Returns:
+        결과 딕셔너리
+    """
+    client = client or Groq(api_key=api_key)
+    request, reserve_tokens = _single_request(content, model)
+
     for attempt in range(max_retries):
         try:
-            chat_completion = client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                model=model,
-                temperature=0.3,  # 일관된 요약을 위해 낮은 temperature
-                max_tokens=800,   # 4-6문장 상세 요약을 위한 충분한 토큰
-                top_p=1,
-                stop=None,
-                stream=False
-            )
+            chat_completion = _create_completion(client, limiter, reserve_tokens, **request)
+            return _single_success(content, chat_completion, model, attempt)
+        except Exception as e:
+            failure = _single_failure(e, attempt, max_retries, content)
+            if failure is not None:
+                return failure
+            _wait_before_retry(e, attempt, limiter)
 
-            response_content = chat_completion.choices[0].message.content
-
-            # 응답에서 한국어 부분 추출
-            korean_summary = extract_korean_summary(response_content)
-
-            return {
-                "success": True,
-                "original_content": content[:200] + "..." if len(content) > 200 else content,
-                "full_response": response_content,
-                "summary_ko": korean_summary,
-                "model_used": model,
-                "tokens_used": chat_completion.usage.total_tokens,
-                "attempt": attempt + 1
-            }
-
-        except groq.RateLimitError as e:
-            wait_time = 2 ** attempt  # Exponential backoff
-            print(f"Rate limit exceeded, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
-            if attempt < max_retries - 1:
-                time.sleep(wait_time)
-                continue
-            else:
-                return {
-                    "success": False,
-                    "error": f"Rate limit exceeded after {max_retries} attempts",
-                    "error_type": "rate_limit",
-                    "original_content": content[:200] + "..." if len(content) > 200 else content
-                }
-
-        except groq.APIConnectionError as e:
-            wait_time = 2 ** attempt
-            print(f"API connection error, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
-            if attempt < max_retries - 1:
-                time.sleep(wait_time)
-                continue
-            else:
-                return {
-                    "success": False,
-                    "error": f"Connection failed after {max_retries} attempts: {str(e)}",
-                    "error_type": "connection",
-                    "original_content": content[:200] + "..." if len(content) > 200 else content
-                }
-
-        except groq.AuthenticationError as e:
-            return {
-                "success": False,
-                "error": "Invalid API key",
-                "error_type": "authentication",
-                "original_content": content[:200] + "..." if len(content) > 200 else content
-            }
+    # 모든 재시도 실패
+    return _single_exhausted(content, max_retries)
+
+
+async def summarize_and_translate_async(content: str, api_key: str, model: str = "llama-3.1-8b-instant",
+                                        max_retries: int = 3, client: Optional[AsyncGroq] = None,
+                                        limiter: Optional[RateLimiter] = None) -> Dict[str, any]:
+    """summarize_and_translate의 asyncio 버전 (결과 딕셔너리 형식 동일, 기본은 공유 비동기 클라이언트)"""
+    client = client or get_async_groq_client(api_key)
+    request, reserve_tokens = _single_request(content, model)
 
+    for attempt in range(max_retries):
+        try:
+            chat_completion = await _create_completion_async(client, limiter, reserve_tokens, **request)
+            return _single_success(content, chat_completion, model, attempt)
         except Exception as e:
-            wait_time = 2 ** attempt
-            print(f"Unexpected error, waiting {wait_time}s (attempt {attempt + 1}/{max_retries}): {e}", file=sys.stderr)
-            if attempt < max_retries - 1:
-                time.sleep(wait_time)
+            failure = _single_failure(e, attempt, max_retries, content)
+            if failure is not None:
+                return failure
+            await _wait_before_retry_async(e, attempt, limiter)
+
+    return _single_exhausted(content, max_retries)
+
+
+_BATCH_INSTRUCTIONS = """You are a professional AI news summarizer and translator. Your task is to:
+1. Summarize each given English news article into 4-6 detailed sentences (80-120 words)
+2. Write the summary in natural, fluent Korean (at least 4-5 sentences)
+3. Focus on: what happened, why it's important, context/background, and potential impact
+4. Use formal but accessible Korean language suitable for a tech-savvy audience
+5. Ensure the Korean summary is comprehensive and informative, not just a brief overview
+
+You will receive articles as JSON objects, one per line, each with an "id", "title" and "content".
+
+"""
+
+BATCH_SYSTEM_PROMPT = _BATCH_INSTRUCTIONS + """Respond with a single JSON object only, in this exact shape:
+{"summaries": [{"id": "<article id>", "summary_ko": "<detailed Korean summary, 4-5 sentences minimum>"}]}
+
+Include exactly one entry per article id, using the ids exactly as given."""
+
+# 스트리밍 모드는 기사별로 한 줄씩 완성된 JSON을 받아 도착하는 대로 처리
+STREAM_SYSTEM_PROMPT = _BATCH_INSTRUCTIONS + """Respond in JSON Lines: one JSON object per article, each on its own line, in this exact shape:
+{"id": "<article id>", "summary_ko": "<detailed Korean summary, 4-5 sentences minimum>"}
+
+Write nothing else. Finish each article's line before starting the next, and use the ids exactly as given."""
+
+MAX_PARTIAL_RETRIES = 2   # 응답에서 빠진 기사만 다시 요청하는 최대 횟수
+
+
+def _batch_article_ids(count: int) -> List[str]:
+    """배치 안 기사 id (배치 내 위치 기준, 누락분 재요청 시에도 같은 id 사용)"""
+    return [f"a{i + 1}" for i in range(count)]
+
+
+def _batch_user_prompt(items: List[Dict], article_ids: Optional[List[str]] = None, stream: bool = False) -> str:
+    """배치 요약 사용자 프롬프트 (기사 본문은 토큰 수 기준으로 절단)"""
+    article_ids = article_ids or _batch_article_ids(len(items))
+    articles = "\n".join(
+        json.dumps({
+            "id": article_id,
+            "title": item.get('title', 'Untitled'),
+            "content": truncate_to_tokens(item.get('content', ''))
+        }, ensure_ascii=False)
+        for article_id, item in zip(article_ids, items)
+    )
+
+    return f"""Please summarize these {len(items)} AI/tech news articles in Korean:
+
+{articles}
+
+{"Return one JSON line per article id." if stream else "Return the JSON object with one summary per article id."}"""
+
+
+def _batch_request(items: List[Dict], model: str, article_ids: Optional[List[str]] = None,
+                   stream: bool = False) -> Tuple[Dict, int]:
+    """배치 요약 요청 인자와 예약할 토큰 수 (max_tokens는 기사 수에 맞춰 계산)
+
+    기본은 JSON 응답 모드이고, stream=True면 기사별 JSON Lines를 스트리밍으로 요청한다.
+    제한기에는 max_tokens 전체가 아니라 예상 출력 토큰을 예약하고 응답의 usage로 정산한다.
+    max_tokens를 예약하면 기본 TPM에서 배치 하나가 버킷 전체를 차지해 동시 요청이 불가능해진다.
+    """
+    system_prompt = STREAM_SYSTEM_PROMPT if stream else BATCH_SYSTEM_PROMPT
+    user_prompt = _batch_user_prompt(items, article_ids, stream)
+    max_tokens = batch_output_tokens(len(items))
+    request = {
+        "messages": [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ],
+        "model": model,
+        "temperature": 0.3,
+        "max_tokens": max_tokens,
+        "top_p": 1,
+        "stop": None,
+        "stream": stream
+    }
+    if not stream:
+        request["response_format"] = {"type": "json_object"}
+    return request, count_tokens(system_prompt) + count_tokens(user_prompt) + expected_output_tokens(len(items))
+
+
+def _plan_chunks(items: List[Dict], config: Dict, batch_size: Optional[int]) -> List[List[Dict]]:
+    """설정된 입력/출력 토큰 예산으로 배치 나누기
+
+    요청 하나가 분당 토큰 한도를 넘으면 제한기를 통과할 수 없으므로
+    입력 예산은 한도의 절반, 출력 예산은 나머지를 넘지 않도록 줄인다.
+    """
+    tokens_per_minute = int(config['tokens_per_minute'])
+    input_budget = min(config['batch_input_tokens'], tokens_per_minute // 2)
+    output_budget = min(config['batch_output_tokens'], tokens_per_minute - input_budget)
+
+    return plan_batches(
+        items,
+        input_budget=input_budget,
+        output_budget=output_budget,
+        max_items=batch_size or DEFAULT_MAX_BATCH_ITEMS,
+        prompt_tokens=count_tokens(BATCH_SYSTEM_PROMPT) + count_tokens(_batch_user_prompt([]))
+    )
+
+
+def parse_batch_summaries(response_content: str, article_ids: List[str]) -> Dict[str, str]:
+    """JSON 배치 응답 검증 후 {기사 id: 요약} 반환
+
+    요청하지 않은 id, 중복 id, 비어 있는 요약은 버리고, JSON이 아니거나 형식이 다르면
+    빈 딕셔너리를 반환한다 (빠진 기사는 호출 측에서 다시 요청).
+    """
+    try:
+        data = json.loads(response_content or '')
+    except json.JSONDecodeError:
+        return {}
+
+    entries = data.get('summaries') if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        return {}
+
+    wanted = set(article_ids)
+    summaries = {}
+    for entry in entries:
+        accepted = _accept_summary(entry, wanted, summaries)
+        if accepted:
+            summaries[accepted[0]] = accepted[1]
+
+    return summaries
+
+
+def _accept_summary(entry, wanted: set, seen) -> Optional[Tuple[str, str]]:
+    """응답 항목 하나가 요청한 기사의 첫 유효 요약이면 (id, 요약) 반환"""
+    if not isinstance(entry, dict):
+        return None
+
+    article_id = str(entry.get('id', '')).strip()
+    summary = entry.get('summary_ko')
+    if article_id in wanted and article_id not in seen and isinstance(summary, str):
+        summary = clean_summary_text(summary)
+        if summary:
+            return article_id, summary
+    return None
+
+
+class SummaryLineParser:
+    """스트리밍 응답의 JSON Lines를 받는 대로 파싱해 완성된 기사 요약을 돌려주는 파서"""
+
+    def __init__(self, article_ids: List[str]):
+        self.wanted = set(article_ids)
+        self.seen = set()
+        self._buffer = ''
+
+    def feed(self, text: str) -> List[Tuple[str, str]]:
+        """새로 받은 텍스트를 추가하고 줄이 끝난 요약들 반환"""
+        self._buffer += text or ''
+        *lines, self._buffer = self._buffer.split('\n')
+        return self._parse_lines(lines)
+
+    def finish(self) -> List[Tuple[str, str]]:
+        """스트림 종료 시 마지막 줄 처리"""
+        lines, self._buffer = [self._buffer], ''
+        return self._parse_lines(lines)
+
+    def _parse_lines(self, lines: List[str]) -> List[Tuple[str, str]]:
+        """줄 단위 JSON 파싱 (코드 블록 표시, 배열 괄호, 줄 끝 쉼표는 무시)"""
+        results = []
+        for line in lines:
+            line = line.strip().lstrip('[').rstrip(',]').strip()
+            if not line.startswith('{'):
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
                 continue
-            else:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "error_type": "unknown",
-                    "original_content": content[:200] + "..." if len(content) > 200 else content
-                }
 
-    # 모든 재시도 실패
+            accepted = _accept_summary(entry, self.wanted, self.seen)
+            if accepted:
+                self.seen.add(accepted[0])
+                results.append(accepted)
+        return results
+
+
+def _batch_success(items: List[Dict], article_ids: List[str], chat_completion, model: str, attempt: int) -> Dict[str, any]:
+    """JSON 배치 응답을 기사 id별 요약으로 분리한 성공 결과"""
+    response_content = chat_completion.choices[0].message.content
+    summaries = parse_batch_summaries(response_content, article_ids)
+
+    if len(summaries) < len(items):
+        print(f"경고: 응답에서 {len(items) - len(summaries)}개 기사의 요약이 빠졌거나 형식이 잘못되었습니다", file=sys.stderr)
+        print(f"원본 응답:\n{(response_content or '')[:500]}...", file=sys.stderr)
+
+    return {
+        "success": True,
+        "summaries": summaries,
+        "tokens_used": chat_completion.usage.total_tokens,
+        "model_used": model,
+        "chunk_size": len(items),
+        "attempt": attempt + 1
+    }
+
+
+def _batch_failure(error: Exception, attempt: int, max_retries: int) -> Optional[Dict[str, any]]:
+    """배치 요약 예외 처리 (재시도하면 None, 더 이상 재시도하지 않으면 실패 결과)"""
+    wait_time = _retry_wait(error, attempt)
+    can_retry = attempt < max_retries - 1
+
+    if is_rate_limit_error(error):
+        print(f"Rate limit exceeded, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
+        return None if can_retry else {
+            "success": False,
+            "error": f"Rate limit exceeded after {max_retries} attempts",
+            "error_type": "rate_limit"
+        }
+
+    print(f"Batch error, waiting {wait_time}s (attempt {attempt + 1}/{max_retries}): {error}", file=sys.stderr)
+    return None if can_retry else {
+        "success": False,
+        "error": str(error),
+        "error_type": "unknown"
+    }
+
+
+def _batch_exhausted(max_retries: int) -> Dict[str, any]:
+    """모든 재시도 실패 결과"""
     return {
         "success": False,
         "error": f"All {max_retries} attempts failed",
-        "error_type": "max_retries_exceeded",
-        "original_content": content[:200] + "..." if len(content) > 200 else content
+        "error_type": "max_retries_exceeded"
     }
 
 
-def extract_korean_summary(response: str) -> str:
-    """응답에서 한국어 요약 부분 추출"""
-    lines = response.split('\n')
-    korean_lines = []
+def _batch_round(summaries: List[Optional[str]], pending: List[int], article_ids: List[str],
+                 round_result: Dict) -> List[int]:
+    """한 번의 배치 응답을 항목 위치에 반영하고 아직 요약이 없는 위치 반환"""
+    for index in pending:
+        summary = round_result['summaries'].get(article_ids[index])
+        if summary:
+            summaries[index] = summary
+    return [index for index in pending if summaries[index] is None]
 
-    # 한국어가 포함된 줄들을 찾기
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
 
-        # 한글이 포함된 줄인지 확인
-        if any('\u3131' <= char <= '\u3163' or '\uac00' <= char <= '\ud7af' for char in line):
-            # "- " 접두사 제거
-            if line.startswith('- '):
-                line = line[2:]
-            korean_lines.append(line)
+def _split_in_half(group: List[int]) -> List[List[int]]:
+    """요청 자체가 실패한 기사 묶음을 다음 라운드에 나눠 보낼 두 묶음으로 분할"""
+    middle = (len(group) + 1) // 2
+    return [part for part in (group[:middle], group[middle:]) if part]
 
-    if korean_lines:
-        return ' '.join(korean_lines)
-    else:
-        # 한국어를 찾을 수 없으면 전체 응답에서 마지막 부분 사용
-        return response.split('\n')[-1].strip() if response else "요약을 생성할 수 없습니다."
+
+def _warn_chunk_size(chunk_size: Optional[int]):
+    """더 이상 쓰지 않는 chunk_size 인자 경고 (배치 크기는 호출 측에서 토큰 예산으로 나눔)"""
+    if chunk_size is not None:
+        warnings.warn("chunk_size is ignored; split items with plan_batches before calling",
+                      DeprecationWarning, stacklevel=3)
 
 
-def summarize_and_translate_batch(items: List[Dict], api_key: str, model: str = "llama-3.1-8b-instant", chunk_size: int = 5, max_retries: int = 3) -> Dict[str, any]:
+def _batch_result(items: List[Dict], summaries: List[Optional[str]], tokens: int, requests: int,
+                  model: str) -> Dict[str, any]:
+    """누락분 재요청까지 마친 배치 결과 (summaries는 항목 순서대로, 끝내 빠진 항목은 None)"""
+    missing = sum(1 for summary in summaries if summary is None)
+    if missing:
+        print(f"경고: {MAX_PARTIAL_RETRIES}회 재요청 후에도 {missing}개 기사의 요약이 없습니다", file=sys.stderr)
+
+    return {
+        "success": True,
+        "summaries": summaries,
+        "missing_count": missing,
+        "tokens_used": tokens,
+        "requests": requests,
+        "model_used": model,
+        "chunk_size": len(items)
+    }
+
+
+def _summarize_batch_once(items: List[Dict], article_ids: List[str], model: str, max_retries: int,
+                          client: Groq, limiter: Optional[RateLimiter]) -> Dict[str, any]:
+    """배치 요청 한 번 (API 오류 시 재시도)"""
+    request, reserve_tokens = _batch_request(items, model, article_ids)
+
+    for attempt in range(max_retries):
+        try:
+            chat_completion = _create_completion(client, limiter, reserve_tokens, **request)
+            return _batch_success(items, article_ids, chat_completion, model, attempt)
+        except Exception as e:
+            failure = _batch_failure(e, attempt, max_retries)
+            if failure is not None:
+                return failure
+            _wait_before_retry(e, attempt, limiter)
+
+    return _batch_exhausted(max_retries)
+
+
+async def _summarize_batch_once_async(items: List[Dict], article_ids: List[str], model: str, max_retries: int,
+                                      client: AsyncGroq, limiter: Optional[RateLimiter]) -> Dict[str, any]:
+    """_summarize_batch_once의 asyncio 버전"""
+    request, reserve_tokens = _batch_request(items, model, article_ids)
+
+    for attempt in range(max_retries):
+        try:
+            chat_completion = await _create_completion_async(client, limiter, reserve_tokens, **request)
+            return _batch_success(items, article_ids, chat_completion, model, attempt)
+        except Exception as e:
+            failure = _batch_failure(e, attempt, max_retries)
+            if failure is not None:
+                return failure
+            await _wait_before_retry_async(e, attempt, limiter)
+
+    return _batch_exhausted(max_retries)
+
+
+def summarize_and_translate_batch(items: List[Dict], api_key: str, model: str = "llama-3.1-8b-instant",
+                                  chunk_size: Optional[int] = None, max_retries: int = 3,
+                                  client: Optional[Groq] = None, limiter: Optional[RateLimiter] = None) -> Dict[str, any]:
     """
     배치로 여러 뉴스를 한 번에 요약 및 번역 (토큰 절감)
 
+    기사마다 id를 붙여 JSON 응답을 요청하고, 응답에서 빠지거나 형식이 잘못된 기사만
+    최대 MAX_PARTIAL_RETRIES회 다시 요청한다. 재시도 후에도 요청 자체가 실패하면(타임아웃, 5xx 등)
+    그 묶음 전체를 누락으로 보고 다음 라운드에 반씩 나눠 다시 요청한다.
+
     Args:
         items: 뉴스 항목 리스트
         api_key: Groq API 키
         model: 사용할 모델명
-        chunk_size: 한 번에 처리할 뉴스 개수 (기본 5개)
+        chunk_size: 사용하지 않음 (지정하면 DeprecationWarning, 배치 크기는 plan_batches로 정함)
         max_retries: 최대 재시도 횟수
+        client: 공유 Groq 클라이언트 (없으면 새로 생성)
+        limiter: 공유 rate limit 제한기 (없으면 제한 없이 요청)
 
     Returns:
-        배치 처리 결과 딕셔너리
+        배치 처리 결과 딕셔너리 (summaries는 항목 순서대로, 요약을 받지 못한 항목은 None)
     """
-    client = Groq(api_key=api_key)
+    _warn_chunk_size(chunk_size)
+    client = client or Groq(api_key=api_key)
+    article_ids = _batch_article_ids(len(items))
+    summaries: List[Optional[str]] = [None] * len(items)
+    groups = [list(range(len(items)))]
+    tokens = requests = 0
+    failure = None
+
+    for _ in range(MAX_PARTIAL_RETRIES + 1):
+        next_groups = []
+        for group in groups:
+            round_result = _summarize_batch_once([items[i] for i in group], [article_ids[i] for i in group],
+                                                 model, max_retries, client, limiter)
+            if not round_result['success']:
+                failure = round_result
+                next_groups.extend(_split_in_half(group))
+                continue
 
-    system_prompt = """You are a professional AI news summarizer and translator. Your task is to:
-1. Summarize each given English news article into 4-6 detailed sentences (80-120 words)
-2. Translate each summary into natural, fluent Korean (at least 4-5 sentences)
-3. Focus on: what happened, why it's important, context/background, and potential impact
-4. Use formal but accessible Korean language suitable for a tech-savvy audience
-5. Ensure Korean translation is comprehensive and informative, not just a brief overview
+            tokens += round_result['tokens_used']
+            requests += 1
+            missing = _batch_round(summaries, group, article_ids, round_result)
+            if missing:
+                next_groups.append(missing)
+
+        groups = next_groups
+        if not groups:
+            break
+        print(f"누락된 {sum(len(group) for group in groups)}개 기사만 다시 요청합니다", file=sys.stderr)
+
+    if failure is not None and not requests:
+        return failure
+    return _batch_result(items, summaries, tokens, requests, model)
+
+
+async def summarize_and_translate_batch_async(items: List[Dict], api_key: str, model: str = "llama-3.1-8b-instant",
+                                              chunk_size: Optional[int] = None, max_retries: int = 3,
+                                              client: Optional[AsyncGroq] = None,
+                                              limiter: Optional[RateLimiter] = None) -> Dict[str, any]:
+    """summarize_and_translate_batch의 asyncio 버전 (결과 딕셔너리 형식 동일, 기본은 공유 비동기 클라이언트)"""
+    _warn_chunk_size(chunk_size)
+    client = client or get_async_groq_client(api_key)
+    article_ids = _batch_article_ids(len(items))
+    summaries: List[Optional[str]] = [None] * len(items)
+    groups = [list(range(len(items)))]
+    tokens = requests = 0
+    failure = None
+
+    for _ in range(MAX_PARTIAL_RETRIES + 1):
+        next_groups = []
+        for group in groups:
+            round_result = await _summarize_batch_once_async([items[i] for i in group],
+                                                             [article_ids[i] for i in group],
+                                                             model, max_retries, client, limiter)
+            if not round_result['success']:
+                failure = round_result
+                next_groups.extend(_split_in_half(group))
+                continue
+
+            tokens += round_result['tokens_used']
+            requests += 1
+            missing = _batch_round(summaries, group, article_ids, round_result)
+            if missing:
+                next_groups.append(missing)
+
+        groups = next_groups
+        if not groups:
+            break
+        print(f"누락된 {sum(len(group) for group in groups)}개 기사만 다시 요청합니다", file=sys.stderr)
 
-You will receive multiple articles numbered. For each article, provide:
-- A 4-6 sentence English summary (80-120 words)
-- A detailed Korean translation (at least 4-5 sentences)
+    if failure is not None and not requests:
+        return failure
+    return _batch_result(items, summaries, tokens, requests, model)
 
-Format your response as:
-Article N:
-[Detailed Korean summary - 4-5 sentences minimum]
 
----"""
+def _open_stream(client: Groq, limiter: Optional[RateLimiter], reserve_tokens: int, **kwargs):
+    """제한기에서 예약한 뒤 스트리밍 응답 열기 (스트림과 응답 헤더 반환)"""
+    if limiter is not None:
+        limiter.acquire(reserve_tokens)
+    try:
+        raw_response = client.chat.completions.with_raw_response.create(**kwargs)
+    except Exception as e:
+        _settle(limiter, reserve_tokens, 0, error_headers(e))
+        raise
+    return raw_response.parse(), raw_response.headers
+
+
+async def _open_stream_async(client: AsyncGroq, limiter: Optional[RateLimiter], reserve_tokens: int, **kwargs):
+    """_open_stream의 asyncio 버전"""
+    if limiter is not None:
+        await limiter.acquire_async(reserve_tokens)
+    try:
+        raw_response = await client.chat.completions.with_raw_response.create(**kwargs)
+    except Exception as e:
+        _settle(limiter, reserve_tokens, 0, error_headers(e))
+        raise
+    return await raw_response.parse(), raw_response.headers
 
-    combined_content = "\n\n".join([
-        f"Article {i+1}: {item.get('title', 'Untitled')}\n{item.get('content', '')[:1000]}"
-        for i, item in enumerate(items)
-    ])
 
-    user_prompt = f"""Please summarize and translate these {len(items)} AI/tech news articles:
+def _chunk_text(chunk) -> str:
+    """스트리밍 청크의 텍스트 조각"""
+    if not chunk.choices:
+        return ''
+    return chunk.choices[0].delta.content or ''
 
-{combined_content}
 
-Provide detailed Korean summaries for each article (4-5 sentences minimum), separated by '---'."""
+def _chunk_usage(chunk) -> Optional[int]:
+    """마지막 스트리밍 청크에 담긴 사용 토큰 수 (Groq는 x_groq.usage, OpenAI 호환은 usage)"""
+    usage = getattr(getattr(chunk, 'x_groq', None), 'usage', None) or getattr(chunk, 'usage', None)
+    return getattr(usage, 'total_tokens', None)
+
+
+def _stream_batch_once(items: List[Dict], article_ids: List[str], model: str, max_retries: int,
+                       client: Groq, limiter: Optional[RateLimiter], stats: Dict) -> Iterator[Tuple[str, str]]:
+    """스트리밍 배치 요청 한 번 (기사 요약이 한 줄 완성될 때마다 (id, 요약) 반환)
+
+    스트림을 열기 전의 API 오류는 재시도하고, 스트림 도중 끊기면 그때까지 받은 요약만 남긴다
+    (빠진 기사는 호출 측에서 다시 요청). 실패 결과는 stats['error']에 기록한다.
+    """
+    request, reserve_tokens = _batch_request(items, model, article_ids, stream=True)
 
     for attempt in range(max_retries):
         try:
-            chat_completion = client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                model=model,
-                temperature=0.3,
-                max_tokens=800 * len(items),
-                top_p=1,
-                stop=None,
-                stream=False
-            )
+            stream, headers = _open_stream(client, limiter, reserve_tokens, **request)
+        except Exception as e:
+            failure = _batch_failure(e, attempt, max_retries)
+            if failure is not None:
+                stats['error'] = failure
+                return
+            _wait_before_retry(e, attempt, limiter)
+            continue
+
+        parser = SummaryLineParser(article_ids)
+        used_tokens = None
+        try:
+            for chunk in stream:
+                used_tokens = _chunk_usage(chunk) or used_tokens
+                yield from parser.feed(_chunk_text(chunk))
+            yield from parser.finish()
+        except Exception as e:
+            print(f"스트리밍 응답이 중단되었습니다: {e}", file=sys.stderr)
+        finally:
+            stream.close()
+            _settle(limiter, reserve_tokens, used_tokens or reserve_tokens, headers)
+            stats['tokens_used'] += used_tokens or 0
+            stats['requests'] += 1
+        return
+
+    stats['error'] = _batch_exhausted(max_retries)
 
-            response_content = chat_completion.choices[0].message.content
-
-            # 배치 응답 파싱 개선
-            summaries = []
-            raw_splits = response_content.split('---')
-
-            for s in raw_splits:
-                stripped = s.strip()
-                if stripped:
-                    # "Article N:" 헤더 제거
-                    lines = stripped.split('\n')
-                    clean_lines = [line for line in lines if not line.strip().startswith('Article')]
-                    summary_text = '\n'.join(clean_lines).strip()
-                    if summary_text:
-                        summaries.append(summary_text)
-
-            # 응답 개수가 요청 개수보다 적으면 경고
-            if len(summaries) < len(items):
-                print(f"경고: 응답 개수({len(summaries)})가 요청 개수({len(items)})보다 적습니다", file=sys.stderr)
-                print(f"원본 응답:\n{response_content[:500]}...", file=sys.stderr)
-
-            return {
-                "success": True,
-                "summaries": summaries,
-                "tokens_used": chat_completion.usage.total_tokens,
-                "model_used": model,
-                "chunk_size": len(items),
-                "attempt": attempt + 1
-            }
-
-        except groq.RateLimitError as e:
-            wait_time = 2 ** attempt
-            print(f"Rate limit exceeded, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})", file=sys.stderr)
-            if attempt < max_retries - 1:
-                time.sleep(wait_time)
-                continue
-            else:
-                return {
-                    "success": False,
-                    "error": f"Rate limit exceeded after {max_retries} attempts",
-                    "error_type": "rate_limit"
-                }
 
+async def _stream_batch_once_async(items: List[Dict], article_ids: List[str], model: str, max_retries: int,
+                                   client: AsyncGroq, limiter: Optional[RateLimiter],
+                                   stats: Dict) -> AsyncIterator[Tuple[str, str]]:
+    """_stream_batch_once의 asyncio 버전"""
+    request, reserve_tokens = _batch_request(items, model, article_ids, stream=True)
+
+    for attempt in range(max_retries):
+        try:
+            stream, headers = await _open_stream_async(client, limiter, reserve_tokens, **request)
         except Exception as e:
-            wait_time = 2 ** attempt
-            print(f"Batch error, waiting {wait_time}s (attempt {attempt + 1}/{max_retries}): {e}", file=sys.stderr)
-            if attempt < max_retries - 1:
-                time.sleep(wait_time)
-                continue
-            else:
-                return {
-                    "success": False,
-                    "error": str(e),
-                    "error_type": "unknown"
-                }
+            failure = _batch_failure(e, attempt, max_retries)
+            if failure is not None:
+                stats['error'] = failure
+                return
+            await _wait_before_retry_async(e, attempt, limiter)
+            continue
 
-    return {
-        "success": False,
-        "error": f"All {max_retries} attempts failed",
-        "error_type": "max_retries_exceeded"
+        parser = SummaryLineParser(article_ids)
+        used_tokens = None
+        try:
+            async for chunk in stream:
+                used_tokens = _chunk_usage(chunk) or used_tokens
+                for summary in parser.feed(_chunk_text(chunk)):
+                    yield summary
+            for summary in parser.finish():
+                yield summary
+        except Exception as e:
+            print(f"스트리밍 응답이 중단되었습니다: {e}", file=sys.stderr)
+        finally:
+            await stream.close()
+            _settle(limiter, reserve_tokens, used_tokens or reserve_tokens, headers)
+            stats['tokens_used'] += used_tokens or 0
+            stats['requests'] += 1
+        return
+
+    stats['error'] = _batch_exhausted(max_retries)
+
+
+def _stream_event(index: int, summary: str) -> Dict[str, any]:
+    """스트리밍 요약 결과 하나 (index는 배치 안 위치)"""
+    return {"index": index, "success": True, "summary_ko": summary}
+
+
+def _stream_missing(pending: List[int], stats: Dict) -> List[Dict[str, any]]:
+    """재요청 후에도 요약을 받지 못한 기사들의 실패 결과"""
+    error = stats.get('error') or {
+        "error": "Summary not found in batch response",
+        "error_type": "missing_in_batch"
     }
+    return [
+        {"index": index, "success": False, "error": error['error'], "error_type": error['error_type']}
+        for index in pending
+    ]
 
 
-def process_news_items(items: List[Dict], use_batch: bool = True, batch_size: int = 5) -> Dict[str, any]:
-    """뉴스 항목들을 배치 또는 개별 처리"""
-    config = load_groq_config()
+def summarize_and_translate_batch_stream(items: List[Dict], api_key: str, model: str = "llama-3.1-8b-instant",
+                                         max_retries: int = 3, client: Optional[Groq] = None,
+                                         limiter: Optional[RateLimiter] = None,
+                                         stats: Optional[Dict] = None) -> Iterator[Dict[str, any]]:
+    """
+    배치 요약을 스트리밍으로 요청하여 기사 요약이 완성되는 대로 하나씩 반환
 
+    응답 전체를 기다리지 않으므로 호출 측은 첫 기사부터 DB 저장이나 뉴스레터 구성을 시작할 수 있다.
+    응답에서 빠진 기사만 최대 MAX_PARTIAL_RETRIES회 다시 요청하며, 끝내 받지 못한 기사는
+    마지막에 실패 결과로 반환한다.
+
+    Args:
+        items: 뉴스 항목 리스트
+        api_key: Groq API 키
+        model: 사용할 모델명
+        max_retries: 요청별 최대 재시도 횟수
+        client: 공유 Groq 클라이언트 (없으면 새로 생성)
+        limiter: 공유 rate limit 제한기 (없으면 제한 없이 요청)
+        stats: 사용 토큰 수와 요청 수를 누적할 딕셔너리 (선택)
+
+    Yields:
+        {"index", "success", "summary_ko"} 또는 {"index", "success", "error", "error_type"} (도착 순서)
+    """
+    client = client or Groq(api_key=api_key)
+    stats = stats if stats is not None else {}
+    stats.setdefault('tokens_used', 0)
+    stats.setdefault('requests', 0)
+    article_ids = _batch_article_ids(len(items))
+    positions = {article_id: index for index, article_id in enumerate(article_ids)}
+    pending = list(range(len(items)))
+
+    for _ in range(MAX_PARTIAL_RETRIES + 1):
+        stats.pop('error', None)
+        received = set()
+        for article_id, summary in _stream_batch_once([items[i] for i in pending], [article_ids[i] for i in pending],
+                                                      model, max_retries, client, limiter, stats):
+            received.add(positions[article_id])
+            yield _stream_event(positions[article_id], summary)
+
+        pending = [index for index in pending if index not in received]
+        if not pending or (stats.get('error') and not received):
+            break
+        print(f"누락된 {len(pending)}개 기사만 다시 요청합니다", file=sys.stderr)
+
+    yield from _stream_missing(pending, stats)
+
+
+async def summarize_and_translate_batch_stream_async(items: List[Dict], api_key: str,
+                                                     model: str = "llama-3.1-8b-instant", max_retries: int = 3,
+                                                     client: Optional[AsyncGroq] = None,
+                                                     limiter: Optional[RateLimiter] = None,
+                                                     stats: Optional[Dict] = None) -> AsyncIterator[Dict[str, any]]:
+    """summarize_and_translate_batch_stream의 asyncio 버전 (async for로 사용)"""
+    client = client or get_async_groq_client(api_key)
+    stats = stats if stats is not None else {}
+    stats.setdefault('tokens_used', 0)
+    stats.setdefault('requests', 0)
+    article_ids = _batch_article_ids(len(items))
+    positions = {article_id: index for index, article_id in enumerate(article_ids)}
+    pending = list(range(len(items)))
+
+    for _ in range(MAX_PARTIAL_RETRIES + 1):
+        stats.pop('error', None)
+        received = set()
+        async for article_id, summary in _stream_batch_once_async(
+                [items[i] for i in pending], [article_ids[i] for i in pending],
+                model, max_retries, client, limiter, stats):
+            received.add(positions[article_id])
+            yield _stream_event(positions[article_id], summary)
+
+        pending = [index for index in pending if index not in received]
+        if not pending or (stats.get('error') and not received):
+            break
+        print(f"누락된 {len(pending)}개 기사만 다시 요청합니다", file=sys.stderr)
+
+    for event in _stream_missing(pending, stats):
+        yield event
+
+
+def _fallback_item(item: Dict, error: str, error_type: Optional[str] = None) -> Dict:
+    """요약 실패 항목 (원문 앞부분을 요약 대신 사용)"""
+    processed_item = item.copy()
+    processed_item['summary_ko'] = item.get('content', '')[:500] + "..."
+    processed_item['summarized'] = False
+    processed_item['summary_error'] = error
+    if error_type:
+        processed_item['error_type'] = error_type
+    return processed_item
+
+
+def _single_item(item: Dict, result: Dict) -> Dict:
+    """단건 요약 결과를 항목에 반영"""
+    if result['success']:
+        processed_item = item.copy()
+        processed_item['summary_ko'] = result['summary_ko']
+        processed_item['summarized'] = True
+        processed_item['tokens_used'] = result.get('tokens_used', 0)
+        print(f"성공: {item['title'][:30]}... ({result.get('tokens_used', 0)} tokens)", file=sys.stderr)
+        return processed_item
+
+    print(f"실패: {item['title'][:30]}... - {result['error']}", file=sys.stderr)
+    return _fallback_item(item, result['error'], result.get('error_type', 'unknown'))
+
+
+def _batch_items(chunk: List[Dict], batch_result: Dict, chunk_num: int) -> Tuple[List[Dict], int]:
+    """배치 요약 결과를 항목별로 반영 (처리 항목과 사용 토큰 반환)
+
+    배치 요청 자체가 실패했거나 재요청 후에도 요약이 빠진 항목은 개별 요청 없이 실패 항목으로 둔다.
+    요약 캐시에 저장되지 않으므로 다음 실행에서 다시 요약된다.
+    """
+    if not batch_result['success']:
+        error = batch_result.get('error', 'Unknown')
+        print(f"배치 {chunk_num} 실패: {error}", file=sys.stderr)
+        return [_fallback_item(item, error, batch_result.get('error_type', 'unknown')) for item in chunk], 0
+
+    summaries = batch_result['summaries']
+    tokens = batch_result['tokens_used']
+    summarized_count = sum(1 for summary in summaries if summary is not None)
     processed_items = []
-    total_items = len(items)
-    successful_count = 0
-    failed_count = 0
-    total_tokens = 0
 
-    print(f"Groq API 요약 시작: {total_items}개 항목 (배치 모드: {use_batch}, 배치 크기: {batch_size})", file=sys.stderr)
+    for item, summary in zip(chunk, summaries):
+        if summary is not None:
+            processed_item = item.copy()
+            processed_item['summary_ko'] = summary
+            processed_item['summarized'] = True
+            processed_item['tokens_used'] = tokens // summarized_count
+            processed_items.append(processed_item)
+        else:
+            processed_items.append(_fallback_item(item, "Summary not found in batch response", "missing_in_batch"))
+
+    print(f"배치 {chunk_num} 완료: {summarized_count}/{len(chunk)}개 요약, "
+          f"{batch_result['requests']}회 요청, {tokens} 토큰 사용", file=sys.stderr)
+    return processed_items, tokens
+
+
+def _process_single(item: Dict, config: Dict, client: Groq, limiter: RateLimiter) -> Dict:
+    """항목 하나 요약 (성공 여부와 사용 토큰 포함)"""
+    result = summarize_and_translate(
+        item.get('content', ''),
+        config['api_key'],
+        config['model'],
+        client=client,
+        limiter=limiter
+    )
+    return _single_item(item, result)
+
+
+async def _process_single_async(item: Dict, config: Dict, client: AsyncGroq, limiter: RateLimiter) -> Dict:
+    """_process_single의 asyncio 버전"""
+    result = await summarize_and_translate_async(
+        item.get('content', ''),
+        config['api_key'],
+        config['model'],
+        client=client,
+        limiter=limiter
+    )
+    return _single_item(item, result)
+
+
+def _process_chunk(chunk: List[Dict], chunk_num: int, total_chunks: int,
+                   config: Dict, client: Groq, limiter: RateLimiter) -> Tuple[List[Dict], int]:
+    """배치 하나 요약 (처리 항목과 사용 토큰 반환)"""
+    print(f"배치 {chunk_num}/{total_chunks} 처리 중 ({len(chunk)}개 뉴스)...", file=sys.stderr)
+
+    batch_result = summarize_and_translate_batch(
+        chunk,
+        config['api_key'],
+        config['model'],
+        client=client,
+        limiter=limiter
+    )
+
+    return _batch_items(chunk, batch_result, chunk_num)
+
+
+async def _process_chunk_async(chunk: List[Dict], chunk_num: int, total_chunks: int,
+                               config: Dict, client: AsyncGroq, limiter: RateLimiter) -> Tuple[List[Dict], int]:
+    """_process_chunk의 asyncio 버전"""
+    print(f"배치 {chunk_num}/{total_chunks} 처리 중 ({len(chunk)}개 뉴스)...", file=sys.stderr)
+
+    batch_result = await summarize_and_translate_batch_async(
+        chunk,
+        config['api_key'],
+        config['model'],
+        client=client,
+        limiter=limiter
+    )
+
+    return _batch_items(chunk, batch_result, chunk_num)
+
+
+def _lookup_cached(items: List[Dict], cache: Optional[SummaryCache], model: str) -> Tuple[List[Optional[Dict]], List[int]]:
+    """캐시에 요약이 있는 항목은 바로 채우고, 요약이 필요한 항목의 인덱스 반환"""
+    results = [None] * len(items)
+    pending_indices = []
+
+    for i, item in enumerate(items):
+        cached = None
+        if cache is not None:
+            cached = cache.get(summary_cache_key(model, item.get('title', ''), item.get('content', '')))
+
+        if cached:
+            processed_item = item.copy()
+            processed_item['summary_ko'] = cached['summary_ko']
+            processed_item['summarized'] = True
+            processed_item['tokens_used'] = 0
+            processed_item['summary_cached'] = True
+            results[i] = processed_item
+        else:
+            pending_indices.append(i)
 
-    if use_batch and total_items > 1:
-        # 배치 처리 모드
-        for i in range(0, total_items, batch_size):
-            chunk = items[i:i+batch_size]
-            chunk_num = i // batch_size + 1
-            total_chunks = (total_items + batch_size - 1) // batch_size
-
-            print(f"배치 {chunk_num}/{total_chunks} 처리 중 ({len(chunk)}개 뉴스)...", file=sys.stderr)
-
-            batch_result = summarize_and_translate_batch(
-                chunk,
-                config['api_key'],
-                config['model'],
-                chunk_size=len(chunk)
-            )
+    return results, pending_indices
 
-            if batch_result['success']:
-                summaries = batch_result['summaries']
-                tokens = batch_result['tokens_used']
-                total_tokens += tokens
-
-                for j, item in enumerate(chunk):
-                    processed_item = item.copy()
-                    if j < len(summaries):
-                        processed_item['summary_ko'] = summaries[j]
-                        processed_item['summarized'] = True
-                        processed_item['tokens_used'] = tokens // len(chunk)
-                        successful_count += 1
-                    else:
-                        processed_item['summary_ko'] = item.get('content', '')[:500] + "..."
-                        processed_item['summarized'] = False
-                        processed_item['summary_error'] = "Summary not found in batch response"
-                        failed_count += 1
-                    processed_items.append(processed_item)
-
-                print(f"배치 {chunk_num} 성공: {len(chunk)}개 처리, {tokens} 토큰 사용", file=sys.stderr)
-            else:
-                # 배치 실패 시 개별 처리로 폴백
-                print(f"배치 {chunk_num} 실패, 개별 처리로 전환: {batch_result.get('error', 'Unknown')}", file=sys.stderr)
-                for item in chunk:
-                    result = summarize_and_translate(
-                        item.get('content', ''),
-                        config['api_key'],
-                        config['model']
-                    )
-                    processed_item = item.copy()
-                    if result['success']:
-                        processed_item['summary_ko'] = result['summary_ko']
-                        processed_item['summarized'] = True
-                        processed_item['tokens_used'] = result.get('tokens_used', 0)
-                        successful_count += 1
-                        total_tokens += result.get('tokens_used', 0)
-                    else:
-                        processed_item['summary_ko'] = item.get('content', '')[:500] + "..."
-                        processed_item['summarized'] = False
-                        processed_item['summary_error'] = result['error']
-                        failed_count += 1
-                    processed_items.append(processed_item)
-
-            if i + batch_size < total_items:
-                time.sleep(1)
 
-    else:
-        # 개별 처리 모드 (기존 로직)
-        for i, item in enumerate(items):
-            print(f"처리 중: {i+1}/{total_items} - {item['title'][:50]}...", file=sys.stderr)
-
-            result = summarize_and_translate(
-                item.get('content', ''),
-                config['api_key'],
-                config['model']
-            )
+def _request_items(items: List[Dict], indices: List[int], config: Dict, prepare: bool) -> Tuple[List[Dict], int]:
+    """요약 요청에 보낼 항목(본문을 정리/압축한 사본)과 줄인 본문 토큰 수"""
+    pending = [items[i] for i in indices]
+    if not prepare or not pending:
+        return pending, 0
 
-            processed_item = item.copy()
+    prepared = prepare_news_items(pending, config['content_tokens'])
+    return prepared['items'], prepared['preparation_stats']['tokens_saved']
 
-            if result['success']:
-                processed_item['summary_ko'] = result['summary_ko']
-                processed_item['summarized'] = True
-                processed_item['tokens_used'] = result.get('tokens_used', 0)
-                successful_count += 1
-                total_tokens += result.get('tokens_used', 0)
-                print(f"성공: {item['title'][:30]}... ({result.get('tokens_used', 0)} tokens)", file=sys.stderr)
-            else:
-                processed_item['summary_ko'] = item.get('content', '')[:500] + "..."
-                processed_item['summarized'] = False
-                processed_item['summary_error'] = result['error']
-                processed_item['error_type'] = result.get('error_type', 'unknown')
-                failed_count += 1
-                print(f"실패: {item['title'][:30]}... - {result['error']}", file=sys.stderr)
 
-            processed_items.append(processed_item)
+def _restore_content(originals: List[Dict], processed_items: List[Dict]):
+    """처리 결과의 본문을 요약 요청 전 원본으로 되돌리기 (출력과 캐시 키는 원본 기준)"""
+    for original, processed_item in zip(originals, processed_items):
+        if 'content' in original:
+            processed_item['content'] = original['content']
 
-            if i < total_items - 1:
-                time.sleep(0.5)
+
+def _cache_summary(cache: Optional[SummaryCache], model: str, item: Dict):
+    """새로 요약한 항목 하나를 캐시에 저장 (실패한 항목은 저장하지 않음)"""
+    if cache is not None and item.get('summarized'):
+        key = summary_cache_key(model, item.get('title', ''), item.get('content', ''))
+        cache.put(key, model, item['summary_ko'], item.get('tokens_used', 0))
+
+
+def _store_summaries(cache: Optional[SummaryCache], model: str, processed_items: List[Dict]):
+    """새로 요약한 항목을 캐시에 저장하고 캐시 정리"""
+    if cache is None:
+        return
+
+    for item in processed_items:
+        _cache_summary(cache, model, item)
+    cache.evict()
+
+
+def _processing_result(items: List[Dict], cache_results: List[Optional[Dict]], pending_indices: List[int],
+                       pending_processed: List[Dict], total_tokens: int, use_batch: bool,
+                       batch_size: Optional[int], batch_count: int,
+                       max_concurrency: int, limiter: RateLimiter, started_at: float,
+                       backend_name: str, content_tokens_saved: int = 0) -> Dict[str, any]:
+    """캐시 결과와 새 요약 결과를 입력 순서대로 합친 process_news_items 결과 딕셔너리"""
+    processed_items = list(cache_results)
+    for index, processed_item in zip(pending_indices, pending_processed):
+        processed_items[index] = processed_item
+
+    successful_count = sum(1 for item in processed_items if item.get('summarized'))
+    failed_count = len(processed_items) - successful_count
 
     return {
         "success": successful_count > 0,
         "processed_at": datetime.now().isoformat(),
-        "original_count": total_items,
+        "original_count": len(items),
         "final_count": len(processed_items),
         "items": processed_items,
         "processing_stats": {
             "successfully_summarized": successful_count,
             "summary_failed": failed_count,
             "total_tokens_used": total_tokens,
+            "cache_hits": len(items) - len(pending_indices),
+            "content_tokens_saved": content_tokens_saved,
+            "backend": backend_name,
             "batch_mode": use_batch,
-            "batch_size": batch_size if use_batch else 1
+            "batch_size": (batch_size or DEFAULT_MAX_BATCH_ITEMS) if use_batch else 1,   # 배치당 최대 기사 수
+            "batch_count": batch_count,
+            "average_batch_size": round(len(pending_processed) / batch_count, 2) if batch_count else 0,
+            "max_concurrency": max_concurrency,
+            "rate_limit_wait_seconds": round(limiter.total_wait, 2),
+            "elapsed_seconds": round(time.monotonic() - started_at, 2)
         }
     }
 
 
+def process_news_items(items: List[Dict], use_batch: bool = True, batch_size: Optional[int] = None,
+                       max_concurrency: Optional[int] = None, use_cache: bool = True,
+                       backend: Optional[Union[str, SummarizerBackend]] = None,
+                       prepare: bool = True) -> Dict[str, any]:
+    """뉴스 항목들을 배치 또는 개별 처리
+
+    요약 캐시에 있는 항목은 API를 호출하지 않고, 나머지 배치(또는 개별 항목)를
+    최대 max_concurrency개까지 동시에 요청한다. 요청 간격은 고정 대기 대신
+    분당 요청/토큰 한도 제한기로 조절한다. 결과 항목 순서는 입력 순서와 같다.
+    배치는 토큰 예산 안에서 최대한 많은 기사를 담으며, batch_size는 배치당 최대 기사 수다.
+    backend로 요약 백엔드(groq, openai, local 또는 SummarizerBackend 인스턴스)를 바꿀 수 있다.
+    prepare가 True이면 본문을 정리/압축한 사본으로 요청하고, 결과 항목에는 원본 본문을 유지한다.
+    """
+    config, summarizer = _load_backend(backend)
+    max_concurrency = max(1, max_concurrency or config['max_concurrency'])
+    client = summarizer.client()
+    limiter = RateLimiter(config['requests_per_minute'], config['tokens_per_minute'])
+    cache = SummaryCache() if use_cache else None
+
+    started_at = time.monotonic()
+    cache_results, pending_indices = _lookup_cached(items, cache, _cache_model(config, prepare))
+    pending, content_tokens_saved = _request_items(items, pending_indices, config, prepare)
+
+    print(f"요약 시작 ({summarizer.name}): {len(items)}개 항목 중 {len(pending)}개 요청, 캐시 {len(items) - len(pending)}개 "
+          f"(배치 모드: {use_batch}, 동시 요청: {max_concurrency})", file=sys.stderr)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        if use_batch and len(pending) > 1:
+            # 배치 처리 모드
+            chunks = _plan_chunks(pending, config, batch_size)
+            futures = [
+                executor.submit(_process_chunk, chunk, chunk_num, len(chunks), config, client, limiter)
+                for chunk_num, chunk in enumerate(chunks, start=1)
+            ]
+            processed_items = []
+            total_tokens = 0
+            for future in futures:
+                chunk_items, chunk_tokens = future.result()
+                processed_items.extend(chunk_items)
+                total_tokens += chunk_tokens
+        else:
+            # 개별 처리 모드
+            chunks = [[item] for item in pending]
+            futures = [executor.submit(_process_single, item, config, client, limiter) for item in pending]
+            processed_items = [future.result() for future in futures]
+            total_tokens = sum(item.get('tokens_used', 0) for item in processed_items)
+
+    _restore_content([items[i] for i in pending_indices], processed_items)
+    if cache is not None:
+        _store_summaries(cache, _cache_model(config, prepare), processed_items)
+        cache.close()
+
+    return _processing_result(items, cache_results, pending_indices, processed_items, total_tokens,
+                              use_batch, batch_size, len(chunks), max_concurrency, limiter, started_at,
+                              summarizer.name, content_tokens_saved)
+
+
+async def process_news_items_async(items: List[Dict], use_batch: bool = True, batch_size: Optional[int] = None,
+                                   max_concurrency: Optional[int] = None, config: Optional[Dict] = None,
+                                   limiter: Optional[RateLimiter] = None,
+                                   cache: Optional[SummaryCache] = None, use_cache: bool = True,
+                                   backend: Optional[Union[str, SummarizerBackend]] = None,
+                                   prepare: bool = True) -> Dict[str, any]:
+    """process_news_items의 asyncio 버전 (결과 딕셔너리 형식 동일)
+
+    공유 비동기 클라이언트를 사용하므로 수집/DB 저장 등 다른 코루틴과 같은 이벤트 루프에서
+    함께 실행할 수 있다. 장기 실행 서비스에서는 config, limiter, cache를 넘겨 호출 간에 재사용한다.
+    """
+    config, summarizer = _load_backend(backend, config)
+    max_concurrency = max(1, max_concurrency or config['max_concurrency'])
+    client = summarizer.async_client()
+    limiter = limiter or RateLimiter(config['requests_per_minute'], config['tokens_per_minute'])
+    owns_cache = cache is None and use_cache
+    if owns_cache:
+        cache = SummaryCache()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    started_at = time.monotonic()
+    cache_results, pending_indices = _lookup_cached(items, cache if use_cache else None, _cache_model(config, prepare))
+    pending, content_tokens_saved = _request_items(items, pending_indices, config, prepare)
+
+    print(f"비동기 요약 시작 ({summarizer.name}): {len(items)}개 항목 중 {len(pending)}개 요청, 캐시 {len(items) - len(pending)}개 "
+          f"(배치 모드: {use_batch}, 동시 요청: {max_concurrency})", file=sys.stderr)
+
+    async def bounded(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    if use_batch and len(pending) > 1:
+        # 배치 처리 모드
+        chunks = _plan_chunks(pending, config, batch_size)
+        results = await asyncio.gather(*[
+            bounded(_process_chunk_async(chunk, chunk_num, len(chunks), config, client, limiter))
+            for chunk_num, chunk in enumerate(chunks, start=1)
+        ])
+        processed_items = [item for chunk_items, _ in results for item in chunk_items]
+        total_tokens = sum(chunk_tokens for _, chunk_tokens in results)
+    else:
+        # 개별 처리 모드
+        chunks = [[item] for item in pending]
+        processed_items = list(await asyncio.gather(*[
+            bounded(_process_single_async(item, config, client, limiter)) for item in pending
+        ]))
+        total_tokens = sum(item.get('tokens_used', 0) for item in processed_items)
+
+    _restore_content([items[i] for i in pending_indices], processed_items)
+    if use_cache:
+        _store_summaries(cache, _cache_model(config, prepare), processed_items)
+        if owns_cache:
+            cache.close()
+
+    return _processing_result(items, cache_results, pending_indices, processed_items, total_tokens,
+                              use_batch, batch_size, len(chunks), max_concurrency, limiter, started_at,
+                              summarizer.name, content_tokens_saved)
+
+
+def _plan_chunk_indices(items: List[Dict], indices: List[int], config: Dict,
+                        batch_size: Optional[int]) -> List[List[int]]:
+    """토큰 예산 기준 배치를 입력 인덱스 목록으로 반환"""
+    chunks = _plan_chunks([items[i] for i in indices], config, batch_size)
+    chunk_indices = []
+    offset = 0
+    for chunk in chunks:
+        chunk_indices.append(indices[offset:offset + len(chunk)])
+        offset += len(chunk)
+    return chunk_indices
+
+
+def _stream_item(item: Dict, event: Dict) -> Dict:
+    """스트리밍 요약 결과를 항목에 반영"""
+    if event['success']:
+        processed_item = item.copy()
+        processed_item['summary_ko'] = event['summary_ko']
+        processed_item['summarized'] = True
+        return processed_item
+    return _fallback_item(item, event['error'], event['error_type'])
+
+
+def stream_news_items(items: List[Dict], batch_size: Optional[int] = None, max_concurrency: Optional[int] = None,
+                      use_cache: bool = True,
+                      backend: Optional[Union[str, SummarizerBackend]] = None,
+                      prepare: bool = True) -> Iterator[Tuple[int, Dict]]:
+    """뉴스 항목을 스트리밍으로 요약하여 (입력 인덱스, 처리 항목)을 완성되는 순서대로 반환
+
+    캐시에 있는 항목을 먼저 반환하고, 나머지는 토큰 예산 기준 배치를 최대 max_concurrency개까지
+    동시에 스트리밍 요청한다. process_news_items와 달리 반환 순서는 입력 순서가 아니다.
+    """
+    config, summarizer = _load_backend(backend)
+    max_concurrency = max(1, max_concurrency or config['max_concurrency'])
+    client = summarizer.client()
+    limiter = RateLimiter(config['requests_per_minute'], config['tokens_per_minute'])
+    cache = SummaryCache() if use_cache else None
+    results = queue.Queue()
+    stop = threading.Event()
+
+    def worker(chunk_indices: List[int]):
+        try:
+            if stop.is_set():
+                # 호출 측이 반복을 멈췄으면 새 스트리밍 요청을 열지 않음
+                return
+            events = summarize_and_translate_batch_stream(
+                [requests[i] for i in chunk_indices], config['api_key'], config['model'],
+                client=client, limiter=limiter
+            )
+            for event in events:
+                if stop.is_set():
+                    events.close()
+                    break
+                index = chunk_indices[event['index']]
+                results.put((index, _stream_item(items[index], event)))
+        finally:
+            results.put(None)
+
+    try:
+        cache_results, pending_indices = _lookup_cached(items, cache, _cache_model(config, prepare))
+        for index, cached_item in enumerate(cache_results):
+            if cached_item is not None:
+                yield index, cached_item
+
+        prepared, _ = _request_items(items, pending_indices, config, prepare)
+        requests = list(items)
+        for index, prepared_item in zip(pending_indices, prepared):
+            requests[index] = prepared_item
+
+        chunks = _plan_chunk_indices(requests, pending_indices, config, batch_size)
+        print(f"스트리밍 요약 시작 ({summarizer.name}): {len(pending_indices)}개 항목, {len(chunks)}개 배치 "
+              f"(동시 요청: {max_concurrency})", file=sys.stderr)
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        futures = [executor.submit(worker, chunk) for chunk in chunks]
+        try:
+            remaining = len(futures)
+            while remaining:
+                entry = results.get()
+                if entry is None:
+                    remaining -= 1
+                    continue
+                _cache_summary(cache, _cache_model(config, prepare), entry[1])
+                yield entry
+            for future in futures:
+                future.result()
+        finally:
+            # 반복을 일찍 멈추면 대기 중인 배치는 취소하고, 진행 중인 스트림은 다음 조각에서 닫히도록 기다리지 않음
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+    finally:
+        if cache is not None:
+            cache.evict()
+            cache.close()
+
+
+async def stream_news_items_async(items: List[Dict], batch_size: Optional[int] = None,
+                                  max_concurrency: Optional[int] = None, config: Optional[Dict] = None,
+                                  limiter: Optional[RateLimiter] = None, cache: Optional[SummaryCache] = None,
+                                  use_cache: bool = True,
+                                  backend: Optional[Union[str, SummarizerBackend]] = None,
+                                  prepare: bool = True) -> AsyncIterator[Tuple[int, Dict]]:
+    """stream_news_items의 asyncio 버전 (async for로 사용)"""
+    config, summarizer = _load_backend(backend, config)
+    max_concurrency = max(1, max_concurrency or config['max_concurrency'])
+    client = summarizer.async_client()
+    limiter = limiter or RateLimiter(config['requests_per_minute'], config['tokens_per_minute'])
+    owns_cache = cache is None and use_cache
+    if owns_cache:
+        cache = SummaryCache()
+    if not use_cache:
+        cache = None
+    semaphore = asyncio.Semaphore(max_concurrency)
+    results = asyncio.Queue()
+
+    async def worker(chunk_indices: List[int]):
+        try:
+            async with semaphore:
+                async for event in summarize_and_translate_batch_stream_async(
+                        [requests[i] for i in chunk_indices], config['api_key'], config['model'],
+                        client=client, limiter=limiter):
+                    index = chunk_indices[event['index']]
+                    await results.put((index, _stream_item(items[index], event)))
+        finally:
+            results.put_nowait(None)
+
+    tasks = []
+    try:
+        cache_results, pending_indices = _lookup_cached(items, cache, _cache_model(config, prepare))
+        for index, cached_item in enumerate(cache_results):
+            if cached_item is not None:
+                yield index, cached_item
+
+        prepared, _ = _request_items(items, pending_indices, config, prepare)
+        requests = list(items)
+        for index, prepared_item in zip(pending_indices, prepared):
+            requests[index] = prepared_item
+
+        chunks = _plan_chunk_indices(requests, pending_indices, config, batch_size)
+        print(f"비동기 스트리밍 요약 시작 ({summarizer.name}): {len(pending_indices)}개 항목, {len(chunks)}개 배치 "
+              f"(동시 요청: {max_concurrency})", file=sys.stderr)
+
+        tasks = [asyncio.create_task(worker(chunk)) for chunk in chunks]
+        remaining = len(tasks)
+        while remaining:
+            entry = await results.get()
+            if entry is None:
+                remaining -= 1
+                continue
+            _cache_summary(cache, _cache_model(config, prepare), entry[1])
+            yield entry
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # 취소가 끝날 때까지 기다려 대기 중이던 배치가 스트리밍 요청을 열지 않게 함
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if cache is not None:
+            cache.evict()
+            if owns_cache:
+                cache.close()
+
+
 def main():
     """CLI 진입점"""
-    if len(sys.argv) < 2:
+    # --backend, --no-cache, --stream, --no-prepare 옵션 분리
+    args = sys.argv[1:]
+    backend = None
+    if "--backend" in args:
+        position = args.index("--backend")
+        backend = args[position + 1] if position + 1 < len(args) else ""
+        del args[position:position + 2]
+
+    use_cache = "--no-cache" not in args
+    use_stream = "--stream" in args
+    prepare = "--no-prepare" not in args
+    args = [arg for arg in args if arg not in ("--no-cache", "--stream", "--no-prepare")]
+
+    if not args:
         print("Usage:")
         print("  groq_summarizer.py <json_file>  - Summarize items from JSON file")
         print("  groq_summarizer.py -            - Read items from stdin")
         print("  groq_summarizer.py test <text>  - Test single text summarization")
+        print("Options:")
+        print("  --no-cache                      - Ignore the summary cache and call the API for every item")
+        print("  --stream                        - Print each item as a JSON line as soon as it is summarized")
+        print("  --no-prepare                    - Send article content as-is (skip cleaning and compression)")
+        print(f"  --backend NAME                  - Summarizer backend ({', '.join(SUMMARIZER_BACKENDS)}; default from groq.yaml)")
         sys.exit(1)
 
-    command = sys.argv[1]
+    command = args[0]
 
     try:
         if command == "test":
-            if len(sys.argv) < 3:
+            if len(args) < 2:
                 print("Usage: groq_summarizer.py test <text_to_summarize>")
                 sys.exit(1)
 
-            config = load_groq_config()
-            text = sys.argv[2]
-            result = summarize_and_translate(text, config['api_key'], config['model'])
+            config, summarizer = _load_backend(backend)
+            text = args[1]
+            result = summarize_and_translate(text, config['api_key'], config['model'], client=summarizer.client())
             print(json.dumps(result, indent=2, ensure_ascii=False))
 
         else:
@@ -468,8 +1530,20 @@ def main():
             else:
                 raise ValueError("Invalid input format. Expected list or dict with 'items' key.")
 
+            if use_stream:
+                # 요약이 완성되는 대로 한 줄씩 출력 (JSON Lines)
+                failed = 0
+                for index, processed_item in stream_news_items(items, use_cache=use_cache,
+                                                                backend=backend, prepare=prepare):
+                    failed += 0 if processed_item.get('summarized') else 1
+                    print(json.dumps({"index": index, **processed_item}, ensure_ascii=False), flush=True)
+                if failed:
+                    print(f"Warning: {failed}개 항목의 요약이 실패했습니다.", file=sys.stderr)
+                    sys.exit(1)
+                return
+
             # 배치 처리 수행
-            result = process_news_items(items)
+            result = process_news_items(items, use_cache=use_cache, backend=backend, prepare=prepare)
 
             # 결과 출력
             print(json.dumps(result, indent=2, ensure_ascii=False))
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+HTTP Client for AI News Digest
+
+피드 수집기 등 여러 수집 도구가 공유하는 커넥션 풀 기반 HTTP 클라이언트.
+keep-alive로 같은 호스트의 TCP/TLS 연결을 재사용하고, gzip/brotli 압축을 협상하며,
+httpx와 h2가 설치된 경우 HTTP/2를 선택적으로 사용한다.
+"""
+
+import sys
+import threading
+import requests
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import brotli  # noqa: F401  (urllib3/httpx가 설치 여부로 br 디코딩 지원)
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+USER_AGENT = 'AI News Digest Bot 1.0'
+DEFAULT_POOL_HOSTS = 32         # 커넥션 풀을 유지할 호스트 수
+DEFAULT_POOL_PER_HOST = 2       # 호스트별 최대 연결 수
+DEFAULT_MAX_CONNECTIONS = 16    # HTTP/2 사용 시 전체 최대 연결 수
+
+# 호출 측에서 백엔드와 무관하게 잡을 수 있는 요청 예외
+HTTP_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx else ())
+
+
+class StreamedResponse:
+    """백엔드와 무관하게 본문을 청크 단위로 읽는 스트리밍 응답"""
+
+    def __init__(self, response, iter_chunks):
+        self._response = response
+        self._iter_chunks = iter_chunks
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    def raise_for_status(self):
+        """4xx/5xx 응답이면 예외 발생"""
+        self._response.raise_for_status()
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        """압축 해제된 본문을 청크 단위로 반환"""
+        return self._iter_chunks(chunk_size)
+
+
+class FeedHttpClient:
+    """keep-alive 커넥션 풀을 공유하는 HTTP 클라이언트"""
+
+    def __init__(self,
+                 pool_hosts: int = DEFAULT_POOL_HOSTS,
+                 pool_per_host: int = DEFAULT_POOL_PER_HOST,
+                 http2: bool = False,
+                 max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 user_agent: str = USER_AGENT):
+        """
+        Args:
+            pool_hosts: 커넥션 풀을 유지할 호스트 수
+            pool_per_host: 호스트별 최대 연결 수 (초과 요청은 연결 반환까지 대기)
+            http2: HTTP/2 사용 여부 (httpx[http2] 필요, 없으면 HTTP/1.1로 동작)
+            max_connections: HTTP/2 사용 시 전체 최대 연결 수
+            user_agent: 요청에 사용할 User-Agent
+        """
+        encodings = "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate"
+        self.default_headers = {
+            'User-Agent': user_agent,
+            'Accept-Encoding': encodings
+        }
+        self.http2 = False
+        self._httpx_client = None
+        self._session = None
+
+        if http2:
+            self._httpx_client = self._create_http2_client(max_connections, pool_hosts * pool_per_host)
+            self.http2 = self._httpx_client is not None
+
+        if self._httpx_client is None:
+            self._session = requests.Session()
+            # Connection 같은 연결 헤더는 HTTP/1.1에서만 보냄 (HTTP/2에서는 금지, RFC 9113 8.2.2)
+            self._session.headers.update({**self.default_headers, 'Connection': 'keep-alive'})
+            adapter = HTTPAdapter(
+                pool_connections=pool_hosts,
+                pool_maxsize=pool_per_host,
+                pool_block=True,
+                max_retries=0
+            )
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+
+    def _create_http2_client(self, max_connections: int, max_keepalive: int):
+        """HTTP/2 클라이언트 생성 (의존성이 없으면 None)"""
+        if httpx is None:
+            print("Warning: httpx가 설치되지 않아 HTTP/1.1을 사용합니다", file=sys.stderr)
+            return None
+
+        try:
+            return httpx.Client(
+                http2=True,
+                headers=self.default_headers,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=min(max_keepalive, max_connections)
+                )
+            )
+        except ImportError:
+            print("Warning: h2 패키지가 없어 HTTP/1.1을 사용합니다 (pip install 'httpx[http2]')", file=sys.stderr)
+            return None
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30):
+        """GET 요청 (응답은 status_code, content, headers, raise_for_status 제공)"""
+        if self._httpx_client is not None:
+            return self._httpx_client.get(url, headers=headers, timeout=timeout)
+        return self._session.get(url, headers=headers, timeout=timeout)
+
+    @contextmanager
+    def stream(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> Iterator[StreamedResponse]:
+        """본문을 미리 읽지 않는 GET 요청 (블록을 벗어나면 남은 본문은 버리고 연결 반환)"""
+        if self._httpx_client is not None:
+            with self._httpx_client.stream("GET", url, headers=headers, timeout=timeout) as response:
+                yield StreamedResponse(response, lambda size: response.iter_bytes(size))
+            return
+
+        response = self._session.get(url, headers=headers, timeout=timeout, stream=True)
+        try:
+            yield StreamedResponse(response, lambda size: response.iter_content(size))
+        finally:
+            response.close()
+
+    def close(self):
+        """풀의 모든 연결 종료"""
+        if self._httpx_client is not None:
+            self._httpx_client.close()
+        if self._session is not None:
+            self._session.close()
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> FeedHttpClient:
+    """프로세스 전체에서 공유하는 기본 클라이언트 반환"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = FeedHttpClient()
+        return _default_client
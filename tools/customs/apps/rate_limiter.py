@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter for AI News Digest
+
+LLM API의 분당 요청 수(RPM)와 분당 토큰 수(TPM) 제한을 지키기 위한 토큰 버킷 제한기.
+여러 스레드(또는 asyncio 태스크)가 하나의 제한기를 공유하며, 응답의 rate limit 헤더
+(x-ratelimit-*, retry-after)로 서버가 알려준 남은 한도와 초기화 시각에 맞춰 버킷 상태를 보정한다.
+"""
+
+import re
+import time
+import asyncio
+import threading
+from typing import Mapping, Optional
+
+
+DEFAULT_REQUESTS_PER_MINUTE = 30
+DEFAULT_TOKENS_PER_MINUTE = 6000
+CHARS_PER_TOKEN = 4   # 영문 기준 대략적인 토큰 추정치
+
+_DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+_DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+def estimate_tokens(text: str) -> int:
+    """문자 수로 토큰 수 추정"""
+    return len(text or '') // CHARS_PER_TOKEN + 1
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """'1m30.5s', '250ms', '7.66s', '12' 형식의 시간을 초로 변환"""
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+class TokenBucket:
+    """분당 용량만큼 균등하게 다시 채워지는 버킷 (스레드 안전하지 않음, 제한기 잠금 안에서 사용)"""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.level = float(per_minute)
+        self.blocked_until = 0.0
+        self._updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        """경과 시간만큼 채우기"""
+        elapsed = now - self._updated_at
+        self.level = min(self.capacity, self.level + elapsed * self.capacity / 60)
+        self._updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 시간 (0이면 즉시 가능)"""
+        self._refill(now)
+        # 용량보다 큰 요청은 버킷이 가득 찼을 때 허용
+        amount = min(amount, self.capacity)
+        wait = max(0.0, self.blocked_until - now)
+        if self.level < amount:
+            wait = max(wait, (amount - self.level) * 60 / self.capacity)
+        return wait
+
+    def take(self, amount: float):
+        """버킷에서 꺼내기 (wait_time이 0일 때 호출)"""
+        self.level -= min(amount, self.capacity)
+
+    def give_back(self, amount: float, now: float):
+        """예약했던 양 중 사용하지 않은 만큼 돌려주기 (음수면 추가 차감)"""
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+    def sync(self, remaining: Optional[float], reset_seconds: Optional[float], now: float):
+        """서버가 알려준 남은 한도로 보정 (한도를 모두 쓴 경우 초기화 시각까지 차단)"""
+        self._refill(now)
+        if remaining is not None:
+            self.level = min(self.level, remaining)
+            if remaining <= 0 and reset_seconds:
+                self.blocked_until = max(self.blocked_until, now + reset_seconds)
+
+    def set_capacity(self, per_minute: float):
+        """분당 용량 변경 (현재 수준은 새 용량을 넘지 않도록 조정)"""
+        self.capacity = float(per_minute)
+        self.level = min(self.level, self.capacity)
+
+
+class RateLimiter:
+    """요청 수/토큰 수 버킷을 함께 관리하는 스레드 안전 제한기"""
+
+    def __init__(self,
+                 requests_per_minute: float = DEFAULT_REQUESTS_PER_MINUTE,
+                 tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE):
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self.total_wait = 0.0
+
+    def _try_acquire(self, tokens: int, waited: float) -> float:
+        """예약 가능하면 예약하고 0 반환, 아니면 다시 시도할 때까지의 대기 시간 반환"""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._requests.wait_time(1, now), self._tokens.wait_time(tokens, now))
+            if wait <= 0:
+                self._requests.take(1)
+                self._tokens.take(tokens)
+                self.total_wait += waited
+                return 0.0
+            # 다른 요청의 정산/헤더 보정을 반영하도록 길게 잠들지 않음
+            return min(wait, 5.0)
+
+    def acquire(self, tokens: int) -> float:
+        """요청 1건과 예상 토큰 수를 예약 (가능할 때까지 대기, 대기한 시간 반환)"""
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens, waited)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    async def acquire_async(self, tokens: int) -> float:
+        """acquire의 asyncio 버전 (이벤트 루프를 막지 않고 대기)"""
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(tokens, waited)
+            if wait <= 0:
+                return waited
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def reconcile(self, reserved_tokens: int, used_tokens: int):
+        """실제 사용 토큰 수로 예약분 정산"""
+        with self._lock:
+            self._tokens.give_back(reserved_tokens - used_tokens, time.monotonic())
+
+    def update_from_headers(self, headers: Optional[Mapping[str, str]]):
+        """응답의 rate limit 헤더로 버킷 보정
+
+        x-ratelimit-limit-tokens는 분당 토큰 한도이므로 용량에 반영하고,
+        요청 수 한도는 서비스마다 기간(분/일)이 달라 남은 수와 초기화 시각만 사용한다.
+        """
+        if not headers:
+            return
+
+        def number(name: str) -> Optional[float]:
+            try:
+                value = headers.get(name)
+                return float(value) if value is not None else None
+            except (TypeError, ValueError):
+                return None
+
+        with self._lock:
+            now = time.monotonic()
+
+            token_limit = number('x-ratelimit-limit-tokens')
+            if token_limit:
+                self._tokens.set_capacity(token_limit)
+
+            self._requests.sync(number('x-ratelimit-remaining-requests'),
+                                parse_duration(headers.get('x-ratelimit-reset-requests')), now)
+            self._tokens.sync(number('x-ratelimit-remaining-tokens'),
+                              parse_duration(headers.get('x-ratelimit-reset-tokens')), now)
+
+    def penalize(self, retry_after: Optional[float]):
+        """429 응답 후 retry-after 동안 모든 요청 차단"""
+        if not retry_after:
+            return
+
+        with self._lock:
+            blocked_until = time.monotonic() + retry_after
+            self._requests.blocked_until = max(self._requests.blocked_until, blocked_until)
+            self._tokens.blocked_until = max(self._tokens.blocked_until, blocked_until)
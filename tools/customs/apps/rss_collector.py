@@ -7,14 +7,33 @@ RSS Collector for AI News Digest
 
 import sys
 import json
+import time
+import hashlib
+import argparse
+import threading
 import feedparser
-import requests
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Callable, Iterable, Set
 import urllib.parse
+from feed_state import FeedValidatorCache, FeedWatermarkStore, FeedHealthTracker, PROBE_TIMEOUT
+from feed_stream_parser import iter_feed_entries, FeedStreamError
+from feed_registry import load_feed_registry, FeedScheduler, DEFAULT_REGISTRY_PATH
+from http_client import FeedHttpClient, HTTP_ERRORS, get_default_client
 
 
-# RSS 피드 목록 (카테고리별로 분류)
+# 동시 수집 기본값
+DEFAULT_MAX_WORKERS = 8         # 전체 동시 요청 수
+DEFAULT_PER_HOST_LIMIT = 2      # 호스트별 동시 요청 수 (arxiv 등 동일 호스트 보호)
+DEFAULT_FEED_TIMEOUT = 30       # 피드별 요청 타임아웃(초)
+DEFAULT_DEADLINE = 90           # 전체 수집 마감 시간(초)
+
+# 스트리밍 파싱 설정
+STREAM_CHUNK_SIZE = 16 * 1024   # 응답 본문을 읽는 청크 크기(바이트)
+EARLY_STOP_AFTER = 5            # 기준 시각 이전 엔트리가 연속으로 이만큼 나오면 읽기 중단
+
+
+# 기본 RSS 피드 목록 (카테고리별로 분류, .dmap/config/rss-feeds.yaml이 없을 때 사용)
 RSS_FEEDS = {
     "연구 트렌드": [
         {
@@ -91,128 +110,569 @@ def parse_feed_date(entry) -> datetime:
         return datetime.now()
 
 
-def fetch_feed(feed_info: Dict[str, str], category: str) -> List[Dict]:
-    """단일 RSS 피드에서 뉴스 수집"""
-    try:
-        # User-Agent 헤더 추가로 차단 방지
-        headers = {
-            'User-Agent': 'AI News Digest Bot 1.0'
+def _entry_from_feedparser(entry) -> Dict:
+    """feedparser 엔트리를 스트리밍 파서와 같은 형태의 딕셔너리로 변환"""
+    # 본문 추출 (summary, content 등에서)
+    content = ''
+    if hasattr(entry, 'summary'):
+        content = entry.summary
+    elif hasattr(entry, 'content') and entry.content:
+        content = entry.content[0].value
+    elif hasattr(entry, 'description'):
+        content = entry.description
+
+    return {
+        'id': entry.get('id'),
+        'title': entry.get('title', ''),
+        'link': entry.get('link', ''),
+        'published_at': parse_feed_date(entry),
+        'content': content
+    }
+
+
+def _select_entries(entries: Iterable[Dict], feed_info: Dict[str, str], category: str,
+                    cutoff_time: datetime, seen_ids: Set[str], stop_early: bool) -> Dict[str, any]:
+    """기준 시각 이후의 새 엔트리만 뉴스 항목으로 변환
+
+    stop_early가 True이면 기준 시각보다 오래된 엔트리가 EARLY_STOP_AFTER개 연속으로
+    나올 때 읽기를 중단한다 (피드는 대부분 최신순으로 정렬되어 있음).
+    피드에 max_items가 설정되어 있으면 그 개수만큼 선택한 뒤 중단한다.
+    """
+    max_items = feed_info.get('max_items')
+    news_items = []
+    new_entries = []
+    entry_count = 0
+    stale_run = 0
+    stopped_early = False
+
+    for entry in entries:
+        entry_count += 1
+        # 날짜가 없으면 현재 시간 사용
+        published_at = entry['published_at'] or datetime.now()
+
+        # 24시간 이내 항목만 선택
+        if published_at < cutoff_time:
+            stale_run += 1
+            if stop_early and stale_run >= EARLY_STOP_AFTER:
+                stopped_early = True
+                break
+            continue
+        stale_run = 0
+
+        # 필수 필드 검증
+        title = (entry['title'] or '').strip()
+        link = (entry['link'] or '').strip()
+
+        if not title or not link:
+            continue
+
+        # 이전 실행에서 이미 내보낸 엔트리 제외
+        entry_id = entry['id'] or link
+        if entry_id in seen_ids:
+            continue
+
+        news_item = {
+            'title': title,
+            'url': link,
+            'published_at': published_at.isoformat(),
+            'content': entry['content'],
+            'category': category,
+            'source': feed_info['source']
         }
+        news_items.append(news_item)
+        new_entries.append((entry_id, published_at))
+
+        if max_items and len(news_items) >= max_items:
+            stopped_early = True
+            break
+
+    return {
+        "items": news_items,
+        "new_entries": new_entries,
+        "entry_count": entry_count,
+        "stopped_early": stopped_early
+    }
 
-        response = requests.get(feed_info['url'], headers=headers, timeout=30)
-        response.raise_for_status()
 
-        # feedparser로 파싱
-        feed = feedparser.parse(response.content)
+def _parse_streaming(client: FeedHttpClient, url: str, headers: Dict[str, str], timeout: float,
+                     select, validator_cache: Optional[FeedValidatorCache] = None) -> Optional[Dict[str, any]]:
+    """응답 본문을 청크 단위로 파싱 (304 또는 본문 동일이면 None, 형식 오류면 FeedStreamError)
 
-        if not feed.entries:
-            print(f"Warning: No entries found in feed {feed_info['name']}", file=sys.stderr)
-            return []
+    읽은 바이트를 그대로 해시하여 끝까지 읽은 본문은 저장된 해시와 비교하고,
+    중간에 읽기를 멈춘 경우에는 전체 본문 해시를 알 수 없으므로 기존 해시를 유지한다.
+    """
+    with client.stream(url, headers=headers, timeout=timeout) as response:
+        # 변경 없음: 본문 다운로드/파싱 생략
+        if response.status_code == 304:
+            return None
 
-        # 24시간 이내 항목만 필터링
-        now = datetime.now()
-        cutoff_time = now - timedelta(hours=24)
+        response.raise_for_status()
 
-        news_items = []
-        for entry in feed.entries:
-            published_at = parse_feed_date(entry)
+        hasher = hashlib.sha256()
+
+        def chunks():
+            for chunk in response.iter_chunks(STREAM_CHUNK_SIZE):
+                hasher.update(chunk)
+                yield chunk
+
+        selected = select(iter_feed_entries(chunks()), True)
+        if selected["stopped_early"]:
+            previous = validator_cache.get(url) if validator_cache is not None else {}
+            selected["content_hash"] = previous.get('content_hash')
+        else:
+            selected["content_hash"] = hasher.hexdigest()
+            # ETag/Last-Modified를 지원하지 않는 서버도 본문이 같으면 변경 없음으로 처리
+            if validator_cache is not None and validator_cache.is_unchanged(url, selected["content_hash"]):
+                return None
+        selected["headers"] = response.headers
+        return selected
+
+
+def _parse_full(client: FeedHttpClient, url: str, headers: Dict[str, str], timeout: float,
+                select, validator_cache: Optional[FeedValidatorCache]) -> Optional[Dict[str, any]]:
+    """응답 본문 전체를 feedparser로 파싱 (304 또는 본문 동일이면 None)"""
+    response = client.get(url, headers=headers, timeout=timeout)
+
+    # 변경 없음: 본문 다운로드/파싱 생략
+    if response.status_code == 304:
+        return None
+
+    response.raise_for_status()
+
+    content_hash = FeedValidatorCache.content_hash(response.content)
+    if validator_cache is not None and validator_cache.is_unchanged(url, content_hash):
+        return None
+
+    # feedparser로 파싱
+    feed = feedparser.parse(response.content)
+
+    selected = select((_entry_from_feedparser(entry) for entry in feed.entries), False)
+    selected["content_hash"] = content_hash
+    selected["headers"] = response.headers
+    return selected
+
+
+def _fetch_feed(feed_info: Dict[str, str], category: str, timeout: float = DEFAULT_FEED_TIMEOUT,
+                validator_cache: Optional[FeedValidatorCache] = None,
+                http_client: Optional[FeedHttpClient] = None,
+                watermarks: Optional[FeedWatermarkStore] = None,
+                stream_parse: bool = True) -> Dict[str, any]:
+    """단일 RSS 피드를 수집하고 상태와 함께 반환
+
+    stream_parse가 True이면 본문을 청크 단위로 증분 파싱하고 오래된 엔트리가 이어지면
+    다운로드를 중단한다. 형식이 잘못된 피드는 feedparser 전체 파싱으로 폴백한다.
+
+    워터마크/검증자는 여기서 갱신하지 않고 new_entries, validators로 반환한다.
+    호출 측이 결과를 실제로 사용할 때만 apply_feed_state로 반영해야
+    마감 후에 끝난 요청이 항목은 버려진 채 상태만 앞당기지 않는다.
+
+    status 값:
+        ok           - 새 항목 수집 (items가 비어 있을 수 있음)
+        not_modified - 304 응답 또는 본문 해시 동일로 파싱 생략, 증분 수집 시 새 엔트리 없음
+        empty        - 피드에 엔트리가 없음
+        error        - 요청 또는 파싱 실패
+    """
+    url = feed_info['url']
+    client = http_client or get_default_client()
+
+    # 24시간 이내 항목만 필터링 (증분 수집 시 워터마크 이후 항목만)
+    cutoff_time = datetime.now() - timedelta(hours=24)
+    seen_ids = set()
+    if watermarks is not None:
+        cutoff_time = watermarks.cutoff(url, cutoff_time)
+        seen_ids = watermarks.seen_ids(url)
+
+    def select(entries: Iterable[Dict], stop_early: bool) -> Dict[str, any]:
+        return _select_entries(entries, feed_info, category, cutoff_time, seen_ids, stop_early)
 
-            # 24시간 이내 항목만 선택
-            if published_at < cutoff_time:
-                continue
+    try:
+        # User-Agent 등 공통 헤더는 클라이언트 세션에 설정되어 있음
+        headers = {}
+        if validator_cache is not None:
+            headers.update(validator_cache.conditional_headers(url))
+
+        selected = None
+        parsed = False
+        if stream_parse:
+            try:
+                selected = _parse_streaming(client, url, headers, timeout, select, validator_cache)
+                parsed = True
+            except FeedStreamError as e:
+                print(f"스트리밍 파싱 실패, feedparser로 재시도: {feed_info['name']} ({e})", file=sys.stderr)
+
+        if not parsed:
+            selected = _parse_full(client, url, headers, timeout, select, validator_cache)
+
+        if selected is None:
+            return {"status": "not_modified", "items": []}
+
+        if selected["entry_count"] == 0:
+            print(f"Warning: No entries found in feed {feed_info['name']}", file=sys.stderr)
+            return {"status": "empty", "items": []}
+
+        news_items = selected["items"]
+
+        # 파싱에 성공한 응답만 검증자로 저장
+        state = {
+            "new_entries": selected["new_entries"],
+            "validators": (
+                selected["headers"].get('ETag'),
+                selected["headers"].get('Last-Modified'),
+                selected["content_hash"]
+            )
+        }
 
-            # 필수 필드 검증
-            title = entry.get('title', '').strip()
-            link = entry.get('link', '').strip()
+        if watermarks is not None and not news_items:
+            return {"status": "not_modified", "items": [], **state}
 
-            if not title or not link:
-                continue
+        return {"status": "ok", "items": news_items, **state}
 
-            # 본문 추출 (summary, content 등에서)
-            content = ''
-            if hasattr(entry, 'summary'):
-                content = entry.summary
-            elif hasattr(entry, 'content') and entry.content:
-                content = entry.content[0].value
-            elif hasattr(entry, 'description'):
-                content = entry.description
-
-            news_item = {
-                'title': title,
-                'url': link,
-                'published_at': published_at.isoformat(),
-                'content': content,
-                'category': category,
-                'source': feed_info['source']
-            }
-            news_items.append(news_item)
-
-        return news_items
-
-    except requests.RequestException as e:
+    except HTTP_ERRORS as e:
         print(f"Error fetching feed {feed_info['name']}: {e}", file=sys.stderr)
-        return []
+        return {"status": "error", "items": []}
     except Exception as e:
         print(f"Error parsing feed {feed_info['name']}: {e}", file=sys.stderr)
-        return []
+        return {"status": "error", "items": []}
+
 
+def apply_feed_state(url: str, feed_result: Dict[str, any], validator_cache: Optional[FeedValidatorCache],
+                     watermarks: Optional[FeedWatermarkStore]):
+    """_fetch_feed 결과의 워터마크/검증자 갱신을 상태 저장소에 반영"""
+    if watermarks is not None and feed_result.get("new_entries"):
+        watermarks.advance(url, feed_result["new_entries"])
+    if validator_cache is not None and feed_result.get("validators"):
+        validator_cache.update(url, *feed_result["validators"])
 
-def collect_feeds() -> Dict[str, any]:
-    """모든 RSS 피드에서 뉴스 수집"""
+
+def fetch_feed(feed_info: Dict[str, str], category: str, timeout: float = DEFAULT_FEED_TIMEOUT,
+               validator_cache: Optional[FeedValidatorCache] = None,
+               http_client: Optional[FeedHttpClient] = None,
+               watermarks: Optional[FeedWatermarkStore] = None,
+               stream_parse: bool = True) -> List[Dict]:
+    """단일 RSS 피드에서 뉴스 수집"""
+    feed_result = _fetch_feed(feed_info, category, timeout, validator_cache, http_client, watermarks, stream_parse)
+    apply_feed_state(feed_info['url'], feed_result, validator_cache, watermarks)
+    return feed_result["items"]
+
+
+def feed_host(url: str) -> str:
+    """피드 URL에서 호스트명 추출 (호스트별 동시성 제한용)"""
+    return urllib.parse.urlsplit(url).netloc.lower()
+
+
+def _collect_serial(feeds: List[tuple], fetch: Callable, timeout: float) -> Dict[int, Dict]:
+    """피드를 순차적으로 수집 (기존 방식)"""
+    results = {}
+    for index, (category, feed_info) in enumerate(feeds):
+        print(f"수집 중: {feed_info['name']}", file=sys.stderr)
+        results[index] = fetch(feed_info, category, feed_info.get('timeout') or timeout)
+    return results
+
+
+def _collect_concurrent(feeds: List[tuple], fetch: Callable, max_workers: int, per_host_limit: int,
+                        timeout: float, deadline: Optional[float]) -> Dict[int, Dict]:
+    """스레드 풀로 피드를 동시에 수집
+
+    전체 동시 요청 수는 max_workers, 동일 호스트 동시 요청 수는 per_host_limit로 제한한다.
+    호스트 제한은 제출 단계에서 적용하므로(호스트별 실행 수가 한도 미만일 때만 제출)
+    느린 호스트를 기다리는 작업이 풀 스레드를 차지하지 않는다.
+    deadline(초)이 지나면 요청 중인 피드는 timeout(elapsed는 피드 요청 시작부터),
+    시작하지 못한 피드는 deadline 상태가 되고, 마감 후에 끝난 결과는 버린다.
+    """
+    started = time.monotonic()
+    deadline_at = started + deadline if deadline else None
+    feed_started: Dict[int, float] = {}
+    waiting = list(range(len(feeds)))   # 제출 전 피드 (우선순위 순)
+    running_by_host: Dict[str, int] = {}
+    active = {}
+    results = {}
+
+    def time_left() -> Optional[float]:
+        return None if deadline_at is None else deadline_at - time.monotonic()
+
+    def worker(index: int, category: str, feed_info: Dict[str, str]) -> Dict[str, any]:
+        # 풀 대기 중 마감이 지났으면 요청하지 않음
+        request_timeout = feed_info.get('timeout') or timeout
+        remaining = time_left()
+        if remaining is not None:
+            if remaining <= 0:
+                return {"status": "deadline", "items": []}
+            request_timeout = min(request_timeout, remaining)
+
+        feed_started[index] = time.monotonic()
+        print(f"수집 중: {feed_info['name']}", file=sys.stderr)
+        return fetch(feed_info, category, request_timeout)
+
+    def submit_ready(executor: ThreadPoolExecutor):
+        for index in list(waiting):
+            host = feed_host(feeds[index][1]['url'])
+            if running_by_host.get(host, 0) >= per_host_limit:
+                continue
+            waiting.remove(index)
+            running_by_host[host] = running_by_host.get(host, 0) + 1
+            category, feed_info = feeds[index]
+            active[executor.submit(worker, index, category, feed_info)] = index
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="rss")
+    submit_ready(executor)
+
+    while active:
+        remaining = time_left()
+        if remaining is not None and remaining <= 0:
+            break
+        done, _ = wait(active, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            break
+
+        for future in done:
+            index = active.pop(future)
+            _, feed_info = feeds[index]
+            running_by_host[feed_host(feed_info['url'])] -= 1
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                print(f"Error collecting feed {feed_info['name']}: {e}", file=sys.stderr)
+                results[index] = {"status": "error", "items": []}
+
+        submit_ready(executor)
+
+    now = time.monotonic()
+    for future, index in active.items():
+        _, feed_info = feeds[index]
+        if future.cancel() or index not in feed_started:
+            print(f"마감 초과로 건너뜀: {feed_info['name']}", file=sys.stderr)
+            results[index] = {"status": "deadline", "items": []}
+        else:
+            print(f"수집 마감({deadline}s) 초과: {feed_info['name']}", file=sys.stderr)
+            results[index] = {"status": "timeout", "items": [], "elapsed": now - feed_started[index]}
+
+    for index in waiting:
+        print(f"마감 초과로 건너뜀: {feeds[index][1]['name']}", file=sys.stderr)
+        results[index] = {"status": "deadline", "items": []}
+
+    # 진행 중인 요청은 기다리지 않음 (그 결과와 상태 갱신은 사용하지 않음)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    return results
+
+
+def collect_feeds(concurrent: bool = True,
+                  max_workers: int = DEFAULT_MAX_WORKERS,
+                  per_host_limit: int = DEFAULT_PER_HOST_LIMIT,
+                  timeout: float = DEFAULT_FEED_TIMEOUT,
+                  deadline: Optional[float] = DEFAULT_DEADLINE,
+                  use_cache: bool = True,
+                  http_client: Optional[FeedHttpClient] = None,
+                  incremental: bool = True,
+                  stream_parse: bool = True,
+                  feeds_config: str = DEFAULT_REGISTRY_PATH,
+                  use_schedule: bool = True,
+                  track_health: bool = True) -> Dict[str, any]:
+    """피드 레지스트리의 RSS 피드에서 뉴스 수집
+
+    Args:
+        concurrent: 동시 수집 여부 (False면 순차 수집)
+        max_workers: 전체 동시 요청 수
+        per_host_limit: 호스트별 동시 요청 수
+        timeout: 피드별 요청 타임아웃(초, 피드 설정에 timeout이 있으면 그 값 사용)
+        deadline: 전체 수집 마감 시간(초, None이면 무제한, 동시 수집에서만 적용)
+        use_cache: 조건부 GET 검증자 캐시 사용 여부
+        http_client: 공유 HTTP 클라이언트 (None이면 프로세스 기본 클라이언트)
+        incremental: 피드별 워터마크 이후의 새 엔트리만 수집할지 여부
+        stream_parse: 스트리밍 증분 파싱 사용 여부 (False면 feedparser 전체 파싱)
+        feeds_config: 피드 레지스트리 설정 파일 (없으면 기본 RSS_FEEDS 사용)
+        use_schedule: 피드별 수집 주기에 따라 주기가 된 피드만 수집할지 여부
+        track_health: 피드별 실패 백오프/서킷 브레이커 적용 및 응답 시간 기록 여부
+
+    Returns:
+        수집 결과 딕셔너리
+    """
     collected_at = datetime.now().isoformat()
     all_items = []
     failed_feeds = []
+    not_modified_feeds = []
+    not_due_feeds = []
+    backoff_feeds = []
     statistics = {"by_category": {}}
+    validator_cache = FeedValidatorCache() if use_cache else None
+    watermarks = FeedWatermarkStore() if incremental else None
+    health = FeedHealthTracker() if track_health else None
+    http_client = http_client or get_default_client()
+
+    def fetch(feed_info: Dict[str, str], category: str, request_timeout: float) -> Dict[str, any]:
+        # 서킷이 열린 피드는 짧은 타임아웃으로 복구 여부만 확인
+        if health is not None and health.is_circuit_open(feed_info['url']):
+            print(f"프로브 요청: {feed_info['name']}", file=sys.stderr)
+            request_timeout = min(request_timeout, PROBE_TIMEOUT)
+
+        started = time.monotonic()
+        feed_result = _fetch_feed(feed_info, category, request_timeout, validator_cache, http_client,
+                                  watermarks, stream_parse)
+        feed_result["elapsed"] = time.monotonic() - started
+        return feed_result
 
     print("RSS 피드 수집 시작...", file=sys.stderr)
 
-    # 각 카테고리별로 피드 수집
-    for category, feeds in RSS_FEEDS.items():
-        category_count = 0
+    # 수집 주기가 된 피드를 우선순위 순으로 선택
+    registry = load_feed_registry(feeds_config, fallback=RSS_FEEDS)
+    scheduler = FeedScheduler() if use_schedule else None
+    if scheduler is not None:
+        due_feeds = scheduler.due_feeds(registry)
+    else:
+        due_feeds = sorted(registry, key=lambda feed: feed['priority'])
 
-        for feed_info in feeds:
-            print(f"수집 중: {feed_info['name']}", file=sys.stderr)
-            items = fetch_feed(feed_info, category)
+    # 백오프 대기 중인 피드(서킷 오픈 포함)는 이번 실행에서 제외
+    if health is not None:
+        backoff_urls = {feed['url'] for feed in due_feeds if not health.should_attempt(feed['url'])}
+        due_feeds = [feed for feed in due_feeds if feed['url'] not in backoff_urls]
+    else:
+        backoff_urls = set()
 
-            if items:
-                all_items.extend(items)
-                category_count += len(items)
-                print(f"수집 완료: {feed_info['name']} ({len(items)}개)", file=sys.stderr)
-            else:
-                failed_feeds.append(feed_info['name'])
-                print(f"수집 실패: {feed_info['name']}", file=sys.stderr)
+    feeds = [(feed_info['category'], feed_info) for feed_info in due_feeds]
+    feed_index = {feed_info['url']: index for index, (_, feed_info) in enumerate(feeds)}
 
-        statistics["by_category"][category] = category_count
+    if concurrent:
+        results = _collect_concurrent(feeds, fetch, max_workers, per_host_limit, timeout, deadline)
+    else:
+        results = _collect_serial(feeds, fetch, timeout)
+
+    for index, feed_result in results.items():
+        feed_info = feeds[index][1]
+        failed = feed_result["status"] in ("error", "timeout")
+
+        # 마감 전에 받은 결과만 results에 있으므로 여기서 워터마크/검증자 갱신
+        apply_feed_state(feed_info['url'], feed_result, validator_cache, watermarks)
+
+        # 전체 마감에 걸린 피드는 다른 피드가 시간을 쓴 탓일 수 있으므로 실패로 세지 않음
+        if health is not None and feed_result["status"] == "timeout":
+            health.record_latency(feed_info['url'], feed_result.get("elapsed", 0.0))
+        elif health is not None and feed_result["status"] != "deadline":
+            if failed:
+                health.record_failure(feed_info['url'], feed_result.get("elapsed", 0.0))
+            else:
+                health.record_success(feed_info['url'], feed_result.get("elapsed", 0.0))
+
+        # 실패하거나 시작하지 못한 피드는 다음 실행에서 다시 시도
+        if scheduler is not None and not failed and feed_result["status"] != "deadline":
+            scheduler.mark_polled(feed_info)
+
+    if scheduler is not None:
+        scheduler.save()
+    if health is not None:
+        health.save()
+    if validator_cache is not None:
+        validator_cache.save()
+    if watermarks is not None:
+        watermarks.save()
+
+    # 레지스트리 순서대로 카테고리별 결과 집계
+    for feed_info in registry:
+        category = feed_info['category']
+        statistics["by_category"].setdefault(category, 0)
+
+        if feed_info['url'] in backoff_urls:
+            backoff_feeds.append(feed_info['name'])
+            continue
+
+        if feed_info['url'] not in feed_index:
+            not_due_feeds.append(feed_info['name'])
+            continue
+
+        feed_result = results.get(feed_index[feed_info['url']], {"status": "error", "items": []})
+        items = feed_result["items"]
+
+        if items:
+            all_items.extend(items)
+            statistics["by_category"][category] += len(items)
+            print(f"수집 완료: {feed_info['name']} ({len(items)}개)", file=sys.stderr)
+        elif feed_result["status"] == "not_modified":
+            not_modified_feeds.append(feed_info['name'])
+            print(f"변경 없음: {feed_info['name']}", file=sys.stderr)
+        else:
+            failed_feeds.append(feed_info['name'])
+            print(f"수집 실패: {feed_info['name']}", file=sys.stderr)
 
     # 수집 통계 생성
     total_items = len(all_items)
 
     result = {
-        "success": total_items > 0,
+        # 새 항목이 없더라도 수집한 피드가 모두 실패한 경우만 실패로 처리
+        "success": total_items > 0 or len(failed_feeds) < len(feeds) or not feeds,
         "collected_at": collected_at,
         "total_items": total_items,
         "items": all_items,
         "statistics": {
             "by_category": statistics["by_category"],
-            "failed_feeds": failed_feeds
+            "failed_feeds": failed_feeds,
+            "not_modified_feeds": not_modified_feeds,
+            "not_due_feeds": not_due_feeds,
+            "backoff_feeds": backoff_feeds
         }
     }
 
-    print(f"수집 완료: 총 {total_items}개 뉴스, 실패 {len(failed_feeds)}개 피드", file=sys.stderr)
+    if health is not None:
+        result["statistics"]["feed_health"] = {
+            feed_info['name']: health.summary(feed_info['url'])
+            for feed_info in registry
+        }
+
+    print(f"수집 완료: 총 {total_items}개 뉴스, 실패 {len(failed_feeds)}개 피드, "
+          f"변경 없음 {len(not_modified_feeds)}개 피드, 수집 주기 전 {len(not_due_feeds)}개 피드, "
+          f"백오프 {len(backoff_feeds)}개 피드", file=sys.stderr)
 
     return result
 
 
 def main():
     """CLI 진입점"""
-    if len(sys.argv) > 1 and sys.argv[1] == "--help":
-        print("RSS Collector for AI News Digest")
-        print("Usage: rss_collector.py")
-        print("Collects news from 9 RSS feeds within the last 24 hours")
-        return
+    parser = argparse.ArgumentParser(
+        prog="rss_collector.py",
+        description="RSS Collector for AI News Digest - "
+                    "Collects news from RSS feeds within the last 24 hours"
+    )
+    parser.add_argument("--config", default=DEFAULT_REGISTRY_PATH,
+                        help=f"Feed registry file, YAML or JSON (default: {DEFAULT_REGISTRY_PATH})")
+    parser.add_argument("--ignore-schedule", action="store_true",
+                        help="Poll every registered feed regardless of its poll interval")
+    parser.add_argument("--no-health", action="store_true",
+                        help="Disable per-feed backoff, circuit breaker and latency tracking")
+    parser.add_argument("--serial", action="store_true",
+                        help="Fetch feeds one by one instead of concurrently")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Max concurrent requests (default: {DEFAULT_MAX_WORKERS})")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST_LIMIT,
+                        help=f"Max concurrent requests per host (default: {DEFAULT_PER_HOST_LIMIT})")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_FEED_TIMEOUT,
+                        help=f"Per-feed request timeout in seconds (default: {DEFAULT_FEED_TIMEOUT})")
+    parser.add_argument("--deadline", type=float, default=DEFAULT_DEADLINE,
+                        help=f"Overall collection deadline in seconds, 0 to disable (default: {DEFAULT_DEADLINE})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore stored ETag/Last-Modified validators and refetch every feed")
+    parser.add_argument("--full", action="store_true",
+                        help="Ignore per-feed watermarks and emit every entry from the last 24 hours")
+    parser.add_argument("--no-stream", action="store_true",
+                        help="Parse whole documents with feedparser instead of streaming")
+    parser.add_argument("--http2", action="store_true",
+                        help="Use HTTP/2 when httpx[http2] is installed")
+    args = parser.parse_args()
 
     try:
-        result = collect_feeds()
+        http_client = FeedHttpClient(pool_per_host=args.per_host, http2=args.http2)
+        result = collect_feeds(
+            concurrent=not args.serial,
+            max_workers=args.workers,
+            per_host_limit=args.per_host,
+            timeout=args.timeout,
+            deadline=args.deadline or None,
+            use_cache=not args.no_cache,
+            http_client=http_client,
+            incremental=not args.full,
+            stream_parse=not args.no_stream,
+            feeds_config=args.config,
+            use_schedule=not args.ignore_schedule,
+            track_health=not args.no_health
+        )
+        http_client.close()
         print(json.dumps(result, indent=2, ensure_ascii=False))
 
         if not result["success"]:
@@ -226,7 +686,8 @@ def main():
             "collected_at": datetime.now().isoformat(),
             "total_items": 0,
             "items": [],
-            "statistics": {"by_category": {}, "failed_feeds": []}
+            "statistics": {"by_category": {}, "failed_feeds": [], "not_modified_feeds": [], "not_due_feeds": [],
+                           "backoff_feeds": []}
         }
         print(json.dumps(error_result, indent=2, ensure_ascii=False))
         print(f"Fatal error: {e}", file=sys.stderr)
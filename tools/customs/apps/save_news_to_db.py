@@ -9,59 +9,71 @@ import sys
 import json
 from datetime import datetime
 from db_client import DatabaseClient
+from dedup_index import title_band_keys, unique_by_url
 
 
 def save_news_items(items: list, db_client: DatabaseClient) -> dict:
-    """뉴스 항목들을 데이터베이스에 저장"""
-    saved_count = 0
-    failed_count = 0
+    """뉴스 항목들을 데이터베이스에 저장
+
+    항목마다 INSERT/커밋하지 않고 execute_values 다중 행 upsert 한 트랜잭션으로 저장한다.
+    """
+    insert_query = """
+    INSERT INTO news_items (
+        title, url, summary, summary_ko, category, source,
+        published_at, collected_at, title_lsh_bands, processed
+    ) VALUES %s
+    ON CONFLICT (url) DO UPDATE SET
+        summary = EXCLUDED.summary,
+        summary_ko = EXCLUDED.summary_ko,
+        collected_at = EXCLUDED.collected_at,
+        title_lsh_bands = EXCLUDED.title_lsh_bands,
+        processed = true
+    RETURNING id
+    """
+
+    collected_at = datetime.now()
+    rows = []
+    saved_items = []
     errors = []
 
-    for item in items:
-        # news_items 테이블에 저장
-        insert_query = """
-        INSERT INTO news_items (
-            title, url, summary, summary_ko, category, source,
-            published_at, collected_at, processed
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, true
-        ) ON CONFLICT (url) DO UPDATE SET
-            summary = EXCLUDED.summary,
-            summary_ko = EXCLUDED.summary_ko,
-            collected_at = EXCLUDED.collected_at,
-            processed = true
-        RETURNING id
-        """
-
-        # content를 summary 필드에 저장
-        params = (
-            item['title'],
-            item['url'],
-            item.get('content', '')[:500],  # 원본 내용 일부를 summary로 저장
-            item.get('summary_ko', ''),
-            item.get('category', 'Unknown'),
-            item.get('source', 'Unknown'),
-            item.get('published_at', datetime.now().isoformat()),
-            datetime.now()
-        )
-
-        result = db_client.execute_query(insert_query, params, fetch="one")
-
-        if result['success']:
-            saved_count += 1
-            print(f"✓ Saved: {item['title'][:50]}...", file=sys.stderr)
-        else:
-            failed_count += 1
-            errors.append({
-                'title': item['title'],
-                'error': result.get('error', 'Unknown error')
-            })
-            print(f"✗ Failed: {item['title'][:50]}... - {result.get('error')}", file=sys.stderr)
+    # 정규화 URL이 같은 항목은 처음 항목으로 저장 (DatabaseClient.insert_news_items와 같은 기준)
+    unique_items, duplicate_count = unique_by_url(items)
+    for item in unique_items:
+        try:
+            # content를 summary 필드에 저장
+            rows.append((
+                item['title'],
+                item['url'],
+                item.get('content', '')[:500],  # 원본 내용 일부를 summary로 저장
+                item.get('summary_ko', ''),
+                item.get('category', 'Unknown'),
+                item.get('source', 'Unknown'),
+                item.get('published_at', collected_at.isoformat()),
+                collected_at,
+                title_band_keys(item['title']),
+                True
+            ))
+            saved_items.append(item)
+        except Exception as e:
+            errors.append({'title': item.get('title', 'Unknown'), 'error': str(e)})
+            print(f"✗ Failed: {item.get('title', 'Unknown')[:50]}... - {e}", file=sys.stderr)
+
+    result = db_client.execute_values_query(insert_query, rows)
+
+    if result['success']:
+        # 중복 URL 항목은 처음 항목의 행으로 저장된 것으로 셈
+        saved_count = len(saved_items) + duplicate_count
+        print(f"✓ Saved: {saved_count}개 항목 ({len(rows)}개 URL)", file=sys.stderr)
+    else:
+        saved_count = 0
+        for item in saved_items:
+            errors.append({'title': item['title'], 'error': result.get('error', 'Unknown error')})
+        print(f"✗ Failed: {len(saved_items)}개 항목 - {result.get('error')}", file=sys.stderr)
 
     return {
         'success': saved_count > 0,
         'saved_count': saved_count,
-        'failed_count': failed_count,
+        'failed_count': len(items) - saved_count,
         'errors': errors
     }
 
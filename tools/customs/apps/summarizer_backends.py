@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Summarizer Backends for AI News Digest
+
+groq_summarizer가 사용하는 요약 API 백엔드 모음.
+모든 백엔드는 OpenAI 호환 chat.completions 인터페이스(create, with_raw_response.create,
+stream=True)를 가진 동기/비동기 클라이언트를 제공하므로 요약 로직은 백엔드와 무관하게 동작한다.
+
+- groq: Groq API (기본값)
+- openai: base_url로 지정한 OpenAI 호환 엔드포인트 (openai 패키지 필요)
+- local: 네트워크 없이 본문 앞 문장을 뽑아 요약하는 결정적 로컬 백엔드.
+  응답 지연과 분당 요청/토큰 한도(429, rate limit 헤더)를 흉내 내므로
+  API 키와 사용량 없이 전체 파이프라인의 처리량을 반복 측정할 수 있다.
+"""
+
+import re
+import json
+import time
+import html
+import asyncio
+import threading
+import weakref
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Tuple
+
+from rate_limiter import TokenBucket, estimate_tokens
+
+# SDK는 해당 백엔드를 쓸 때만 필요 (local 백엔드는 groq/httpx 없이 동작)
+try:
+    import groq
+except ImportError:
+    groq = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import openai
+except ImportError:
+    openai = None
+
+
+SUMMARIZER_BACKENDS = ("groq", "openai", "local")
+DEFAULT_LOCAL_LATENCY = 0.5   # local 백엔드의 요청당 지연 (초)
+
+_CONNECTION_ERRORS = tuple(
+    getattr(module, name)
+    for module, name in ((groq, 'APIConnectionError'), (httpx, 'TransportError'), (openai, 'APIConnectionError'))
+    if module is not None
+)
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """429 응답 오류인지 확인 (백엔드 SDK 종류와 무관)"""
+    return getattr(error, 'status_code', None) == 429
+
+
+def is_authentication_error(error: Exception) -> bool:
+    """401 응답 오류인지 확인"""
+    return getattr(error, 'status_code', None) == 401
+
+
+def is_connection_error(error: Exception) -> bool:
+    """연결/타임아웃 오류인지 확인"""
+    return isinstance(error, _CONNECTION_ERRORS)
+
+
+def error_headers(error: Exception):
+    """HTTP 응답이 있는 오류의 응답 헤더 (없으면 None)"""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'headers', None)
+
+
+class SummarizerBackend:
+    """요약 API 백엔드 (프로세스 안에서 공유할 동기/비동기 클라이언트 제공)"""
+
+    name = "base"
+
+    def __init__(self):
+        self._client = None
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def client(self):
+        """공유 동기 클라이언트"""
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def async_client(self):
+        """현재 이벤트 루프에서 공유할 비동기 클라이언트
+
+        httpx 비동기 클라이언트는 처음 사용한 이벤트 루프에 묶이므로 루프별로 하나씩 만든다.
+        asyncio.run을 여러 번 호출해도 닫힌 루프의 연결을 재사용하지 않는다.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._create_async_client()
+
+        if loop not in self._async_clients:
+            self._async_clients[loop] = self._create_async_client()
+        return self._async_clients[loop]
+
+    def _create_client(self):
+        raise NotImplementedError
+
+    def _create_async_client(self):
+        raise NotImplementedError
+
+
+class GroqBackend(SummarizerBackend):
+    """Groq API 백엔드 (재시도는 요약 로직에서 제한기와 함께 처리)"""
+
+    name = "groq"
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        if groq is None:
+            raise ValueError("groq backend requires the groq package (pip install groq)")
+        super().__init__()
+        self.api_key = api_key
+        self.base_url = base_url
+
+    def _create_client(self):
+        return groq.Groq(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+
+    def _create_async_client(self):
+        return groq.AsyncGroq(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+
+
+class OpenAICompatibleBackend(SummarizerBackend):
+    """OpenAI 호환 엔드포인트 백엔드 (vLLM, Ollama, OpenRouter 등)"""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        if openai is None:
+            raise ValueError("openai backend requires the openai package (pip install openai)")
+        super().__init__()
+        self.api_key = api_key or "unused"
+        self.base_url = base_url
+
+    def _create_client(self):
+        return openai.OpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+
+    def _create_async_client(self):
+        return openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url, max_retries=0)
+
+
+class LocalAPIError(Exception):
+    """로컬 백엔드의 HTTP 오류 (SDK 오류와 같은 status_code, response 속성 제공)"""
+
+    def __init__(self, message: str, status_code: int, headers: Dict[str, str]):
+        super().__init__(message)
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers)
+
+
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+_SINGLE_ARTICLE = re.compile(r'news article:\n\n(.*?)\n\nResponse format:', re.S)
+
+
+def extractive_summary(text: str, max_sentences: int = 3, max_chars: int = 400) -> str:
+    """HTML을 제거한 본문의 앞 문장들로 만든 요약 (결정적)"""
+    text = html.unescape(re.sub(r'<[^>]+>', ' ', text or ''))
+    text = re.sub(r'\s+', ' ', text).strip()
+    if not text:
+        return "본문이 없는 기사입니다."
+
+    summary = ''
+    for sentence in _SENTENCE_END.split(text)[:max_sentences]:
+        if summary and len(summary) + len(sentence) + 1 > max_chars:
+            break
+        summary = f"{summary} {sentence}".strip()
+    return summary[:max_chars]
+
+
+class LocalBackend(SummarizerBackend):
+    """네트워크 없이 동작하는 결정적 추출 요약 백엔드 (지연/한도 시뮬레이션)
+
+    Args:
+        latency: 요청마다 더하는 고정 지연 (초)
+        token_latency: 출력 토큰당 지연 (초, 스트리밍 시 조각마다 나누어 적용)
+        requests_per_minute: 흉내 낼 서버의 분당 요청 한도 (None이면 제한 없음)
+        tokens_per_minute: 흉내 낼 서버의 분당 토큰 한도 (None이면 제한 없음)
+    """
+
+    name = "local"
+
+    def __init__(self, latency: float = DEFAULT_LOCAL_LATENCY, token_latency: float = 0.0,
+                 requests_per_minute: Optional[float] = None,
+                 tokens_per_minute: Optional[float] = None):
+        super().__init__()
+        self.latency = latency
+        self.token_latency = token_latency
+        self._lock = threading.Lock()
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.request_count = 0
+
+    def _create_client(self):
+        completions = _LocalCompletions(self, is_async=False)
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    def _create_async_client(self):
+        completions = _LocalCompletions(self, is_async=True)
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    def admit(self, prompt_tokens: int, completion_tokens: int) -> Dict[str, str]:
+        """흉내 낸 서버 한도 확인 (초과 시 429 오류, 통과하면 rate limit 헤더 반환)
+
+        실제 엔드포인트처럼 응답의 usage와 같은 프롬프트 + 생성 토큰을 분당 토큰 한도에 반영한다.
+        """
+        with self._lock:
+            self.request_count += 1
+            now = time.monotonic()
+            tokens = prompt_tokens + completion_tokens
+            waits = [bucket.wait_time(amount, now)
+                     for bucket, amount in ((self._requests, 1), (self._tokens, tokens)) if bucket]
+            retry_after = max(waits, default=0.0)
+            if retry_after > 0:
+                raise LocalAPIError("Rate limit reached (local backend)", 429,
+                                    {"retry-after": f"{retry_after:.3f}"})
+
+            headers = {}
+            if self._requests:
+                self._requests.take(1)
+                headers["x-ratelimit-remaining-requests"] = str(int(self._requests.level))
+            if self._tokens:
+                self._tokens.take(tokens)
+                headers["x-ratelimit-limit-tokens"] = str(int(self._tokens.capacity))
+                headers["x-ratelimit-remaining-tokens"] = str(int(self._tokens.level))
+            return headers
+
+    def respond(self, kwargs: Dict) -> Tuple[str, int]:
+        """요청 형식(단건, JSON 배치, JSON Lines 스트리밍)에 맞는 응답 본문과 프롬프트 토큰 수"""
+        messages = kwargs.get('messages', [])
+        user_prompt = messages[-1]['content'] if messages else ''
+        prompt_tokens = sum(estimate_tokens(message['content']) for message in messages)
+
+        articles = []
+        for line in user_prompt.splitlines():
+            if line.startswith('{'):
+                try:
+                    article = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(article, dict) and 'id' in article:
+                    articles.append(article)
+
+        if articles:
+            summaries = [
+                {"id": article['id'], "summary_ko": extractive_summary(article.get('content', ''))}
+                for article in articles
+            ]
+            if kwargs.get('stream'):
+                content = "\n".join(json.dumps(summary, ensure_ascii=False) for summary in summaries)
+            else:
+                content = json.dumps({"summaries": summaries}, ensure_ascii=False)
+        else:
+            match = _SINGLE_ARTICLE.search(user_prompt)
+            content = extractive_summary(match.group(1) if match else user_prompt)
+
+        return content, prompt_tokens
+
+
+class _LocalRawResponse:
+    """with_raw_response.create 결과 (헤더와 parse 제공)"""
+
+    def __init__(self, result, headers: Dict[str, str], is_async: bool):
+        self.headers = headers
+        self._result = result
+        self._is_async = is_async
+
+    def parse(self):
+        if not self._is_async:
+            return self._result
+
+        async def parsed():
+            return self._result
+        return parsed()
+
+
+class _LocalCompletions:
+    """chat.completions 흉내 (동기/비동기)"""
+
+    def __init__(self, backend: LocalBackend, is_async: bool):
+        self.backend = backend
+        self.is_async = is_async
+        self.with_raw_response = SimpleNamespace(create=self._create_raw)
+
+    def create(self, **kwargs):
+        if self.is_async:
+            return self._create_async(**kwargs)
+        return self._create_sync(**kwargs)[0]
+
+    def _create_raw(self, **kwargs):
+        if self.is_async:
+            async def raw():
+                result, headers = await self._create_async(with_headers=True, **kwargs)
+                return _LocalRawResponse(result, headers, is_async=True)
+            return raw()
+
+        result, headers = self._create_sync(**kwargs)
+        return _LocalRawResponse(result, headers, is_async=False)
+
+    def _prepare(self, kwargs: Dict):
+        """응답 생성과 한도 확인 (응답 본문, 사용량, 헤더, 지연 시간)"""
+        content, prompt_tokens = self.backend.respond(kwargs)
+        completion_tokens = estimate_tokens(content)
+        headers = self.backend.admit(prompt_tokens, completion_tokens)
+        usage = SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens,
+                                total_tokens=prompt_tokens + completion_tokens)
+        return content, usage, headers, completion_tokens * self.backend.token_latency
+
+    def _create_sync(self, **kwargs):
+        content, usage, headers, generation_time = self._prepare(kwargs)
+        time.sleep(self.backend.latency)
+        if kwargs.get('stream'):
+            return _LocalStream(content, usage, generation_time), headers
+
+        time.sleep(generation_time)
+        return _completion(content, usage, kwargs.get('model')), headers
+
+    async def _create_async(self, with_headers: bool = False, **kwargs):
+        content, usage, headers, generation_time = self._prepare(kwargs)
+        await asyncio.sleep(self.backend.latency)
+        if kwargs.get('stream'):
+            result = _LocalAsyncStream(content, usage, generation_time)
+        else:
+            await asyncio.sleep(generation_time)
+            result = _completion(content, usage, kwargs.get('model'))
+        return (result, headers) if with_headers else result
+
+
+def _completion(content: str, usage, model: Optional[str]):
+    """chat.completion 응답 객체"""
+    message = SimpleNamespace(role="assistant", content=content)
+    return SimpleNamespace(model=model, usage=usage,
+                           choices=[SimpleNamespace(index=0, message=message, finish_reason="stop")])
+
+
+_STREAM_PIECE = 16   # 스트리밍 조각 크기 (문자)
+
+
+def _stream_chunks(content: str, usage) -> List:
+    """스트리밍 청크 목록 (마지막 청크에 사용량)"""
+    chunks = [
+        SimpleNamespace(usage=None, choices=[SimpleNamespace(index=0, delta=SimpleNamespace(content=content[i:i + _STREAM_PIECE]))])
+        for i in range(0, len(content), _STREAM_PIECE)
+    ]
+    chunks.append(SimpleNamespace(usage=usage, choices=[]))
+    return chunks
+
+
+class _LocalStream:
+    """동기 스트리밍 응답 (생성 시간을 조각마다 나누어 지연)"""
+
+    def __init__(self, content: str, usage, generation_time: float):
+        self._chunks = _stream_chunks(content, usage)
+        self._delay = generation_time / len(self._chunks)
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            time.sleep(self._delay)
+            yield chunk
+
+    def close(self):
+        pass
+
+
+class _LocalAsyncStream:
+    """비동기 스트리밍 응답"""
+
+    def __init__(self, content: str, usage, generation_time: float):
+        self._chunks = _stream_chunks(content, usage)
+        self._delay = generation_time / len(self._chunks)
+
+    async def __aiter__(self):
+        for chunk in self._chunks:
+            await asyncio.sleep(self._delay)
+            yield chunk
+
+    async def close(self):
+        pass
+
+
+def create_backend(config: Dict) -> SummarizerBackend:
+    """설정(load_groq_config 결과)의 backend 값에 맞는 백엔드 생성"""
+    name = config.get('backend', 'groq')
+    if name not in SUMMARIZER_BACKENDS:
+        raise ValueError(f"Unknown summarizer backend: {name} (choose from {', '.join(SUMMARIZER_BACKENDS)})")
+
+    if name == "openai":
+        return OpenAICompatibleBackend(config.get('api_key', ''), config.get('base_url'))
+    if name == "local":
+        return LocalBackend(
+            latency=config.get('local_latency', DEFAULT_LOCAL_LATENCY),
+            token_latency=config.get('local_token_latency', 0.0),
+            requests_per_minute=config.get('local_requests_per_minute'),
+            tokens_per_minute=config.get('local_tokens_per_minute')
+        )
+    return GroqBackend(config['api_key'], config.get('base_url'))
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Summary Cache for AI News Digest
+
+요약 결과를 SQLite 파일에 저장하여 재실행이나 재수집된 기사에 대해
+API를 다시 호출하지 않도록 하는 내용 주소 기반 캐시.
+키는 (모델, 프롬프트 버전, 정규화된 제목+본문)의 해시이므로 모델이나 프롬프트가
+바뀌면 자동으로 새로 요약한다. 오래된 항목(TTL)과 개수 초과분(최근 사용 순)은 정리된다.
+"""
+
+import os
+import re
+import sys
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from feed_state import DEFAULT_CACHE_DIR
+
+
+# 요약 프롬프트나 응답 파싱 방식을 바꾸면 올려서 기존 캐시를 무효화
+PROMPT_VERSION = "3"
+
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, "summary-cache.sqlite3")
+DEFAULT_TTL_DAYS = 30
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def normalize_content(title: str, content: str) -> str:
+    """캐시 키용 제목+본문 정규화 (공백 차이 무시)"""
+    return re.sub(r'\s+', ' ', f"{title or ''}\n{content or ''}").strip()
+
+
+def summary_cache_key(model: str, title: str, content: str, prompt_version: str = PROMPT_VERSION) -> str:
+    """모델 + 프롬프트 버전 + 정규화된 내용의 해시"""
+    payload = "\x00".join([model, prompt_version, normalize_content(title, content)])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class SummaryCache:
+    """SQLite 기반 요약 캐시 (스레드 안전)"""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH,
+                 ttl_days: int = DEFAULT_TTL_DAYS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = timedelta(days=ttl_days)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = self._connect()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """캐시 파일 열기 (실패하면 캐시 없이 동작)"""
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS summaries (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    summary_ko TEXT NOT NULL,
+                    tokens_used INTEGER DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    last_used_at TEXT NOT NULL
+                )
+            """)
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_summaries_last_used_at ON summaries (last_used_at)")
+            connection.commit()
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: 요약 캐시를 열 수 없어 캐시 없이 진행합니다 ({self.path}): {e}", file=sys.stderr)
+            return None
+
+    def get(self, key: str) -> Optional[Dict]:
+        """유효한 캐시 항목 조회 (summary_ko, tokens_used, created_at)"""
+        if self._connection is None:
+            return None
+
+        now = datetime.now()
+        with self._lock:
+            try:
+                row = self._connection.execute(
+                    "SELECT summary_ko, tokens_used, created_at FROM summaries WHERE key = ? AND created_at >= ?",
+                    (key, (now - self.ttl).isoformat())
+                ).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+
+                self._connection.execute(
+                    "UPDATE summaries SET last_used_at = ? WHERE key = ?", (now.isoformat(), key)
+                )
+                self._connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: 요약 캐시 조회 실패: {e}", file=sys.stderr)
+                return None
+
+        self.hits += 1
+        return {"summary_ko": row[0], "tokens_used": row[1], "created_at": row[2]}
+
+    def put(self, key: str, model: str, summary_ko: str, tokens_used: int = 0):
+        """요약 결과 저장 (같은 키는 교체)"""
+        if self._connection is None:
+            return
+
+        now = datetime.now().isoformat()
+        with self._lock:
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO summaries (key, model, summary_ko, tokens_used, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, model, summary_ko, tokens_used, now, now)
+                )
+                self._connection.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: 요약 캐시 저장 실패: {e}", file=sys.stderr)
+
+    def evict(self) -> int:
+        """만료 항목과 최대 개수를 넘는 오래 사용하지 않은 항목 삭제 (삭제 수 반환)"""
+        if self._connection is None:
+            return 0
+
+        cutoff = (datetime.now() - self.ttl).isoformat()
+        with self._lock:
+            try:
+                removed = self._connection.execute(
+                    "DELETE FROM summaries WHERE created_at < ?", (cutoff,)
+                ).rowcount
+                removed += self._connection.execute("""
+                    DELETE FROM summaries WHERE key IN (
+                        SELECT key FROM summaries ORDER BY last_used_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_entries,)).rowcount
+                self._connection.commit()
+                return removed
+            except sqlite3.Error as e:
+                print(f"Warning: 요약 캐시 정리 실패: {e}", file=sys.stderr)
+                return 0
+
+    def close(self):
+        """캐시 파일 닫기"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def __enter__(self):
+        """컨텍스트 매니저 진입"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """컨텍스트 매니저 종료"""
+        self.close()
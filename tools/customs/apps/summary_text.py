@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Summary Text Post-processing for AI News Digest
+
+모델 응답에서 뉴스레터에 넣을 한국어 요약만 남기는 후처리 도구.
+한 번의 줄 순회로 Markdown 흔적(코드 블록, 제목, 목록 기호, 강조, 링크), 기사 헤더
+("Article 2:", "기사 2:"), 라벨("Korean Summary:", "한국어 요약:")과 영어 요약 줄을 제거한다.
+한글 판별은 문자 단위 Python 루프 대신 미리 컴파일한 정규식을 사용한다.
+"""
+
+import re
+
+
+_HANGUL = re.compile('[\u3131-\u3163\uac00-\ud7af]')
+
+_SKIP_LINE = re.compile(r'```.*|[-*_=]{3,}')
+# 줄 앞의 제목/인용/목록 기호, 기사 헤더, 라벨을 한 번에 제거 (라벨만 있는 줄은 빈 줄이 됨)
+_LINE_PREFIX = re.compile(
+    r'^(?:#{1,6}\s+|>\s*|(?:[-*+•]|\d+[.)])\s+|(?:article|기사)\s*#?\d+\s*[:.)\-]?\s*|'
+    r'(?:(?:korean|english)\s+(?:summary|translation)|korean|한국어\s*(?:요약|번역)?|영문\s*요약|'
+    r'summary|translation|요약|번역)\s*(?:[:：]\s*|$))+',
+    re.IGNORECASE
+)
+# 링크는 텍스트만 남기고 강조/코드 표시는 제거
+_INLINE_MARKUP = re.compile(r'!?\[([^\]]*)\]\([^)]*\)|\*\*|__|`|(?<![\w*])\*(?=\S)|(?<=\S)\*(?![\w*])')
+
+FALLBACK_SUMMARY = "요약을 생성할 수 없습니다."
+
+
+def contains_hangul(text: str) -> bool:
+    """한글(자모 또는 음절)이 포함되어 있는지 확인"""
+    return _HANGUL.search(text) is not None
+
+
+def clean_line(line: str) -> str:
+    """줄 하나에서 Markdown 흔적, 기사 헤더, 라벨 제거 (건너뛸 줄이면 빈 문자열)"""
+    line = line.strip()
+    if not line or (line[0] in '`-*_=' and _SKIP_LINE.fullmatch(line)):
+        return ''
+
+    prefix = _LINE_PREFIX.match(line)
+    if prefix and prefix.end():
+        line = line[prefix.end():]
+    if '*' in line or '_' in line or '`' in line or '[' in line:
+        line = _INLINE_MARKUP.sub(r'\1', line)
+    return line.strip()
+
+
+def extract_korean_summary(response: str) -> str:
+    """응답에서 한국어 요약 부분 추출
+
+    한글이 포함된 줄만 정리하여 이어 붙이고, 한글 줄이 없으면 정리된 마지막 줄을 사용한다.
+    영어 줄은 한글 판별만 하고 정리하지 않으므로 응답 길이에 대해 한 번만 순회한다.
+    """
+    if not response:
+        return FALLBACK_SUMMARY
+
+    lines = response.split('\n')
+    korean_lines = []
+    for raw_line in lines:
+        if _HANGUL.search(raw_line):
+            line = clean_line(raw_line)
+            if line:
+                korean_lines.append(line)
+
+    if korean_lines:
+        return ' '.join(korean_lines)
+
+    for raw_line in reversed(lines):
+        line = clean_line(raw_line)
+        if line:
+            return line
+    return FALLBACK_SUMMARY
+
+
+def clean_summary_text(summary: str) -> str:
+    """이미 분리된 요약(JSON 배치 응답의 summary_ko 등) 정리
+
+    한글 줄이 있으면 영어 줄은 버리고, 없으면 정리한 줄을 모두 유지한다.
+    """
+    lines = [line for line in (clean_line(raw_line) for raw_line in (summary or '').split('\n')) if line]
+    korean_lines = [line for line in lines if _HANGUL.search(line)]
+    return ' '.join(korean_lines or lines)
@@ -0,0 +1,39 @@
+"""batch_planner 토큰 예산 배치 테스트"""
+
+from batch_planner import (
+    plan_batches, item_input_tokens, batch_output_tokens, expected_output_tokens,
+    OUTPUT_OVERHEAD_TOKENS, OUTPUT_TOKENS_PER_ITEM
+)
+
+
+def _item(words: int) -> dict:
+    return {"title": "Title", "content": " ".join(["token"] * words)}
+
+
+def test_batches_respect_input_budget_and_keep_order():
+    items = [_item(200) for _ in range(12)]
+    budget = 1000
+    batches = plan_batches(items, input_budget=budget, output_budget=100000, max_items=None)
+
+    assert [item for batch in batches for item in batch] == items
+    for batch in batches:
+        assert len(batch) == 1 or sum(item_input_tokens(item) for item in batch) <= budget
+
+
+def test_batches_respect_output_budget_and_max_items():
+    items = [_item(5) for _ in range(30)]
+    output_budget = OUTPUT_TOKENS_PER_ITEM * 3 + OUTPUT_OVERHEAD_TOKENS
+
+    assert max(len(batch) for batch in plan_batches(items, output_budget=output_budget, max_items=None)) == 3
+    assert max(len(batch) for batch in plan_batches(items, output_budget=100000, max_items=7)) == 7
+
+
+def test_oversized_item_gets_its_own_batch():
+    items = [_item(5), _item(5000), _item(5)]
+    batches = plan_batches(items, input_budget=200, output_budget=100000, max_items=None)
+
+    assert any(batch == [items[1]] for batch in batches)
+
+
+def test_expected_output_is_below_max_tokens():
+    assert expected_output_tokens(5) < batch_output_tokens(5)
@@ -0,0 +1,67 @@
+"""content_preparer 본문 정리/압축 테스트"""
+
+from batch_planner import count_tokens
+from content_preparer import clean_content, compress_content
+
+
+def test_clean_content_keeps_article_sentences_that_start_like_boilerplate():
+    content = (
+        "<p>The results were published in Nature.</p>"
+        "<p>Comments from the CEO suggest layoffs are coming soon.</p>"
+        "<p>Related work shows transformers scale well.</p>"
+        "<p>Subscribers get early access to the model.</p>"
+    )
+
+    assert clean_content(content).split('\n') == [
+        "The results were published in Nature.",
+        "Comments from the CEO suggest layoffs are coming soon.",
+        "Related work shows transformers scale well.",
+        "Subscribers get early access to the model.",
+    ]
+
+
+def test_clean_content_drops_feed_boilerplate():
+    content = (
+        "arXiv:2401.01234v1 Announce Type: new Abstract: We study scaling laws.<br>"
+        "Read more<br>"
+        "Continue reading: https://example.com/post<br>"
+        "Comments<br>"
+        "Originally published at https://example.com/post.<br>"
+        "The post Scaling laws appeared first on Example Blog."
+    )
+
+    assert clean_content(content) == "We study scaling laws."
+
+
+def test_compress_content_fits_budget_and_keeps_order():
+    sentences = [f"Model {i} improves benchmark accuracy by {i} points on reasoning tasks." for i in range(40)]
+    sentences.insert(5, "OpenAI released a new reasoning model for developers today.")
+    text = ' '.join(sentences)
+
+    compressed = compress_content(text, max_tokens=80, title="OpenAI reasoning model")
+
+    assert count_tokens(compressed) <= 80
+    kept = [sentence for sentence in sentences if sentence in compressed]
+    assert kept == sorted(kept, key=sentences.index)
+    assert "OpenAI released a new reasoning model for developers today." in kept
+
+
+def test_compress_content_skips_redundant_sentences():
+    repeated = "The new model improves coding accuracy on hard benchmarks."
+    text = ' '.join([repeated] * 30 + ["Pricing starts at ten dollars per month for individual developers."])
+
+    compressed = compress_content(text, max_tokens=40)
+
+    assert compressed.count(repeated) == 1
+    assert compress_content("Short text.", max_tokens=40) == "Short text."
+
+
+def test_compress_content_truncates_best_sentence_when_none_fits():
+    text = (
+        "Weather stayed pleasant across town during yesterday morning. "
+        "OpenAI shipped its reasoning model, and the reasoning model beats earlier OpenAI models on math."
+    )
+
+    compressed = compress_content(text, max_tokens=5, title="OpenAI reasoning model")
+
+    assert compressed.startswith("OpenAI shipped")
@@ -0,0 +1,156 @@
+"""db_client 커넥션 풀과 실행 계획 점검 테스트 (실제 DB 없이 psycopg2.connect 대체)"""
+
+import os
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import psycopg2
+import pytest
+from psycopg2 import extensions
+from psycopg2.extras import RealDictCursor
+
+from db_client import ConnectionPool, DatabaseClient, check_query_plan
+
+
+TEST_DSN = os.environ.get("AI_NEWS_TEST_DSN")   # 실행 계획 점검용 PostgreSQL (없으면 해당 테스트 건너뜀)
+INIT_DB_SQL = Path(__file__).resolve().parents[3] / "init-db.sql"
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.info = SimpleNamespace(transaction_status=extensions.TRANSACTION_STATUS_IDLE)
+
+    def close(self):
+        self.closed = 1
+
+    def rollback(self):
+        pass
+
+
+def _pool(monkeypatch, connections: list, **options) -> ConnectionPool:
+    def connect(*args, **kwargs):
+        connections.append(_FakeConnection())
+        return connections[-1]
+
+    monkeypatch.setattr(psycopg2, "connect", connect)
+    config = {"host": "localhost", "port": 5432, "database": "test", "user": "test"}
+    return ConnectionPool(config, min_connections=1, max_connections=2, health_check_interval=60, **options)
+
+
+def test_lifetime_counts_from_connection_creation_not_first_checkout(monkeypatch):
+    connections = []
+    pool = _pool(monkeypatch, connections, max_lifetime=0.2)
+
+    # 미리 열어 둔 연결은 처음 빌리기 전부터 수명이 흐른다
+    time.sleep(0.3)
+    connection = pool.getconn()
+
+    assert connections[0].closed
+    assert connection is connections[1]
+    pool.putconn(connection)
+    assert not connection.closed
+
+
+def test_expired_connection_is_closed_on_return(monkeypatch):
+    connections = []
+    pool = _pool(monkeypatch, connections, max_lifetime=0.2)
+
+    connection = pool.getconn()
+    time.sleep(0.3)
+    pool.putconn(connection)
+
+    assert connection.closed
+    assert pool.getconn() is connections[-1] is not connection
+
+
+def _index_scan(relation: str, index: str, **conditions) -> dict:
+    return {"Node Type": "Index Scan", "Relation Name": relation, "Index Name": index, **conditions}
+
+
+def test_range_predicates_pass_plan_check():
+    plan = {"Node Type": "Nested Loop", "Plans": [
+        {"Node Type": "Bitmap Heap Scan", "Relation Name": "news_items",
+         "Recheck Cond": "((collected_at >= CURRENT_DATE) AND (collected_at < (CURRENT_DATE + '1 day'::interval)))",
+         "Plans": [{"Node Type": "Bitmap Index Scan", "Index Name": "idx_news_items_collected_at",
+                    "Index Cond": "((collected_at >= CURRENT_DATE) AND (collected_at < (CURRENT_DATE + '1 day'::interval)))"}]},
+        _index_scan("newsletters", "idx_newsletters_sent",
+                    **{"Index Cond": "((sent_at >= CURRENT_DATE) AND (sent_at < (CURRENT_DATE + '1 day'::interval)))"}),
+    ]}
+
+    assert check_query_plan(plan, ("collected_at", "sent_at"))["success"]
+
+
+def test_date_function_predicate_fails_plan_check_without_seq_scan():
+    # enable_seqscan = off에서 DATE(collected_at) 조건은 기본 키 인덱스 전체 스캔 + Filter가 된다
+    plan = {"Node Type": "Nested Loop", "Plans": [
+        _index_scan("news_items", "news_items_pkey", Filter="(date(collected_at) = CURRENT_DATE)"),
+        _index_scan("newsletters", "newsletters_pkey", **{
+            "Index Cond": "(id = ni.newsletter_id)", "Filter": "(date(sent_at) = CURRENT_DATE)"}),
+    ]}
+
+    result = check_query_plan(plan, ("collected_at", "sent_at"))
+
+    assert not result["success"]
+    assert result["seq_scans"] == []
+    assert result["missing_index_conds"] == ["collected_at", "sent_at"]
+    assert result["filtered_columns"] == ["collected_at", "sent_at"]
+
+
+def test_plan_check_requires_expected_index():
+    plan = _index_scan("news_items", "news_items_pkey", Filter="(title_lsh_bands IS NULL)")
+
+    result = check_query_plan(plan, indexes=("idx_news_items_missing_title_lsh",))
+
+    assert result["missing_indexes"] == ["idx_news_items_missing_title_lsh"]
+    assert not result["success"]
+
+
+SEED_SQL = """
+INSERT INTO news_items (title, url, source, published_at, collected_at, title_lsh_bands)
+SELECT 'News ' || i, 'https://example.com/news/' || i, 'test',
+       NOW() - (i % 60) * INTERVAL '1 day', NOW() - (i % 60) * INTERVAL '1 day',
+       CASE WHEN i % 500 = 0 THEN NULL ELSE ARRAY[i::BIGINT, (i % 97)::BIGINT] END
+FROM generate_series(1, 20000) AS i;
+
+INSERT INTO newsletters (subject, html_content, sent_at)
+SELECT 'Issue ' || i, '<p></p>', CASE WHEN i % 10 = 0 THEN NULL ELSE NOW() - i * INTERVAL '1 day' END
+FROM generate_series(0, 400) AS i;
+
+INSERT INTO newsletter_items (newsletter_id, news_item_id)
+SELECT nl.id, n.id
+FROM newsletters nl
+JOIN news_items n ON n.id % 401 = nl.id % 401;
+
+ANALYZE;
+"""
+
+
+@pytest.mark.skipif(not TEST_DSN, reason="AI_NEWS_TEST_DSN이 설정되지 않음")
+def test_read_queries_use_indexes_on_seeded_database(tmp_path):
+    schema = f"explain_test_{uuid.uuid4().hex[:8]}"
+    admin = psycopg2.connect(TEST_DSN)
+    admin.autocommit = True
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA {schema}")
+            cursor.execute(f"SET search_path TO {schema}")
+            init_sql = INIT_DB_SQL.read_text(encoding="utf-8")
+            cursor.execute("\n".join(line for line in init_sql.splitlines() if not line.startswith("GRANT")))
+            cursor.execute(SEED_SQL)
+
+        client = DatabaseClient(config_path=str(tmp_path / "db.yaml"), pooled=False)
+        client.connection = psycopg2.connect(TEST_DSN, cursor_factory=RealDictCursor,
+                                             options=f"-c search_path={schema}")
+        try:
+            result = client.explain_read_queries()
+        finally:
+            client.disconnect()
+
+        assert result["success"], result
+    finally:
+        with admin.cursor() as cursor:
+            cursor.execute(f"DROP SCHEMA {schema} CASCADE")
+        admin.close()
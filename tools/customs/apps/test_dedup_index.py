@@ -0,0 +1,48 @@
+"""dedup_index URL 정규화/본문 지문/LSH 후보 테스트"""
+
+from dedup_index import MinHashLSH, canonicalize_url, normalize_title, unique_by_url
+
+
+def test_canonicalize_url_ignores_scheme_www_tracking_and_fragment():
+    assert canonicalize_url("http://www.example.com/post/?utm_source=x&fbclid=1#top") == \
+        canonicalize_url("https://example.com/post")
+
+
+def test_canonicalize_url_keeps_content_parameters():
+    assert canonicalize_url("https://github.com/org/repo/blob/x?ref=main") != \
+        canonicalize_url("https://github.com/org/repo/blob/x?ref=dev")
+    assert canonicalize_url("https://example.com/search?source=arxiv") != \
+        canonicalize_url("https://example.com/search?source=pubmed")
+
+
+def test_canonicalize_url_returns_raw_url_for_malformed_port():
+    assert canonicalize_url(" http://host:abc/path ") == "http://host:abc/path"
+
+
+def test_lsh_candidates_include_near_duplicate_titles():
+    titles = [
+        normalize_title("OpenAI releases GPT-5 with improved reasoning and tool use"),
+        normalize_title("OpenAI releases new GPT-5 with improved reasoning and tool-use"),
+        normalize_title("Nvidia announces next generation GPU for AI training"),
+        normalize_title("Nvidia announce next-generation GPUs for AI training"),
+        normalize_title("Researchers propose efficient attention for long context transformers"),
+    ]
+    pairs = MinHashLSH().candidate_pairs(titles)
+
+    assert (0, 1) in pairs
+    assert (2, 3) in pairs
+    assert (0, 4) not in pairs
+
+
+def test_unique_by_url_keeps_first_item_per_canonical_url():
+    items = [
+        {"url": "https://example.com/a?utm_source=rss", "title": "first"},
+        {"url": "http://www.example.com/a/", "title": "second"},
+        {"title": "no url"},
+        {"url": "https://example.com/b", "title": "third"},
+    ]
+
+    unique_items, skipped = unique_by_url(items)
+
+    assert [item["title"] for item in unique_items] == ["first", "no url", "third"]
+    assert skipped == 1
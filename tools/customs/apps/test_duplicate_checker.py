@@ -0,0 +1,68 @@
+"""duplicate_checker 유사도 백엔드/그룹화 테스트"""
+
+import random
+
+import pytest
+
+import duplicate_checker
+from duplicate_checker import _matrix_matches, _pairwise_matches, find_duplicate_clusters
+from dedup_index import normalize_title
+
+
+TITLES = [
+    "OpenAI releases GPT-5 with improved reasoning and tool use",
+    "OpenAI releases new GPT-5 with improved reasoning and tool-use",
+    "Nvidia announces next generation GPU for AI training",
+    "Nvidia announce next-generation GPUs for AI training",
+    "Researchers propose efficient attention for long context transformers",
+    "!!!",
+    "",
+    "???",
+]
+
+requires_matrix = pytest.mark.skipif(
+    duplicate_checker.rapid_process is None or not duplicate_checker.FUZZYWUZZY_USES_LEVENSHTEIN,
+    reason="rapidfuzz and python-Levenshtein are required for score parity"
+)
+
+
+def _perturbed_titles(count: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    titles = []
+    for _ in range(count):
+        title = list(rng.choice(TITLES[:5]))
+        for _ in range(rng.randint(0, 4)):
+            title[rng.randrange(len(title))] = rng.choice("abcdefgh ")
+        titles.append(normalize_title("".join(title)))
+    return titles
+
+
+def test_empty_titles_are_never_duplicates():
+    normalized = [normalize_title(title) for title in TITLES]
+    for row in _pairwise_matches(normalized, 85, "pairwise"):
+        assert all(normalized[j] for j, _ in row)
+    assert _pairwise_matches(normalized, 85, "pairwise")[5] == []
+
+
+@requires_matrix
+def test_matrix_backend_masks_empty_titles():
+    normalized = [normalize_title(title) for title in TITLES]
+    matches = _matrix_matches(normalized, 85)
+    assert matches[5] == [] and matches[6] == []
+    assert all(normalized[j] for row in matches for j, _ in row)
+
+
+@requires_matrix
+def test_matrix_backend_matches_pairwise_decisions():
+    titles = _perturbed_titles(120) + ["", ""]
+    for threshold in (70, 85, 90):
+        assert _matrix_matches(titles, threshold) == _pairwise_matches(titles, threshold, "pairwise")
+
+
+def test_union_find_clusters_transitive_matches():
+    items = [{"title": title} for title in ["a b c d e f g h", "a b c d e f g x", "a b c d e f y x"]]
+    greedy = find_duplicate_clusters(items, 88, "pairwise", "fuzzywuzzy", "greedy")
+    union_find = find_duplicate_clusters(items, 88, "pairwise", "fuzzywuzzy", "union-find")
+
+    assert max(len(cluster["indices"]) for cluster in union_find) == 3
+    assert max(len(cluster["indices"]) for cluster in greedy) < 3
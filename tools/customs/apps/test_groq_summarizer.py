@@ -0,0 +1,153 @@
+"""groq_summarizer 배치/스트리밍 응답 파싱과 스트리밍 요약 테스트"""
+
+import asyncio
+import json
+import time
+import warnings
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from groq_summarizer import (
+    SummaryLineParser, parse_batch_summaries, stream_news_items, stream_news_items_async,
+    summarize_and_translate_batch
+)
+from summarizer_backends import LocalBackend
+
+
+def test_parse_batch_summaries_keeps_first_valid_summary_per_requested_id():
+    response = json.dumps({"summaries": [
+        {"id": "1", "summary_ko": "**첫 번째** 요약입니다."},
+        {"id": "1", "summary_ko": "중복 요약"},
+        {"id": "2", "summary_ko": "   "},
+        {"id": "9", "summary_ko": "요청하지 않은 기사"},
+        {"id": 3, "summary_ko": "숫자 id도 문자열로 비교합니다."},
+        {"id": "4", "summary_ko": None},
+        "not an object",
+    ]}, ensure_ascii=False)
+
+    assert parse_batch_summaries(response, ["1", "2", "3", "4"]) == {
+        "1": "첫 번째 요약입니다.",
+        "3": "숫자 id도 문자열로 비교합니다.",
+    }
+
+
+def test_parse_batch_summaries_accepts_bare_list_and_rejects_invalid_json():
+    assert parse_batch_summaries('[{"id": "a", "summary_ko": "배열 응답"}]', ["a"]) == {"a": "배열 응답"}
+    assert parse_batch_summaries("Article 1: 요약", ["a"]) == {}
+    assert parse_batch_summaries('{"summaries": "요약"}', ["a"]) == {}
+    assert parse_batch_summaries(None, ["a"]) == {}
+
+
+class _FlakyCompletions:
+    """처음 failures번은 연결 오류를 내고 이후에는 로컬 백엔드로 응답하는 chat.completions"""
+
+    def __init__(self, failures: int):
+        self.failures = failures
+        self.batch_sizes = []
+        self._local = LocalBackend(latency=0).client().chat.completions
+
+    def create(self, **kwargs):
+        self.batch_sizes.append(kwargs['messages'][-1]['content'].count('{"id"'))
+        if len(self.batch_sizes) <= self.failures:
+            raise httpx.ConnectError("connection reset")
+        return self._local.create(**kwargs)
+
+
+def test_batch_transport_failure_retries_the_chunk_in_halves():
+    completions = _FlakyCompletions(failures=1)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    result = summarize_and_translate_batch(_news_items(5), "unused", max_retries=1, client=client)
+
+    assert completions.batch_sizes == [5, 3, 2]
+    assert result["success"] and result["missing_count"] == 0
+    assert all(result["summaries"])
+
+
+def test_batch_returns_failure_when_no_request_succeeds():
+    completions = _FlakyCompletions(failures=100)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    result = summarize_and_translate_batch(_news_items(2), "unused", max_retries=1, client=client)
+
+    assert not result["success"]
+    assert completions.batch_sizes == [2, 1, 1, 1, 1]
+
+
+def test_batch_chunk_size_is_deprecated():
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_FlakyCompletions(failures=0)))
+
+    with pytest.warns(DeprecationWarning):
+        summarize_and_translate_batch(_news_items(1), "unused", chunk_size=5, client=client)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        summarize_and_translate_batch(_news_items(1), "unused", client=client)
+
+
+def test_summary_line_parser_emits_each_article_when_its_line_completes():
+    parser = SummaryLineParser(["1", "2", "3"])
+    stream = (
+        '```json\n[\n{"id": "1", "summary_ko": "첫 번째 기사 요약."},\n'
+        '{"id": "9", "summary_ko": "요청하지 않은 기사."},\n'
+        '{"id": "1", "summary_ko": "중복 요약."},\n'
+        '{"id": "2", "summary_ko": "두 번째 기사 요약."}\n'
+        '{"id": "3", "summary_ko": "세 번째 기사 요약."}]\n```'
+    )
+
+    emitted, first_emitted_at = [], None
+    for start in range(0, len(stream), 7):
+        emitted.extend(parser.feed(stream[start:start + 7]))
+        if emitted and first_emitted_at is None:
+            first_emitted_at = start
+    emitted.extend(parser.finish())
+
+    # 첫 번째 기사는 두 번째 기사 줄을 받기 전에 이미 나와 있어야 한다
+    assert first_emitted_at < stream.index('"id": "2"')
+
+    assert emitted == [("1", "첫 번째 기사 요약."), ("2", "두 번째 기사 요약."), ("3", "세 번째 기사 요약.")]
+
+
+def test_summary_line_parser_handles_last_line_without_newline_and_broken_json():
+    parser = SummaryLineParser(["a", "b"])
+
+    assert parser.feed('{"id": "a", "summary_ko": "잘린 줄\n') == []
+    assert parser.feed('{"id": "b", "summary_ko": "마지막 줄 요약."}') == []
+    assert parser.finish() == [("b", "마지막 줄 요약.")]
+    assert parser.seen == {"b"}
+
+
+def _news_items(count: int) -> list:
+    return [{"title": f"Model release {i}", "url": f"https://example.com/{i}", "source": "test",
+             "content": f"Lab {i} released a new language model. It improves coding benchmarks."}
+            for i in range(count)]
+
+
+def test_closing_stream_early_cancels_queued_batches(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    backend = LocalBackend(latency=0.05, token_latency=0.01)
+    stream = stream_news_items(_news_items(6), batch_size=2, max_concurrency=1, use_cache=False, backend=backend)
+
+    next(stream)
+    started = time.monotonic()
+    stream.close()
+
+    assert time.monotonic() - started < 0.05
+    time.sleep(0.2)
+    assert backend.request_count == 1
+
+
+def test_closing_async_stream_early_cancels_queued_batches(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    backend = LocalBackend(latency=0.05, token_latency=0.01)
+
+    async def first_item():
+        stream = stream_news_items_async(_news_items(6), batch_size=2, max_concurrency=1, use_cache=False,
+                                         backend=backend)
+        await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0.2)
+
+    asyncio.run(first_item())
+    assert backend.request_count == 1
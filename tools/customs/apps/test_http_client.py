@@ -0,0 +1,24 @@
+"""http_client 기본 헤더 테스트"""
+
+import http_client
+from http_client import FeedHttpClient
+
+
+def test_keep_alive_header_is_sent_only_over_http1():
+    client = FeedHttpClient(http2=False)
+
+    assert client._session.headers["Connection"] == "keep-alive"
+
+
+def test_http2_client_sends_no_connection_header(monkeypatch):
+    created = {}
+
+    def fake_client(**kwargs):
+        created.update(kwargs)
+        return object()
+
+    monkeypatch.setattr(http_client.httpx, "Client", fake_client)
+    client = FeedHttpClient(http2=True)
+
+    assert client.http2 and created["http2"]
+    assert "connection" not in {name.lower() for name in created["headers"]}
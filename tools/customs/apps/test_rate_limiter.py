@@ -0,0 +1,61 @@
+"""rate_limiter 토큰 버킷/헤더 보정 테스트"""
+
+from rate_limiter import RateLimiter, TokenBucket, parse_duration
+
+
+def test_token_bucket_refills_evenly_per_minute():
+    bucket = TokenBucket(600)
+    now = bucket._updated_at
+
+    assert bucket.wait_time(600, now) == 0
+    bucket.take(600)
+    assert bucket.wait_time(60, now) == 6.0
+    assert bucket.wait_time(60, now + 6.0) == 0
+
+
+def test_token_bucket_allows_oversized_request_when_full():
+    bucket = TokenBucket(100)
+    now = bucket._updated_at
+
+    assert bucket.wait_time(500, now) == 0
+    bucket.take(500)
+    assert bucket.level == 0
+
+
+def test_give_back_returns_unused_and_charges_overrun():
+    bucket = TokenBucket(1000)
+    now = bucket._updated_at
+    bucket.take(400)
+
+    bucket.give_back(100, now)
+    assert bucket.level == 700
+    bucket.give_back(-300, now)
+    assert bucket.level == 400
+
+
+def test_limiter_reconciles_reservation_with_usage():
+    limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=6000)
+    limiter.acquire(2000)
+    limiter.reconcile(2000, 500)
+
+    assert 5400 <= limiter._tokens.level <= 6000
+
+
+def test_headers_shrink_capacity_and_block_until_reset():
+    limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=6000)
+    limiter.update_from_headers({
+        'x-ratelimit-limit-tokens': '3000',
+        'x-ratelimit-remaining-tokens': '0',
+        'x-ratelimit-reset-tokens': '1.5s'
+    })
+
+    assert limiter._tokens.capacity == 3000
+    assert limiter._tokens.level == 0
+    assert limiter._tokens.blocked_until > limiter._tokens._updated_at
+
+
+def test_parse_duration_formats():
+    assert parse_duration("1m30.5s") == 90.5
+    assert parse_duration("250ms") == 0.25
+    assert parse_duration("12") == 12.0
+    assert parse_duration("") is None
@@ -0,0 +1,166 @@
+"""rss_collector 동시 수집/상태 반영 테스트"""
+
+import time
+from datetime import datetime
+
+import rss_collector
+from feed_state import FeedHealthTracker, FeedValidatorCache
+from rss_collector import _collect_concurrent, _parse_streaming, apply_feed_state, collect_feeds
+
+
+def _feed(name: str, host: str) -> tuple:
+    return ("테스트", {"name": name, "url": f"https://{host}/{name}.xml", "source": name})
+
+
+def _fetch_with_delays(delays: dict, log: list):
+    def fetch(feed_info, category, request_timeout):
+        log.append(feed_info['name'])
+        time.sleep(delays.get(feed_info['name'], 0))
+        return {"status": "ok", "items": [feed_info['name']],
+                "new_entries": [(feed_info['name'], datetime.now())]}
+    return fetch
+
+
+def test_slow_host_does_not_hold_workers_for_other_hosts():
+    feeds = [_feed("a1", "slow.example"), _feed("a2", "slow.example")]
+    feeds += [_feed(f"b{i}", "fast.example") for i in range(4)]
+    log = []
+    fetch = _fetch_with_delays({"a1": 1.0, "a2": 1.0}, log)
+
+    started = time.monotonic()
+    results = _collect_concurrent(feeds, fetch, max_workers=2, per_host_limit=1, timeout=5, deadline=0.6)
+
+    assert time.monotonic() - started < 0.9
+    for index in range(2, 6):
+        assert results[index]["status"] == "ok"
+    assert results[0]["status"] == "timeout"
+    # 같은 호스트의 두 번째 피드는 시작하지 못함
+    assert results[1]["status"] == "deadline"
+    assert "a2" not in log
+
+
+def test_timed_out_feed_reports_elapsed_from_its_own_start_and_no_state():
+    feeds = [_feed("first", "one.example"), _feed("late", "one.example")]
+    fetch = _fetch_with_delays({"first": 0.3, "late": 2.0}, [])
+
+    results = _collect_concurrent(feeds, fetch, max_workers=2, per_host_limit=1, timeout=5, deadline=0.6)
+
+    assert results[0]["status"] == "ok"
+    assert results[1]["status"] == "timeout"
+    assert results[1]["elapsed"] < 0.45
+    assert "new_entries" not in results[1]
+
+
+def test_apply_feed_state_updates_stores_only_from_given_result():
+    class Store:
+        def __init__(self):
+            self.calls = []
+
+        def advance(self, url, entries):
+            self.calls.append(("advance", url, list(entries)))
+
+        def update(self, url, *validators):
+            self.calls.append(("update", url, validators))
+
+    watermarks, validators = Store(), Store()
+    apply_feed_state("u", {"status": "timeout", "items": []}, validators, watermarks)
+    assert watermarks.calls == [] and validators.calls == []
+
+    entries = [("id", datetime(2024, 1, 1))]
+    apply_feed_state("u", {"status": "ok", "items": [], "new_entries": entries,
+                           "validators": ("etag", None, "hash")}, validators, watermarks)
+    assert watermarks.calls == [("advance", "u", entries)]
+    assert validators.calls == [("update", "u", ("etag", None, "hash"))]
+
+
+class _StreamResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_chunks(self, chunk_size):
+        for start in range(0, len(self.body), 64):
+            yield self.body[start:start + 64]
+
+
+class _StreamClient:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, url, headers=None, timeout=None):
+        return _StreamResponse(self.body)
+
+
+def _rss(dates: list) -> bytes:
+    items = "".join(
+        f"<item><title>t{i}</title><link>https://example.com/{i}</link>"
+        f"<pubDate>{date}</pubDate></item>"
+        for i, date in enumerate(dates)
+    )
+    return f"<rss><channel>{items}</channel></rss>".encode()
+
+
+def _select(stop_after=None):
+    def select(entries, stop_early):
+        selected = []
+        for entry in entries:
+            selected.append(entry)
+            if stop_after and len(selected) >= stop_after:
+                break
+        return {"items": selected, "new_entries": [], "entry_count": len(selected),
+                "stopped_early": bool(stop_after) and len(selected) >= stop_after}
+    return select
+
+
+def test_streaming_parse_skips_unchanged_body(tmp_path):
+    body = _rss(["Mon, 01 Jan 2024 00:00:00 GMT"])
+    cache = FeedValidatorCache(str(tmp_path / "validators.json"))
+    cache.update("u", None, None, FeedValidatorCache.content_hash(body))
+
+    assert _parse_streaming(_StreamClient(body), "u", {}, 5, _select(), cache) is None
+
+    changed = _parse_streaming(_StreamClient(body + b" "), "u", {}, 5, _select(), cache)
+    assert changed["content_hash"] == FeedValidatorCache.content_hash(body + b" ")
+
+
+def test_streaming_parse_keeps_previous_hash_when_stopping_early(tmp_path):
+    body = _rss(["Mon, 01 Jan 2024 00:00:00 GMT"] * 20)
+    cache = FeedValidatorCache(str(tmp_path / "validators.json"))
+    cache.update("u", None, None, "previous")
+
+    selected = _parse_streaming(_StreamClient(body), "u", {}, 5, _select(stop_after=1), cache)
+    assert selected["content_hash"] == "previous"
+
+
+def test_feed_cut_off_by_global_deadline_is_not_recorded_as_failure(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "feeds.yaml").write_text(
+        "feeds:\n"
+        "  - {name: fast, url: 'https://fast.example/rss', category: AI}\n"
+        "  - {name: slow, url: 'https://slow.example/rss', category: AI}\n"
+    )
+
+    def fetch_feed(feed_info, *args):
+        time.sleep(1.0 if feed_info['name'] == "slow" else 0)
+        return {"status": "ok", "items": []}
+
+    monkeypatch.setattr(rss_collector, "_fetch_feed", fetch_feed)
+    collect_feeds(deadline=0.3, use_cache=False, incremental=False, use_schedule=False,
+                  feeds_config=str(tmp_path / "feeds.yaml"))
+
+    health = FeedHealthTracker()
+    slow = health.get("https://slow.example/rss")
+    assert slow.get("consecutive_failures", 0) == 0
+    assert health.should_attempt("https://slow.example/rss")
+    assert slow["total_requests"] == 1 and slow["last_latency_ms"] >= 250
@@ -0,0 +1,37 @@
+"""save_news_to_db 저장 테스트 (DB 없이 execute_values_query 대체)"""
+
+from db_client import DatabaseClient
+from save_news_to_db import save_news_items
+
+
+ITEMS = [
+    {"title": "Model launch", "url": "https://example.com/a?utm_source=rss", "category": "AI", "source": "rss",
+     "published_at": "2024-01-01T00:00:00", "content": "first", "summary_ko": "첫 번째"},
+    {"title": "Model launch (updated)", "url": "http://www.example.com/a/", "category": "AI", "source": "rss",
+     "published_at": "2024-01-01T00:00:00", "content": "second", "summary_ko": "두 번째"},
+    {"title": "Other news", "url": "https://example.com/b", "category": "AI", "source": "rss",
+     "published_at": "2024-01-01T00:00:00", "content": "third", "summary_ko": "세 번째"},
+]
+
+
+class _RecordingClient(DatabaseClient):
+    def __init__(self, tmp_path):
+        super().__init__(config_path=str(tmp_path / "db.yaml"), pooled=False)
+        self.rows = None
+
+    def execute_values_query(self, query, rows, **kwargs):
+        self.rows = rows
+        return {"success": True, "result": [{"id": index} for index, _ in enumerate(rows)]}
+
+
+def test_both_entry_points_store_the_same_first_item_per_canonical_url(tmp_path):
+    saver, inserter = _RecordingClient(tmp_path), _RecordingClient(tmp_path)
+
+    saved = save_news_items(ITEMS, saver)
+    inserted = inserter.insert_news_items(ITEMS)
+
+    assert [row[1] for row in saver.rows] == [row[3] for row in inserter.rows] == \
+        ["https://example.com/a?utm_source=rss", "https://example.com/b"]
+    assert [row[3] for row in saver.rows] == [row[6] for row in inserter.rows] == ["첫 번째", "세 번째"]
+    assert saved["saved_count"] == 3 and saved["failed_count"] == 0
+    assert inserted["skipped_duplicates"] == 1
@@ -0,0 +1,120 @@
+"""summarizer_backends 클라이언트 공유와 local 백엔드 테스트"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from summarizer_backends import GroqBackend, LocalBackend, error_headers, extractive_summary
+from batch_planner import DEFAULT_MAX_BATCH_ITEMS
+from groq_summarizer import get_async_groq_client, process_news_items, summarize_and_translate
+
+
+async def _clients(get_client):
+    return get_client(), get_client()
+
+
+def test_async_client_is_shared_within_a_loop_and_recreated_per_loop():
+    backend = GroqBackend("test-key")
+    first, again = asyncio.run(_clients(backend.async_client))
+    second, _ = asyncio.run(_clients(backend.async_client))
+
+    assert first is again
+    assert first is not second
+
+
+def test_module_async_groq_client_is_per_loop():
+    first, again = asyncio.run(_clients(lambda: get_async_groq_client("test-key")))
+    second, _ = asyncio.run(_clients(lambda: get_async_groq_client("test-key")))
+
+    assert first is again
+    assert first is not second
+
+
+
+def test_local_backend_runs_without_sdk_packages(tmp_path):
+    script = textwrap.dedent("""
+        import sys
+
+        class BlockSdk:
+            def find_spec(self, name, path=None, target=None):
+                if name.split('.')[0] in ('groq', 'httpx', 'openai'):
+                    raise ImportError(name)
+
+        sys.meta_path.insert(0, BlockSdk())
+        from groq_summarizer import process_news_items
+
+        items = [{"title": "Model", "url": "https://example.com/1", "source": "test",
+                  "content": "Lab released a model. It scores well."}]
+        result = process_news_items(items, use_cache=False, backend="local")
+        assert result["success"] and result["items"][0]["summary_ko"], result
+    """)
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env,
+                               capture_output=True, text=True, timeout=60)
+
+    assert completed.returncode == 0, completed.stderr
+
+
+def _news_items(count: int) -> list:
+    return [{"title": f"Model release {i}", "url": f"https://example.com/{i}", "source": "test",
+             "content": f"<p>Lab {i} released a new model.</p> It improves coding benchmarks. Pricing is unchanged."}
+            for i in range(count)]
+
+
+def test_local_backend_is_deterministic_and_simulates_latency(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".dmap" / "secrets").mkdir(parents=True)
+    (tmp_path / ".dmap" / "secrets" / "groq.yaml").write_text("backend: local\nlocal_latency: 0.1\n")
+
+    started = time.monotonic()
+    first = process_news_items(_news_items(7), use_cache=False, backend="local")
+    elapsed = time.monotonic() - started
+    second = process_news_items(_news_items(7), use_cache=False, backend="local")
+
+    assert first["success"] and second["success"]
+    assert first["items"] == second["items"]
+    assert [item["summary_ko"] for item in first["items"]] == [
+        extractive_summary(item["content"]) for item in _news_items(7)
+    ]
+    assert elapsed >= 0.1
+    assert first["processing_stats"]["batch_size"] == DEFAULT_MAX_BATCH_ITEMS
+    assert process_news_items(_news_items(2), batch_size=3, use_cache=False,
+                              backend="local")["processing_stats"]["batch_size"] == 3
+
+
+def test_local_single_summary_has_real_output_shape():
+    content = _news_items(1)[0]["content"]
+
+    result = summarize_and_translate(content, "unused", client=LocalBackend(latency=0).client())
+
+    assert result["success"]
+    assert result["summary_ko"] == extractive_summary(content)
+
+
+def test_local_backend_returns_429_with_retry_after_and_charges_usage():
+    backend = LocalBackend(latency=0, requests_per_minute=60, tokens_per_minute=1000)
+
+    headers = backend.admit(100, 50)
+    assert headers["x-ratelimit-remaining-tokens"] == "850"
+
+    backend._requests.level = 0
+    with pytest.raises(Exception) as raised:
+        backend.admit(1, 1)
+    assert raised.value.status_code == 429
+    assert 0.9 < float(error_headers(raised.value)["retry-after"]) <= 1.0
+
+
+def test_local_429_is_retried_after_retry_after(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    backend = LocalBackend(latency=0, requests_per_minute=60)
+    backend._requests.level = 0
+
+    result = process_news_items(_news_items(1), use_cache=False, backend=backend)
+
+    assert result["success"] and result["items"][0]["summary_ko"]
+    assert backend.request_count == 2
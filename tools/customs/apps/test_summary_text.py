@@ -0,0 +1,27 @@
+"""summary_text 한국어 요약 후처리 테스트"""
+
+from summary_text import FALLBACK_SUMMARY, clean_summary_text, extract_korean_summary
+
+
+def test_extract_keeps_only_cleaned_korean_lines():
+    response = """**English Summary:** OpenAI released a model.
+
+### 한국어 요약:
+- **OpenAI**가 새로운 [모델](https://openai.com)을 공개했습니다.
+- 성능이 크게 향상되었습니다."""
+
+    assert extract_korean_summary(response) == "OpenAI가 새로운 모델을 공개했습니다. 성능이 크게 향상되었습니다."
+
+
+def test_extract_strips_article_headers_and_labels():
+    assert extract_korean_summary("Article 2: 기사 2: 한국어 요약: 요약 본문입니다.") == "요약 본문입니다."
+
+
+def test_extract_falls_back_to_last_cleaned_line_without_korean():
+    assert extract_korean_summary("First line\n**Last line**\n```") == "Last line"
+    assert extract_korean_summary("") == FALLBACK_SUMMARY
+
+
+def test_clean_summary_text_drops_english_lines_only_when_korean_exists():
+    assert clean_summary_text("English line\n한국어 줄") == "한국어 줄"
+    assert clean_summary_text("Only *English* here") == "Only English here"